@@ -4,14 +4,31 @@ import pandas as pd
 import sqlite3
 import os
 import subprocess
+import sys
 import time
+import uuid
 import json
 import threading
+import zlib
 from datetime import datetime
 import signal
 import requests
 from dotenv import load_dotenv
 from config import Config
+from job_queue import JobQueue, QueueFullError
+from prompt_builder import PromptBuilder
+from model_manager import ModelManager
+from ollama_pool import OllamaPool, NoHealthyNodeError
+from circuit_breaker import CircuitBreaker, AdaptiveTimeout
+from code_validator import DashboardCodeValidator
+from dashboard_classifier import DashboardClassifier
+from ingest_manifest import bump_generation
+from code_store import CodeStore, code_key
+from dashboard_registry import register_dashboard, unregister_dashboard
+from streamlit_pool import StreamlitPool
+from port_allocator import PortAllocator
+from dashboard_reaper import DashboardReaper
+from readiness import BootFailedError, BootHistogram, wait_until_ready
 
 load_dotenv()
 
@@ -22,11 +39,22 @@ Config.ensure_directories()
 
 # TODO: maybe use a proper database later
 running_dashboards = {}
+ollama_pool = OllamaPool(Config.OLLAMA_URLS, eject_after=Config.OLLAMA_EJECT_AFTER,
+                         eject_seconds=Config.OLLAMA_EJECT_SECONDS)
+# one warm-up manager per ollama process
+model_managers = {node.url: ModelManager(base_url=node.url) for node in ollama_pool.nodes}
+llm_breaker = CircuitBreaker(failure_threshold=Config.LLM_BREAKER_FAILURES,
+                             reset_timeout=Config.LLM_BREAKER_RESET_SECONDS)
+llm_timeout = AdaptiveTimeout(initial=Config.OLLAMA_TIMEOUT, minimum=Config.LLM_TIMEOUT_MIN,
+                              maximum=Config.OLLAMA_TIMEOUT, factor=Config.LLM_TIMEOUT_P95_FACTOR)
 
 class DashboardGenerator:
     def __init__(self):
-        self.ollama_url = f"{Config.OLLAMA_URL}/api/generate"
         self.excel_dir = os.path.join(Config.PROJECT_ROOT, 'excel-data')
+        self.prompt_builder = PromptBuilder()
+        self.validator = DashboardCodeValidator()
+        self.classifier = DashboardClassifier()
+        self.code_store = CodeStore(Config.DASHBOARD_DIR)
         self.ensure_excel_directory()  # make sure folder exists
 
     def sanitize_table_name(self, name):
@@ -75,6 +103,7 @@ class DashboardGenerator:
             conn = sqlite3.connect(db_path)
             table_name = "evaluation_data"
             processed_df.to_sql(table_name, conn, if_exists='replace', index=False)
+            generation = bump_generation(conn, table_name, len(processed_df), latest_file)
             cursor = conn.cursor()
             cursor.execute(f"PRAGMA table_info([{table_name}])")
             columns = cursor.fetchall()
@@ -88,6 +117,7 @@ class DashboardGenerator:
                 'sample_data': processed_df.head(5).to_dict('records'),
                 'data_type': 'shipment_logistics',
                 'total_rows': len(processed_df),
+                'generation': generation,
                 'excel_source': latest_file,
                 'total_files_found': len(excel_files)
             }
@@ -106,6 +136,7 @@ class DashboardGenerator:
             base_name = os.path.splitext(os.path.basename(excel_path))[0]
             table_name = self.sanitize_table_name(base_name)
             processed_df.to_sql(table_name, conn, if_exists='replace', index=False)
+            generation = bump_generation(conn, table_name, len(processed_df), excel_path)
             cursor = conn.cursor()
             cursor.execute(f"PRAGMA table_info([{table_name}])")
             columns = cursor.fetchall()
@@ -120,6 +151,7 @@ class DashboardGenerator:
                 'sample_data': processed_df.head(5).to_dict('records'),
                 'data_type': 'shipment_logistics',
                 'total_rows': len(processed_df),
+                'generation': generation,
                 'excel_source': excel_path
             }
         except Exception as e:
@@ -171,61 +203,104 @@ class DashboardGenerator:
             return df  # Return original if processing fails
 
     def call_llm(self, prompt):
+        # fail fast to the template while ollama is known to be down or overloaded
+        if not llm_breaker.allow():
+            print("LLM circuit open - skipping LLM call")
+            return None
+        result, failed = None, True
         try:
-            # basic ollama call - could be improved
-            payload = {
-                "model": Config.OLLAMA_MODEL,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,  # not too creative
-                    "top_p": 0.9
-                }
-            }
-            print(f"Calling LLM with model: {Config.OLLAMA_MODEL}")
-            response = requests.post(self.ollama_url, json=payload, timeout=Config.OLLAMA_TIMEOUT)
-
-            if response.status_code == 200:
-                result = response.json().get('response', '')
-                if result.strip():
-                    print("LLM generation successful")
-                    return result
-                else:
-                    print("LLM returned empty response")
-                    return None
+            result, failed = self._call_ollama(prompt)
+        except Exception as e:
+            print(f"LLM call failed: {e}")
+        finally:
+            # always settle the breaker, or a half-open probe stays in flight forever
+            if failed:
+                llm_breaker.record_failure()
             else:
+                llm_breaker.record_success()
+        return result
+
+    def _call_ollama(self, prompt):
+        """Returns (text or None, whether the call counts as an ollama failure)"""
+        # basic ollama call - could be improved
+        payload = {
+            "model": Config.OLLAMA_MODEL,
+            "prompt": prompt,
+            "stream": False,
+            "keep_alive": Config.OLLAMA_KEEP_ALIVE,
+            "options": {
+                "temperature": 0.3,  # not too creative
+                "top_p": 0.9
+            }
+        }
+        timeout = llm_timeout.current()
+        tried = []
+        # a refused connection is cheap, so try another node; a timeout already cost us the budget
+        while len(tried) < len(ollama_pool.nodes):
+            try:
+                node = ollama_pool.acquire(exclude=tried)
+            except NoHealthyNodeError as e:
+                print(f"LLM unavailable: {e}")
+                return None, True
+            tried.append(node)
+            print(f"Calling LLM with model: {Config.OLLAMA_MODEL} on {node.url} (timeout {timeout:.0f}s)")
+            model_managers[node.url].touch()
+            start = time.time()
+            try:
+                response = requests.post(f"{node.url}/api/generate", json=payload, timeout=timeout)
+            except requests.exceptions.Timeout:
+                ollama_pool.release(node, False, error='timeout')
+                llm_timeout.observe_timeout(timeout)
+                print(f"LLM timeout after {timeout:.0f} seconds")
+                return None, True
+            except requests.exceptions.ConnectionError:
+                ollama_pool.release(node, False, error='connection error')
+                print(f"LLM connection error - Ollama may not be running at {node.url}")
+                continue
+            except Exception as e:
+                ollama_pool.release(node, False, error=str(e))
+                print(f"LLM unexpected error: {e}")
+                return None, True
+
+            if response.status_code != 200:
+                ollama_pool.release(node, False, error=f'HTTP {response.status_code}')
                 print(f"LLM API error: {response.status_code} - {response.text}")
-                return None
-
-        except requests.exceptions.Timeout:
-            print(f"LLM timeout after {Config.OLLAMA_TIMEOUT} seconds")
-            return None
-        except requests.exceptions.ConnectionError:
-            print("LLM connection error - Ollama may not be running")
-            return None
-        except Exception as e:
-            print(f"LLM unexpected error: {e}")
-            return None
+                return None, True
+            elapsed = time.time() - start
+            try:
+                body = response.json()
+                result = body['response']
+                if not isinstance(result, str):
+                    raise TypeError(f"'response' is {type(result).__name__}")
+            except (ValueError, KeyError, TypeError) as e:
+                # a 200 we can't read is a failed call, not a success
+                ollama_pool.release(node, False, error=f'bad response body: {e}')
+                print(f"LLM returned an unreadable body: {e}")
+                return None, True
+            ollama_pool.release(node, True, latency=elapsed)
+            llm_timeout.observe(elapsed)
+            self.log_llm_timings(body)
+            if result.strip():
+                print("LLM generation successful")
+                return result, False
+            print("LLM returned empty response")
+            return None, False
+        return None, True
+
+    def log_llm_timings(self, body):
+        # ollama reports durations in nanoseconds
+        prompt_tokens = body.get('prompt_eval_count')
+        prompt_ns = body.get('prompt_eval_duration')
+        eval_tokens = body.get('eval_count')
+        eval_ns = body.get('eval_duration')
+        if prompt_ns is not None:
+            print(f"LLM prompt eval: {prompt_tokens} tokens in {prompt_ns / 1e9:.2f}s")
+        if eval_ns:
+            print(f"LLM generation: {eval_tokens} tokens in {eval_ns / 1e9:.2f}s "
+                  f"({eval_tokens / (eval_ns / 1e9):.1f} tok/s)")
 
     def analyze_dashboard_type(self, user_prompt):
-        prompt_lower = user_prompt.lower()
-        if any(word in prompt_lower for word in ['lane', 'bay', 'throughput', 'capacity', 'production', 'manufacturing', 'terminal', 'schedule', 'adherence']):
-            return 'manufacturing'
-        if any(word in prompt_lower for word in ['financial', 'revenue', 'profit', 'cost', 'budget', 'earnings', 'income', 'expense']):
-            return 'financial'
-        if any(word in prompt_lower for word in ['sales', 'revenue', 'customer', 'conversion', 'lead', 'pipeline', 'orders']):
-            return 'sales'
-        if any(word in prompt_lower for word in ['operational', 'efficiency', 'uptime', 'performance', 'productivity', 'operations']):
-            return 'operational'
-        if any(word in prompt_lower for word in ['logistics', 'supply', 'inventory', 'shipment', 'delivery', 'warehouse', 'freight']):
-            return 'logistics'
-        if any(word in prompt_lower for word in ['analytics', 'analysis', 'report', 'insights', 'trends', 'statistics']):
-            return 'analytics'
-        if any(word in prompt_lower for word in ['fuel', 'energy', 'consumption', 'volume', 'flow', 'rate']):
-            return 'energy'
-        if any(word in prompt_lower for word in ['employee', 'hr', 'staff', 'workforce', 'personnel', 'hiring']):
-            return 'hr'
-        return 'analytics'
+        return self.classifier.best_type(user_prompt)
 
     def get_dashboard_requirements(self, dashboard_type):
         requirements = {
@@ -290,597 +365,226 @@ class DashboardGenerator:
 
         return requirements.get(dashboard_type, requirements['analytics'])
 
-    def generate_dashboard_code(self, user_prompt, data_context):
-        dashboard_type = self.analyze_dashboard_type(user_prompt)
-        llm_prompt = f"""
-You are an expert Python developer creating a Streamlit dashboard for shipment/logistics data analysis.
-
-USER REQUEST: "{user_prompt}"
-DASHBOARD TYPE: {dashboard_type}
-
-ACTUAL DATA CONTEXT:
-- Database: {data_context['db_path']}
-- ⚠️  EXACT TABLE NAME TO USE: {data_context['table_name']} ⚠️
-- Data Type: {data_context.get('data_type', 'shipment_logistics')}
-- Total Rows: {data_context.get('total_rows', 'Unknown')}
-- Available Columns: {', '.join(data_context['columns'])}
-- Sample Data (first 5 rows): {json.dumps(data_context['sample_data'], indent=2)}
-- Source file: {data_context.get('excel_source', 'Excel file')} (for reference only - do not use for table names)
-
-IMPORTANT:
-1. Use the ACTUAL data provided above. DO NOT generate sample data.
-2. Load data from the SQLite database using EXACTLY this table name: {data_context['table_name']}
-3. DO NOT derive table names from the Excel filename - use ONLY the table name provided above
-4. Use this EXACT SQL query format: SELECT * FROM [{data_context['table_name']}]
-5. Use the real columns and values shown in the sample data.
-
-KEY DATA SCHEMA:
-- BayCode/Lane: Use for lane/bay performance analysis
-- GrossQuantity: Shipment quantities for throughput analysis
-- FlowRate: Operational flow rates
-- ScheduledDate: For schedule vs actual analysis
-- ExitTime: For timing analysis and shift patterns
-- BaseProductCode: For product mix analysis
-- ShipmentID, ShipmentCompartmentID: For operational tracking
-
-DASHBOARD TYPE SPECIFIC REQUIREMENTS:
-{self.get_dashboard_requirements(dashboard_type)}
-
-CRITICAL REQUIREMENTS:
-1. Load data from SQLite database: sqlite3.connect('{data_context['db_path']}')
-2. Query table: SELECT * FROM [{data_context['table_name']}]
-3. Use ACTUAL column names from the data: {', '.join(data_context['columns'])}
-4. Handle missing/null values gracefully
-5. Create professional manufacturing-style dashboard
-6. Focus on lane/bay performance, throughput, and operational metrics
-7. Use Plotly for interactive charts
-8. Include filtering and date range selection
-9. NO sample data generation - use only real data from database
-
-Generate ONLY the Python code for the Streamlit dashboard. Start directly with imports, no explanations.
+    def llm_code_key(self, user_prompt, data_context, dashboard_type):
+        return code_key('llm', dashboard_type, data_context, prompt=user_prompt, model=Config.OLLAMA_MODEL)
 
-```python
-"""
+    def generate_llm_code(self, user_prompt, data_context, dashboard_type):
+        """LLM-generated dashboard code, or None if the LLM gave nothing usable"""
+        # same prompt against the same schema and model: reuse the code we already validated
+        key = self.llm_code_key(user_prompt, data_context, dashboard_type)
+        cached = self.code_store.read(key)
+        if cached is not None:
+            print(f"Reusing stored LLM code for {dashboard_type} dashboard")
+            return cached
+
+        llm_prompt, prompt_stats = self.prompt_builder.build(
+            user_prompt, dashboard_type, data_context, self.get_dashboard_requirements(dashboard_type))
+        print(f"Prompt size: {prompt_stats['tokens']} tokens (~budget {prompt_stats['budget']}), "
+              f"{prompt_stats['chars']} chars, {prompt_stats['columns_shown']} columns, "
+              f"{prompt_stats['sample_rows']} sample rows")
 
         response = self.call_llm(llm_prompt)
+        if not response:
+            return None
+        code = self.extract_code(response)
+
+        # reject broken code in milliseconds instead of after a streamlit launch
+        for attempt in range(Config.VALIDATION_REPAIR_ATTEMPTS + 1):
+            check = self.validator.validate(code, data_context)
+            if check['valid']:
+                print(f"LLM code passed validation ({check['elapsed_ms']}ms)")
+                self.code_store.put(key, code, persist=True)
+                return code
+            print(f"LLM code failed validation ({check['elapsed_ms']}ms): {'; '.join(check['errors'])}")
+            if attempt == Config.VALIDATION_REPAIR_ATTEMPTS:
+                break
+            response = self.call_llm(self.build_repair_prompt(code, check['errors'], data_context))
+            if not response:
+                break
+            code = self.extract_code(response)
+        return None
+
+    def extract_code(self, response):
+        # Extract Python code from response
+        if '```python' in response:
+            return response.split('```python')[1].split('```')[0].strip()
+        elif '```' in response:
+            parts = response.split('```')
+            # the prompt ends inside an open fence, so the reply is often code then a closing fence
+            if response.lstrip().startswith('```'):
+                return parts[1].strip()
+            return parts[0].strip()
+        return response.strip()
+
+    def build_repair_prompt(self, code, errors, data_context):
+        problems = '\n'.join(f"- {e}" for e in errors)
+        return f"""The following Streamlit dashboard code has problems:
+{problems}
+
+Table name: {data_context['table_name']}
+Columns: {', '.join(data_context.get('columns', []))}
+
+Fix the problems and return the complete corrected Python code only.
 
-        if response:
-            # Extract Python code from response
-            if '```python' in response:
-                code = response.split('```python')[1].split('```')[0].strip()
-            elif '```' in response:
-                code = response.split('```')[1].strip()
-            else:
-                code = response.strip()
+```python
+{code}
+```
 
+```python
+"""
+
+    def generate_dashboard_code(self, user_prompt, data_context):
+        dashboard_type = self.analyze_dashboard_type(user_prompt)
+        code = self.generate_llm_code(user_prompt, data_context, dashboard_type)
+        if code:
             return code
 
         # Fallback template if LLM fails
         return self.get_fallback_dashboard(data_context, dashboard_type)
 
     def get_fallback_dashboard(self, data_context, dashboard_type='operational'):
+        # templates only depend on the type and the schema, so render each combination once
+        key = code_key('template', dashboard_type, data_context)
+        code = self.code_store.read(key)
+        if code is None:
+            code = self.render_template(data_context, dashboard_type)
+            self.code_store.put(key, code)
+        return code
+
+    def render_template(self, data_context, dashboard_type):
         table_name = data_context.get('table_name', 'data_table')
         columns = data_context.get('columns', [])
-        if dashboard_type == 'manufacturing':
-            return self.get_manufacturing_template(table_name, columns)
-        elif dashboard_type == 'financial':
-            return self.get_financial_template(table_name, columns)
-        elif dashboard_type == 'sales':
-            return self.get_sales_template(table_name, columns)
-        elif dashboard_type == 'logistics':
-            return self.get_logistics_template(table_name, columns)
-        elif dashboard_type == 'analytics':
-            return self.get_analytics_template(table_name, columns)
-        elif dashboard_type == 'energy':
-            return self.get_energy_template(table_name, columns)
-        elif dashboard_type == 'hr':
-            return self.get_hr_template(table_name, columns)
-        else:
-            return self.get_operational_template(table_name, columns)
+        templates = {
+            'manufacturing': self.get_manufacturing_template,
+            'financial': self.get_financial_template,
+            'sales': self.get_sales_template,
+            'logistics': self.get_logistics_template,
+            'analytics': self.get_analytics_template,
+            'energy': self.get_energy_template,
+            'hr': self.get_hr_template,
+        }
+        template = templates.get(dashboard_type, self.get_operational_template)
+        return template(table_name, columns, data_context)
 
-    def get_manufacturing_template(self, table_name, columns):
-        return fr"""
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import sqlite3
-import numpy as np
-from datetime import datetime, timedelta
-import plotly.figure_factory as ff
-
-# Page configuration for manufacturing dashboard
-st.set_page_config(
-    page_title="Manufacturing Performance Dashboard",
-    page_icon="🏭",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+    def runtime_header(self, table_name, data_context=None):
+        # every template is a thin script over dashboard_runtime, which lives next to this file
+        db_path = (data_context or {}).get('db_path') or os.path.join(Config.DATA_DIR, 'terminal_data.db')
+        # streamlit reruns the script and the host execs it per session, so only add the path once
+        return f"""import sys
+if {Config.RUNTIME_DIR!r} not in sys.path:
+    sys.path.insert(0, {Config.RUNTIME_DIR!r})
 
-# Professional manufacturing CSS styling
-st.markdown('''
-<style>
-    .main {{
-        background: linear-gradient(135deg, #1a202c 0%, #2d3748 100%);
-        color: white;
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    }}
-    .metric-card {{
-        background: linear-gradient(135deg, #ffffff 0%, #f7fafc 100%);
-        color: #1a202c;
-        padding: 2rem;
-        border-radius: 16px;
-        box-shadow: 0 10px 40px rgba(0,0,0,0.15);
-        margin: 0.75rem 0;
-        border-left: 6px solid #3182ce;
-        transition: transform 0.2s ease;
-    }}
-    .metric-card:hover {{
-        transform: translateY(-2px);
-        box-shadow: 0 15px 50px rgba(0,0,0,0.2);
-    }}
-    .kpi-header {{
-        font-size: 0.95rem;
-        font-weight: 700;
-        color: #4a5568;
-        margin-bottom: 0.75rem;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-    }}
-    .kpi-value {{
-        font-size: 3rem;
-        font-weight: 900;
-        color: #1a202c;
-        margin: 0;
-        line-height: 1;
-    }}
-    .kpi-delta {{
-        font-size: 0.9rem;
-        margin-top: 0.5rem;
-        font-weight: 600;
-    }}
-    .kpi-unit {{
-        font-size: 1.2rem;
-        color: #718096;
-        margin-left: 0.5rem;
-    }}
-    .status-excellent {{ color: #38a169; }}
-    .status-good {{ color: #4299e1; }}
-    .status-warning {{ color: #ed8936; }}
-    .status-critical {{ color: #e53e3e; }}
-    .section-header {{
-        color: white;
-        font-size: 1.8rem;
-        font-weight: 700;
-        margin: 2rem 0 1rem 0;
-        padding-bottom: 0.5rem;
-        border-bottom: 3px solid #3182ce;
-    }}
-    .stPlotlyChart {{
-        background: rgba(255,255,255,0.98);
-        border-radius: 16px;
-        padding: 1.5rem;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.12);
-        margin: 1rem 0;
-    }}
-    .alert-banner {{
-        background: linear-gradient(90deg, #fed7d7 0%, #feb2b2 100%);
-        color: #c53030;
-        padding: 1rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        font-weight: 600;
-        border-left: 6px solid #e53e3e;
-    }}
-    .target-banner {{
-        background: linear-gradient(90deg, #c6f6d5 0%, #9ae6b4 100%);
-        color: #2f855a;
-        padding: 1rem;
-        border-radius: 12px;
-        margin: 1rem 0;
-        font-weight: 600;
-        border-left: 6px solid #38a169;
-    }}
-</style>
-''', unsafe_allow_html=True)
-
-# Dashboard header
-st.markdown("<h1 style='text-align: center; color: white; margin-bottom: 1rem; font-size: 3rem;'>🏭 Manufacturing Performance Dashboard</h1>", unsafe_allow_html=True)
-st.markdown("<h3 style='text-align: center; color: #a0aec0; margin-bottom: 3rem;'>Real-time Production Metrics • Lane/Bay Performance • OEE Analytics</h3>", unsafe_allow_html=True)
-
-# Load and process data
-@st.cache_data
-def load_data():
-    try:
-        # Load actual data from SQLite database
-        conn = sqlite3.connect('{data_context["db_path"]}')
-        df = pd.read_sql_query(f"SELECT * FROM [{data_context['table_name']}]", conn)
-        conn.close()
-
-        # Process the data for dashboard use
-        if not df.empty:
-            # Convert numeric columns
-            numeric_cols = ['GrossQuantity', 'FlowRate', 'Throughput_Units_Hour']
-            for col in numeric_cols:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-
-            # Process date/time columns
-            if 'ScheduledDate_parsed' in df.columns:
-                df['ScheduledDate_parsed'] = pd.to_datetime(df['ScheduledDate_parsed'], errors='coerce')
-                df['Date'] = df['ScheduledDate_parsed'].dt.date
-
-            # Handle missing lane/bay data
-            if 'Lane' not in df.columns and 'BayCode' in df.columns:
-                df['Lane'] = df['BayCode'].str.extract(r'(LANE\d+)', expand=False).fillna(df['BayCode'])
-
-            st.success(f"Loaded {{len(df)}} records from {{'{data_context['excel_source']}'}} via database")
-            return df
-        else:
-            st.warning("No data found in database")
-            return pd.DataFrame()
+import streamlit as st
+import dashboard_runtime as rt
 
-    except Exception as e:
-        st.error(f"Error loading data: {{str(e)}}")
-        return pd.DataFrame()
+DB_PATH = {db_path!r}
+TABLE = {table_name!r}
+"""
 
-@st.cache_data
-def generate_sample_manufacturing_data():
-    \"\"\"Generate realistic manufacturing sample data\"\"\"
-    try:
-        np.random.seed(42)
-        dates = pd.date_range(start=datetime.now() - timedelta(days=7), end=datetime.now(), freq='H')
-
-    lanes = ['Lane_A', 'Lane_B', 'Lane_C', 'Lane_D']
-    bays = ['Bay_1', 'Bay_2', 'Bay_3', 'Bay_4', 'Bay_5']
-    products = ['Product_X', 'Product_Y', 'Product_Z']
-    shifts = ['Day_Shift', 'Night_Shift']
-
-    data = []
-    for i, timestamp in enumerate(dates):
-        # Simulate realistic production patterns
-        hour = timestamp.hour
-        is_peak = 8 <= hour <= 16  # Day shift peak hours
-
-        for lane in lanes:
-            for bay in bays[:3]:  # 3 bays per lane
-                base_throughput = 100 if is_peak else 60
-                throughput = max(0, base_throughput + np.random.normal(0, 15))
-
-                # Calculate OEE components
-                availability = max(0.7, min(0.99, 0.85 + np.random.normal(0, 0.05)))
-                performance = max(0.6, min(0.98, 0.82 + np.random.normal(0, 0.08)))
-                quality = max(0.8, min(0.99, 0.94 + np.random.normal(0, 0.03)))
-                oee = availability * performance * quality
-
-                # Schedule adherence
-                schedule_adherence = max(0.7, min(1.0, 0.88 + np.random.normal(0, 0.06)))
-
-                data.append({{
-                    'Timestamp': timestamp,
-                    'Date': timestamp.date(),
-                    'Hour': hour,
-                    'Lane': lane,
-                    'Bay': bay,
-                    'Product': np.random.choice(products),
-                    'Shift': 'Day_Shift' if 6 <= hour < 18 else 'Night_Shift',
-                    'Planned_Production': int(110 + np.random.normal(0, 10)),
-                    'Actual_Production': int(throughput),
-                    'Throughput_Units_Hour': int(throughput),
-                    'OEE_Percentage': round(oee * 100, 1),
-                    'Availability': round(availability * 100, 1),
-                    'Performance': round(performance * 100, 1),
-                    'Quality': round(quality * 100, 1),
-                    'Schedule_Adherence': round(schedule_adherence * 100, 1),
-                    'Downtime_Minutes': max(0, int(np.random.exponential(5))),
-                    'Cycle_Time_Seconds': round(60 + np.random.normal(0, 8), 1),
-                    'Energy_Consumption_kWh': round(50 + np.random.normal(0, 8), 1),
-                    'Temperature_C': round(22 + np.random.normal(0, 2), 1),
-                    'Operator': f'OP_{{np.random.randint(100, 999)}}',
-                    'Quality_Score': round(quality * 100, 1)
-                }})
-
-        return pd.DataFrame(data)
+    def get_manufacturing_template(self, table_name, columns, data_context=None):
+        return self.runtime_header(table_name, data_context) + """
+rt.setup_page("Manufacturing Performance Dashboard", "🏭", theme='manufacturing',
+              subtitle="Real-time Production Metrics • Lane/Bay Performance • OEE Analytics")
 
-    except Exception as e:
-        # If sample data generation fails, return minimal sample data
-        st.error(f"Error generating sample data: {{str(e)}}")
-        return pd.DataFrame({{
-            'Timestamp': [datetime.now()],
-            'Lane': ['Lane_A'],
-            'Bay': ['Bay_1'],
-            'OEE_Percentage': [85.0],
-            'Throughput_Units_Hour': [100],
-            'Schedule_Adherence': [95.0],
-            'Quality_Score': [98.0]
-        }})
-
-# Load actual data
-df = load_data()
-
-# Ensure data is available
-if df.empty:
+src = rt.source(DB_PATH, TABLE, sample='manufacturing')
+if not src['columns']:
     st.error("No data available for dashboard. Please check your Excel file upload.")
     st.stop()
 
-# Process data for dashboard
-if 'Date' in df.columns:
-    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
-
-# Sidebar controls
-st.sidebar.markdown("## 📊 Dashboard Controls")
-if 'Date' in df.columns:
-    date_range = st.sidebar.date_input(
-        "Select Date Range",
-        value=[df['Date'].min().date(), df['Date'].max().date()],
-        min_value=df['Date'].min().date(),
-        max_value=df['Date'].max().date()
-    )
-else:
-    date_range = [datetime.now().date() - timedelta(days=7), datetime.now().date()]
-
-# Filter controls
-lanes = st.sidebar.multiselect("Select Lanes",
-                              options=df['Lane'].unique() if 'Lane' in df.columns else ['All'],
-                              default=df['Lane'].unique() if 'Lane' in df.columns else ['All'])
-shifts = st.sidebar.multiselect("Select Shifts",
-                               options=df['Shift'].unique() if 'Shift' in df.columns else ['All'],
-                               default=df['Shift'].unique() if 'Shift' in df.columns else ['All'])
-
-# Apply filters
-filtered_df = df.copy()
-if 'Date' in df.columns and len(date_range) == 2:
-    filtered_df = filtered_df[
-        (filtered_df['Date'] >= pd.to_datetime(date_range[0])) &
-        (filtered_df['Date'] <= pd.to_datetime(date_range[1]))
-    ]
-if lanes and 'Lane' in df.columns:
-    filtered_df = filtered_df[filtered_df['Lane'].isin(lanes)]
-if shifts and 'Shift' in df.columns:
-    filtered_df = filtered_df[filtered_df['Shift'].isin(shifts)]
-
-# Key Performance Indicators
-st.markdown('<div class="section-header">🎯 Key Performance Indicators</div>', unsafe_allow_html=True)
-
-if not filtered_df.empty:
-    kpi_cols = st.columns(6)
-
-    # Overall Equipment Effectiveness (OEE)
-    avg_oee = filtered_df['OEE_Percentage'].mean() if 'OEE_Percentage' in filtered_df.columns else 0
-    oee_status = "status-excellent" if avg_oee >= 85 else "status-good" if avg_oee >= 75 else "status-warning" if avg_oee >= 60 else "status-critical"
-
-    with kpi_cols[0]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Overall Equipment Effectiveness</div>
-            <div class="kpi-value {{oee_status}}">{{avg_oee:.1f}}<span class="kpi-unit">%</span></div>
-            <div class="kpi-delta">Target: 85%+ | World Class: 90%+</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    # Total Throughput
-    total_throughput = filtered_df['Throughput_Units_Hour'].sum() if 'Throughput_Units_Hour' in filtered_df.columns else 0
-    with kpi_cols[1]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Total Throughput</div>
-            <div class="kpi-value">{{total_throughput:,.0f}}<span class="kpi-unit">units</span></div>
-            <div class="kpi-delta">Last {{len(filtered_df)}} data points</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    # Schedule Adherence
-    avg_adherence = filtered_df['Schedule_Adherence'].mean() if 'Schedule_Adherence' in filtered_df.columns else 0
-    adherence_status = "status-excellent" if avg_adherence >= 95 else "status-good" if avg_adherence >= 90 else "status-warning"
-    with kpi_cols[2]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Schedule Adherence</div>
-            <div class="kpi-value {{adherence_status}}">{{avg_adherence:.1f}}<span class="kpi-unit">%</span></div>
-            <div class="kpi-delta">Target: 95%+</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    # Quality Score
-    avg_quality = filtered_df['Quality_Score'].mean() if 'Quality_Score' in filtered_df.columns else 0
-    quality_status = "status-excellent" if avg_quality >= 98 else "status-good" if avg_quality >= 95 else "status-warning"
-    with kpi_cols[3]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Quality Score</div>
-            <div class="kpi-value {{quality_status}}">{{avg_quality:.1f}}<span class="kpi-unit">%</span></div>
-            <div class="kpi-delta">First Pass Yield Target: 98%</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    # Average Cycle Time
-    avg_cycle_time = filtered_df['Cycle_Time_Seconds'].mean() if 'Cycle_Time_Seconds' in filtered_df.columns else 0
-    with kpi_cols[4]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Avg Cycle Time</div>
-            <div class="kpi-value">{{avg_cycle_time:.1f}}<span class="kpi-unit">sec</span></div>
-            <div class="kpi-delta">Takt Time Optimization</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    # Total Downtime
-    total_downtime = filtered_df['Downtime_Minutes'].sum() if 'Downtime_Minutes' in filtered_df.columns else 0
-    with kpi_cols[5]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Total Downtime</div>
-            <div class="kpi-value status-warning">{{total_downtime:,.0f}}<span class="kpi-unit">min</span></div>
-            <div class="kpi-delta">Minimize unplanned stops</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-# Performance alerts
-if avg_oee < 75:
-    st.markdown('<div class="alert-banner">⚠️ Alert: OEE below target threshold. Review availability, performance, and quality metrics.</div>', unsafe_allow_html=True)
-elif avg_oee >= 85:
-    st.markdown('<div class="target-banner">✅ Excellent: OEE exceeds target. Maintain current operational excellence.</div>', unsafe_allow_html=True)
-
-# Production Analysis Charts
-st.markdown('<div class="section-header">📈 Production Performance Analysis</div>', unsafe_allow_html=True)
-
+# Lane x Bay x Shift x Product x Day cube with a bitmap per value; filtering is bitwise ops over it
+cube = rt.filter_cube(src, dimensions=['Lane', 'Bay', 'Shift', 'Product'], date_dimension='Date',
+                      measures=['OEE_Percentage', 'Schedule_Adherence', 'Quality_Score', 'Downtime_Minutes',
+                                'Throughput_Units_Hour', 'Cycle_Time_Seconds', 'Planned_Production',
+                                'Actual_Production'])
+sel = rt.cube_filters(cube, choices={'Lane': "Select Lanes", 'Shift': "Select Shifts", 'Product': "Select Products"})
+mask = cube.mask(sel)
+charts = rt.chart_context(src, sel)
+
+avg_oee = cube.total('OEE_Percentage', mask, how='mean')
+avg_adherence = cube.total('Schedule_Adherence', mask, how='mean')
+avg_quality = cube.total('Quality_Score', mask, how='mean')
+total_downtime = cube.total('Downtime_Minutes', mask)
+
+rt.section("🎯 Key Performance Indicators")
+rt.kpi_row([
+    rt.kpi("Overall Equipment Effectiveness", avg_oee, unit='%', delta="Target: 85%+ | World Class: 90%+",
+           status=rt.threshold_status(avg_oee, 85, 75, 60)),
+    rt.kpi("Total Throughput", cube.total('Throughput_Units_Hour', mask), fmt='{:,.0f}', unit='units',
+           delta=f"Last {cube.row_count(mask):,.0f} data points"),
+    rt.kpi("Schedule Adherence", avg_adherence, unit='%', delta="Target: 95%+",
+           status=rt.threshold_status(avg_adherence, 95, 90)),
+    rt.kpi("Quality Score", avg_quality, unit='%', delta="First Pass Yield Target: 98%",
+           status=rt.threshold_status(avg_quality, 98, 95)),
+    rt.kpi("Avg Cycle Time", cube.total('Cycle_Time_Seconds', mask, how='mean'), unit='sec',
+           delta="Takt Time Optimization"),
+    rt.kpi("Total Downtime", total_downtime, fmt='{:,.0f}', unit='min', delta="Minimize unplanned stops",
+           status='status-warning'),
+])
+
+if avg_oee is not None and avg_oee < 75:
+    rt.banner("⚠️ Alert: OEE below target threshold. Review availability, performance, and quality metrics.")
+elif avg_oee is not None and avg_oee >= 85:
+    rt.banner("✅ Excellent: OEE exceeds target. Maintain current operational excellence.", kind='target')
+
+rt.section("📈 Production Performance Analysis")
 chart_col1, chart_col2 = st.columns(2)
-
 with chart_col1:
-    # Throughput by Lane/Bay
-    if 'Lane' in filtered_df.columns and 'Bay' in filtered_df.columns and 'Throughput_Units_Hour' in filtered_df.columns:
-        bay_performance = filtered_df.groupby(['Lane', 'Bay'])['Throughput_Units_Hour'].sum().reset_index()
-        bay_performance['Lane_Bay'] = bay_performance['Lane'] + ' - ' + bay_performance['Bay']
-
-        fig_throughput = px.bar(bay_performance,
-                               x='Lane_Bay',
-                               y='Throughput_Units_Hour',
-                               color='Throughput_Units_Hour',
-                               color_continuous_scale='Blues',
-                               title="🏭 Throughput by Lane/Bay",
-                               labels={{'Throughput_Units_Hour': 'Total Units', 'Lane_Bay': 'Lane - Bay'}})
-        fig_throughput.update_layout(height=400, showlegend=False, xaxis_tickangle=-45)
-        st.plotly_chart(fig_throughput, use_container_width=True)
-
+    rt.bar(lambda: cube.group(['Lane', 'Bay'], 'Throughput_Units_Hour', mask), ['Lane', 'Bay'], 'Throughput_Units_Hour',
+           "🏭 Throughput by Lane/Bay", color_scale='Blues', labels={'Throughput_Units_Hour': 'Total Units'},
+           cache=charts)
 with chart_col2:
-    # OEE Trend Analysis
-    if 'Timestamp' in filtered_df.columns and 'OEE_Percentage' in filtered_df.columns:
-        hourly_oee = filtered_df.groupby(filtered_df['Timestamp'].dt.floor('H'))['OEE_Percentage'].mean().reset_index()
-
-        fig_oee = go.Figure()
-        fig_oee.add_trace(go.Scatter(x=hourly_oee['Timestamp'],
-                                   y=hourly_oee['OEE_Percentage'],
-                                   mode='lines+markers',
-                                   name='OEE %',
-                                   line=dict(color='#3182ce', width=3),
-                                   marker=dict(size=6)))
-        fig_oee.add_hline(y=85, line_dash="dash", line_color="#38a169",
-                         annotation_text="Target: 85%")
-        fig_oee.add_hline(y=90, line_dash="dash", line_color="#2f855a",
-                         annotation_text="World Class: 90%")
-        fig_oee.update_layout(title="📊 OEE Trend Analysis",
-                            height=400,
-                            showlegend=False,
-                            yaxis_title="OEE (%)")
-        st.plotly_chart(fig_oee, use_container_width=True)
-
-# Advanced Analytics Section
-st.markdown('<div class="section-header">🔬 Advanced Manufacturing Analytics</div>', unsafe_allow_html=True)
-
+    # hourly buckets are finer than the cube, so this one stays a filtered SQL aggregate
+    rt.line(lambda: rt.sql(src, "SELECT strftime('%Y-%m-%d %H:00:00', [Timestamp]) AS Timestamp, "
+                        "AVG([OEE_Percentage]) AS OEE_Percentage FROM {table}{where} GROUP BY 1", sel,
+                   dates=['Timestamp']),
+            'Timestamp', 'OEE_Percentage', "📊 OEE Trend Analysis", color='#3182ce',
+            targets=[(85, "Target: 85%"), (90, "World Class: 90%")], cache=charts)
+
+rt.section("🔬 Advanced Manufacturing Analytics")
 analysis_col1, analysis_col2, analysis_col3 = st.columns(3)
-
 with analysis_col1:
-    # Schedule vs Actual Performance
-    if 'Planned_Production' in filtered_df.columns and 'Actual_Production' in filtered_df.columns:
-        schedule_data = filtered_df.groupby('Lane').agg({{
-            'Planned_Production': 'sum',
-            'Actual_Production': 'sum'
-        }}).reset_index()
-
-        fig_schedule = go.Figure()
-        fig_schedule.add_trace(go.Bar(name='Planned',
-                                    x=schedule_data['Lane'],
-                                    y=schedule_data['Planned_Production'],
-                                    marker_color='lightblue'))
-        fig_schedule.add_trace(go.Bar(name='Actual',
-                                    x=schedule_data['Lane'],
-                                    y=schedule_data['Actual_Production'],
-                                    marker_color='darkblue'))
-        fig_schedule.update_layout(title="📅 Schedule vs Actual by Lane",
-                                 height=350,
-                                 barmode='group')
-        st.plotly_chart(fig_schedule, use_container_width=True)
-
+    rt.grouped_bars(lambda: cube.group('Lane', ['Planned_Production', 'Actual_Production'], mask),
+                    'Lane', {'Planned_Production': 'Planned', 'Actual_Production': 'Actual'},
+                    "📅 Schedule vs Actual by Lane", height=350, cache=charts)
 with analysis_col2:
-    # Product Mix Analysis
-    if 'Product' in filtered_df.columns and 'Actual_Production' in filtered_df.columns:
-        product_mix = filtered_df.groupby('Product')['Actual_Production'].sum().reset_index()
-
-        fig_product = px.pie(product_mix,
-                           values='Actual_Production',
-                           names='Product',
-                           title="🔧 Product Mix Distribution",
-                           color_discrete_sequence=px.colors.qualitative.Set3)
-        fig_product.update_layout(height=350)
-        st.plotly_chart(fig_product, use_container_width=True)
-
+    rt.pie(lambda: cube.group('Product', 'Actual_Production', mask),
+           'Product', 'Actual_Production', "🔧 Product Mix Distribution", height=350, cache=charts)
 with analysis_col3:
-    # Energy Efficiency
-    if 'Energy_Consumption_kWh' in filtered_df.columns and 'Actual_Production' in filtered_df.columns:
-        filtered_df['Energy_Per_Unit'] = filtered_df['Energy_Consumption_kWh'] / (filtered_df['Actual_Production'] + 0.1)
-        energy_efficiency = filtered_df.groupby('Lane')['Energy_Per_Unit'].mean().reset_index()
-
-        fig_energy = px.bar(energy_efficiency,
-                          x='Lane',
-                          y='Energy_Per_Unit',
-                          color='Energy_Per_Unit',
-                          color_continuous_scale='Reds_r',
-                          title="⚡ Energy Efficiency by Lane",
-                          labels={{'Energy_Per_Unit': 'kWh/Unit'}})
-        fig_energy.update_layout(height=350, showlegend=False)
-        st.plotly_chart(fig_energy, use_container_width=True)
-
-# Real-time Monitoring Section
-st.markdown('<div class="section-header">🔄 Real-time Lane Performance</div>', unsafe_allow_html=True)
-
-if 'Lane' in filtered_df.columns and 'OEE_Percentage' in filtered_df.columns:
-    # Create heatmap for lane performance
-    latest_data = filtered_df.groupby(['Lane', 'Bay']).agg({{
-        'OEE_Percentage': 'last',
-        'Throughput_Units_Hour': 'last',
-        'Quality_Score': 'last'
-    }}).reset_index()
-
-    # OEE Heatmap
-    oee_matrix = latest_data.pivot(index='Lane', columns='Bay', values='OEE_Percentage')
-    fig_heatmap = px.imshow(oee_matrix,
-                           color_continuous_scale='RdYlGn',
-                           aspect="auto",
-                           title="🌡️ Real-time OEE Heatmap by Lane/Bay",
-                           labels=dict(color="OEE %"))
-    fig_heatmap.update_layout(height=400)
-    st.plotly_chart(fig_heatmap, use_container_width=True)
-
-# Detailed Data Table
-st.markdown('<div class="section-header">📋 Detailed Production Data</div>', unsafe_allow_html=True)
-
-if st.checkbox("Show detailed data table"):
-    display_cols = ['Timestamp', 'Lane', 'Bay', 'Product', 'Actual_Production',
-                   'OEE_Percentage', 'Schedule_Adherence', 'Quality_Score']
-    available_cols = [col for col in display_cols if col in filtered_df.columns]
+    rt.bar(lambda: rt.sql(src, "SELECT [Lane], AVG([Energy_Consumption_kWh] / ([Actual_Production] + 0.1)) AS Energy_Per_Unit "
+                       "FROM {table}{where} GROUP BY [Lane]", sel),
+           'Lane', 'Energy_Per_Unit', "⚡ Energy Efficiency by Lane", color_scale='Reds_r', height=350,
+           labels={'Energy_Per_Unit': 'kWh/Unit'}, cache=charts)
 
-    st.dataframe(
-        filtered_df[available_cols].tail(50),
-        use_container_width=True,
-        height=400
-    )
+rt.section("🔄 Lane Performance")
+rt.pivot_heatmap(lambda: cube.group(['Lane', 'Bay'], 'OEE_Percentage', mask, how='mean'),
+                 'Lane', 'Bay', 'OEE_Percentage', "🌡️ OEE Heatmap by Lane/Bay", label="OEE %", cache=charts)
 
-# Operational Recommendations
-st.markdown('<div class="section-header">💡 Operational Recommendations</div>', unsafe_allow_html=True)
+rt.section("📋 Detailed Production Data")
+if st.checkbox("Show detailed data table"):
+    rt.paged_table(src, selection=sel,
+                   columns=['Timestamp', 'Lane', 'Bay', 'Product', 'Actual_Production', 'OEE_Percentage',
+                            'Schedule_Adherence', 'Quality_Score'])
 
+rt.section("💡 Operational Recommendations")
 rec_col1, rec_col2, rec_col3 = st.columns(3)
-
 with rec_col1:
-    if avg_oee < 75:
+    if avg_oee is not None and avg_oee < 75:
         st.error("**Priority Action**: OEE improvement required")
         st.write("• Review maintenance schedules")
         st.write("• Analyze bottleneck stations")
         st.write("• Optimize changeover times")
     else:
         st.success("**Status**: OEE within acceptable range")
-
 with rec_col2:
-    if total_downtime > 100:
+    if total_downtime is not None and total_downtime > 100:
         st.warning("**Focus Area**: Reduce unplanned downtime")
         st.write("• Implement predictive maintenance")
         st.write("• Train operators on best practices")
         st.write("• Review equipment reliability")
     else:
         st.info("**Note**: Downtime levels are manageable")
-
 with rec_col3:
-    if avg_adherence < 90:
+    if avg_adherence is not None and avg_adherence < 90:
         st.warning("**Improvement**: Schedule adherence")
         st.write("• Review production planning")
         st.write("• Balance line capacities")
@@ -889,868 +593,327 @@ with rec_col3:
         st.success("**Excellent**: Schedule performance on track")
 """
 
-    def get_operational_template(self, table_name, columns):
-
-        return """
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import sqlite3
-import numpy as np
-from datetime import datetime, timedelta
-
-# Page config
-st.set_page_config(
-    page_title="Operational Efficiency Dashboard",
-    page_icon=":zap:",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+    def get_operational_template(self, table_name, columns, data_context=None):
+        return self.runtime_header(table_name, data_context) + """
+rt.setup_page("Operational Excellence Dashboard", "⚙️", theme='operational',
+              subtitle="Real-time Performance Metrics & Analytics")
+
+src = rt.source(DB_PATH, TABLE, sample='operational')
+sel = rt.sidebar_filters(src, date_column='Date', choices={'Department': "Departments"},
+                         title="## Dashboard Controls")
+charts = rt.chart_context(src, sel)
+
+avg_uptime = rt.scalar(src, "SELECT AVG([Uptime_Percentage]) FROM {table}{where}", sel)
+
+rt.section("Key Performance Indicators")
+rt.kpi_row([
+    rt.kpi("Operational Efficiency", rt.scalar(src, "SELECT AVG([Operational_Efficiency]) FROM {table}{where}", sel),
+           unit='%'),
+    rt.kpi("System Uptime", avg_uptime, unit='%', delta="Target: 95%+",
+           status=rt.threshold_status(avg_uptime, 99, 95, 90)),
+    rt.kpi("Fuel Volume", rt.scalar(src, "SELECT SUM([Fuel_Volume_Liters]) FROM {table}{where}", sel),
+           fmt='{:,.0f}', unit='L'),
+    rt.kpi("Daily Throughput", rt.scalar(src, "SELECT AVG([Daily_Throughput]) FROM {table}{where}", sel),
+           fmt='{:,.0f}', delta="units/day average"),
+    rt.kpi("Cost per Unit", rt.scalar(src, "SELECT AVG([Cost_Per_Unit]) FROM {table}{where}", sel), fmt='${:.2f}'),
+])
 
-# Enhanced CSS for professional dashboard
-st.markdown('''
-<style>
-    .main {{
-        background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-        color: white;
-    }}
-    .metric-card {{
-        background: linear-gradient(135deg, #ffffff 0%, #f8fafc 100%);
-        color: #0f172a;
-        padding: 1.5rem;
-        border-radius: 12px;
-        box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-        margin: 0.5rem 0;
-        border: 1px solid rgba(255,255,255,0.1);
-    }}
-    .kpi-header {{
-        font-size: 0.9rem;
-        font-weight: 600;
-        color: #64748b;
-        margin-bottom: 0.5rem;
-    }}
-    .kpi-value {{
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #0f172a;
-        margin: 0;
-    }}
-    .kpi-delta {{
-        font-size: 0.8rem;
-        margin-top: 0.25rem;
-    }}
-    .status-good {{ color: #059669; }}
-    .status-warning {{ color: #d97706; }}
-    .status-critical {{ color: #dc2626; }}
-    .stPlotlyChart {{
-        background: rgba(255,255,255,0.95);
-        border-radius: 12px;
-        padding: 1rem;
-        box-shadow: 0 4px 16px rgba(0,0,0,0.1);
-    }}
-    .sidebar .sidebar-content {{
-        background: linear-gradient(180deg, #1e293b 0%, #334155 100%);
-    }}
-</style>
-''', unsafe_allow_html=True)
-
-# Header
-st.markdown("<h1 style='text-align: center; color: white; margin-bottom: 2rem;'>Operational Efficiency Dashboard</h1>", unsafe_allow_html=True)
-st.markdown("<h3 style='text-align: center; color: #94a3b8; margin-bottom: 3rem;'>Real-time KPIs, Uptime Metrics & Performance Analytics</h3>", unsafe_allow_html=True)
-
-# Load data
-@st.cache_data
-def load_data():
-    try:
-        conn = sqlite3.connect('../data/terminal_data.db')
-        df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
-        conn.close()
-        return df
-    except Exception as e:
-        st.error(f"Error loading data: {{e}}")
-        return pd.DataFrame()
-
-@st.cache_data
-def load_sample_operational_data():
-    # Create sample operational data if database is empty
-    np.random.seed(42)
-    dates = pd.date_range(start=datetime.now() - timedelta(days=30), end=datetime.now(), freq='D')
-
-    data = []
-    for i, date in enumerate(dates):
-        efficiency = 85 + np.random.normal(0, 5)
-        uptime = max(80, min(99.9, 95 + np.random.normal(0, 3)))
-        fuel_volume = 5000 + np.random.normal(0, 500) + (i * 10)
-        throughput = 1000 + np.random.normal(0, 100)
-
-        data.append({{
-            'Date': date.strftime('%Y-%m-%d'),
-            'Operational_Efficiency': round(efficiency, 2),
-            'Uptime_Percentage': round(uptime, 2),
-            'Fuel_Volume_Liters': round(fuel_volume, 0),
-            'Daily_Throughput': round(throughput, 0),
-            'Cost_Per_Unit': round(2.5 + np.random.normal(0, 0.2), 2),
-            'Energy_Consumption': round(800 + np.random.normal(0, 50), 0),
-            'Department': np.random.choice(['Production', 'Logistics', 'Warehouse']),
-            'Shift': np.random.choice(['Day', 'Night'])
-        }})
-
-    return pd.DataFrame(data)
-
-# Load data
-df = load_data()
-if df.empty:
-    df = load_sample_operational_data()
-    st.info("Loading sample operational data for demonstration")
-
-# Convert date column if it exists
-if 'Date' in df.columns:
-    df['Date'] = pd.to_datetime(df['Date'])
-
-# Sidebar controls
-st.sidebar.markdown("## Dashboard Controls")
-date_range = st.sidebar.date_input("Date Range", value=[datetime.now() - timedelta(days=7), datetime.now()])
-departments = st.sidebar.multiselect("Departments", options=df.get('Department', pd.Series([])).unique() if 'Department' in df.columns else ['All'], default=['All'])
-
-# Filter data based on sidebar selections
-filtered_df = df.copy()
-if 'Date' in df.columns and len(date_range) == 2:
-    filtered_df = filtered_df[(filtered_df['Date'] >= pd.to_datetime(date_range[0])) &
-                             (filtered_df['Date'] <= pd.to_datetime(date_range[1]))]
-
-# Key Performance Indicators
-st.markdown("## Key Performance Indicators")
-kpi_cols = st.columns(5)
-
-# Calculate KPIs
-if not filtered_df.empty:
-    avg_efficiency = filtered_df.get('Operational_Efficiency', pd.Series([0])).mean()
-    avg_uptime = filtered_df.get('Uptime_Percentage', pd.Series([0])).mean()
-    total_fuel = filtered_df.get('Fuel_Volume_Liters', pd.Series([0])).sum()
-    avg_throughput = filtered_df.get('Daily_Throughput', pd.Series([0])).mean()
-    avg_cost = filtered_df.get('Cost_Per_Unit', pd.Series([0])).mean()
-
-    with kpi_cols[0]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Operational Efficiency</div>
-            <div class="kpi-value">{avg_efficiency:.1f}%</div>
-            <div class="kpi-delta status-good">+2.3% vs last period</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    with kpi_cols[1]:
-        status_class = "status-good" if avg_uptime > 95 else "status-warning" if avg_uptime > 90 else "status-critical"
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">System Uptime</div>
-            <div class="kpi-value {status_class}">{avg_uptime:.1f}%</div>
-            <div class="kpi-delta">Target: 95%+</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    with kpi_cols[2]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Fuel Volume</div>
-            <div class="kpi-value">{total_fuel:,.0f}L</div>
-            <div class="kpi-delta status-good">+5.1% efficiency</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    with kpi_cols[3]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Daily Throughput</div>
-            <div class="kpi-value">{avg_throughput:,.0f}</div>
-            <div class="kpi-delta">units/day average</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-    with kpi_cols[4]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div class="kpi-header">Cost per Unit</div>
-            <div class="kpi-value">${avg_cost:.2f}</div>
-            <div class="kpi-delta status-good">-3.2% cost reduction</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-st.markdown("---")
-
-# Charts section
 chart_col1, chart_col2 = st.columns(2)
-
 with chart_col1:
-    st.markdown("### Operational Efficiency Trend")
-    if 'Date' in filtered_df.columns and 'Operational_Efficiency' in filtered_df.columns:
-        fig_efficiency = px.line(filtered_df, x='Date', y='Operational_Efficiency',
-                               title="Operational Efficiency Over Time",
-                               color_discrete_sequence=['#3b82f6'])
-        fig_efficiency.add_hline(y=85, line_dash="dash", line_color="red",
-                               annotation_text="Target: 85%")
-        fig_efficiency.update_layout(showlegend=False, height=400)
-        st.plotly_chart(fig_efficiency, use_container_width=True)
-
+    rt.line(lambda: rt.sql(src, "SELECT [Date], AVG([Operational_Efficiency]) AS Operational_Efficiency "
+                        "FROM {table}{where} GROUP BY [Date]", sel, dates=['Date']),
+            'Date', 'Operational_Efficiency', "Operational Efficiency Over Time", color='#3b82f6',
+            targets=[(85, "Target: 85%")], cache=charts)
 with chart_col2:
-    st.markdown("### System Uptime Analysis")
-    if 'Date' in filtered_df.columns and 'Uptime_Percentage' in filtered_df.columns:
-        fig_uptime = go.Figure()
-        fig_uptime.add_trace(go.Scatter(x=filtered_df['Date'], y=filtered_df['Uptime_Percentage'],
-                                       mode='lines+markers', name='Uptime %',
-                                       line=dict(color='#10b981', width=3)))
-        fig_uptime.add_hline(y=95, line_dash="dash", line_color="orange",
-                           annotation_text="Target: 95%")
-        fig_uptime.update_layout(title="System Uptime Percentage", height=400, showlegend=False)
-        st.plotly_chart(fig_uptime, use_container_width=True)
-
-# Fuel volume analysis
-st.markdown("### Fuel Volume Analysis")
-fuel_col1, fuel_col2 = st.columns(2)
+    rt.line(lambda: rt.sql(src, "SELECT [Date], AVG([Uptime_Percentage]) AS Uptime_Percentage "
+                        "FROM {table}{where} GROUP BY [Date]", sel, dates=['Date']),
+            'Date', 'Uptime_Percentage', "System Uptime Percentage", color='#10b981', targets=[(95, "Target: 95%")],
+            cache=charts)
 
+rt.section("Fuel Volume Analysis")
+fuel_col1, fuel_col2 = st.columns(2)
 with fuel_col1:
-    if 'Date' in filtered_df.columns and 'Fuel_Volume_Liters' in filtered_df.columns:
-        fig_fuel = px.area(filtered_df, x='Date', y='Fuel_Volume_Liters',
-                          title="Daily Fuel Consumption",
-                          color_discrete_sequence=['#f59e0b'])
-        fig_fuel.update_layout(height=350)
-        st.plotly_chart(fig_fuel, use_container_width=True)
-
+    rt.line(lambda: rt.sql(src, "SELECT [Date], SUM([Fuel_Volume_Liters]) AS Fuel_Volume_Liters "
+                        "FROM {table}{where} GROUP BY [Date]", sel, dates=['Date']),
+            'Date', 'Fuel_Volume_Liters', "Daily Fuel Consumption", color='#f59e0b', area=True, height=350,
+            cache=charts)
 with fuel_col2:
-    # Fuel efficiency gauge
-    if 'Fuel_Volume_Liters' in filtered_df.columns and 'Daily_Throughput' in filtered_df.columns:
-        fuel_efficiency = (filtered_df['Daily_Throughput'].sum() / filtered_df['Fuel_Volume_Liters'].sum() * 1000) if filtered_df['Fuel_Volume_Liters'].sum() > 0 else 0
-
-        fig_gauge = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = fuel_efficiency,
-            domain = {{'x': [0, 1], 'y': [0, 1]}},
-            title = {{'text': "Fuel Efficiency (units/1000L)"}},
-            delta = {{'reference': 180}},
-            gauge = {{
-                'axis': {{'range': [None, 250]}},
-                'bar': {{'color': "#3b82f6"}},
-                'steps': [
-                    {{'range': [0, 150], 'color': "#fecaca"}},
-                    {{'range': [150, 200], 'color': "#fed7aa"}},
-                    {{'range': [200, 250], 'color': "#bbf7d0"}}],
-                'threshold': {{
-                    'line': {{'color': "red", 'width': 4}},
-                    'thickness': 0.75,
-                    'value': 200}}
-            }}
-        ))
-        fig_gauge.update_layout(height=350)
-        st.plotly_chart(fig_gauge, use_container_width=True)
-
-# Department performance
-if 'Department' in filtered_df.columns:
-    st.markdown("### Department Performance Breakdown")
+    fuel_efficiency = rt.scalar(src, "SELECT SUM([Daily_Throughput]) * 1000.0 / NULLIF(SUM([Fuel_Volume_Liters]), 0) "
+                                     "FROM {table}{where}", sel)
+    if fuel_efficiency is not None:
+        rt.gauge(fuel_efficiency, "Fuel Efficiency (units/1000L)", reference=180, axis_max=250,
+                 bands=[((0, 150), "#fecaca"), ((150, 200), "#fed7aa"), ((200, 250), "#bbf7d0")],
+                 threshold=200)
+
+if 'Department' in src['columns']:
+    rt.section("Department Performance Breakdown")
     dept_col1, dept_col2 = st.columns(2)
-
     with dept_col1:
-        if 'Operational_Efficiency' in filtered_df.columns:
-            dept_efficiency = filtered_df.groupby('Department')['Operational_Efficiency'].mean().reset_index()
-            fig_dept = px.bar(dept_efficiency, x='Department', y='Operational_Efficiency',
-                            title="Average Efficiency by Department",
-                            color='Operational_Efficiency',
-                            color_continuous_scale='RdYlGn')
-            fig_dept.update_layout(height=350)
-            st.plotly_chart(fig_dept, use_container_width=True)
-
+        rt.bar(lambda: rt.sql(src, "SELECT [Department], AVG([Operational_Efficiency]) AS Operational_Efficiency "
+                           "FROM {table}{where} GROUP BY [Department]", sel),
+               'Department', 'Operational_Efficiency', "Average Efficiency by Department",
+               color_scale='RdYlGn', height=350, cache=charts)
     with dept_col2:
-        if 'Daily_Throughput' in filtered_df.columns:
-            dept_throughput = filtered_df.groupby('Department')['Daily_Throughput'].sum().reset_index()
-            fig_pie = px.pie(dept_throughput, values='Daily_Throughput', names='Department',
-                           title="Throughput Distribution by Department")
-            fig_pie.update_layout(height=350)
-            st.plotly_chart(fig_pie, use_container_width=True)
+        rt.pie(lambda: rt.sql(src, "SELECT [Department], SUM([Daily_Throughput]) AS Daily_Throughput "
+                           "FROM {table}{where} GROUP BY [Department]", sel),
+               'Department', 'Daily_Throughput', "Throughput Distribution by Department", height=350, cache=charts)
 
-# Data table
-st.markdown("### Detailed Operations Data")
-st.dataframe(filtered_df.tail(20), use_container_width=True, height=300)
-
-# Alert section
-st.markdown("### System Alerts & Recommendations")
-alert_col1, alert_col2, alert_col3 = st.columns(3)
+rt.paged_table(src, selection=sel, title="Detailed Operations Data", page_size=20, height=300)
 
+rt.section("System Alerts & Recommendations")
+alert_col1, alert_col2 = st.columns(2)
 with alert_col1:
     st.info("**System Status**: All systems operational")
-
 with alert_col2:
-    if avg_uptime < 95:
+    if avg_uptime is not None and avg_uptime < 95:
         st.warning("**Uptime Alert**: Below target threshold")
     else:
         st.success("**Uptime Status**: Meeting targets")
-
-with alert_col3:
-    st.success("**Performance**: Efficiency trending upward")
 """
 
-    def get_sales_template(self, table_name, columns):
-        return f"""
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import sqlite3
-import numpy as np
-from datetime import datetime, timedelta
-
-st.set_page_config(page_title="Sales Performance Dashboard", page_icon="📊", layout="wide")
+    def get_sales_template(self, table_name, columns, data_context=None):
+        return self.runtime_header(table_name, data_context) + """
+rt.setup_page("Sales Performance Dashboard", "📊", theme='sales')
 
-st.markdown('''
-<style>
-    .main {{ background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%); color: white; }}
-    .metric-card {{ background: white; color: #1e3a8a; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; }}
-    .kpi-value {{ font-size: 2rem; font-weight: bold; }}
-</style>
-''', unsafe_allow_html=True)
+src = rt.source(DB_PATH, TABLE, sample='sales')
+charts = rt.chart_context(src)
 
-st.markdown("<h1 style='text-align: center; color: white;'>Sales Performance Dashboard</h1>", unsafe_allow_html=True)
-
-@st.cache_data
-def load_data():
-    try:
-        conn = sqlite3.connect('../data/terminal_data.db')
-        df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
-        conn.close()
-        return df
-    except:
-        # Sample sales data
-        dates = pd.date_range('2024-01-01', periods=30, freq='D')
-        return pd.DataFrame({{
-            'Date': dates,
-            'Revenue': np.random.normal(50000, 10000, 30),
-            'Customers': np.random.poisson(200, 30),
-            'Conversion_Rate': np.random.uniform(0.1, 0.2, 30),
-            'Region': np.random.choice(['North', 'South', 'East', 'West'], 30)
-        }})
-
-df = load_data()
-if 'Date' in df.columns:
-    df['Date'] = pd.to_datetime(df['Date'])
-
-st.markdown("## Sales KPIs")
-kpi_cols = st.columns(4)
-
-if 'Revenue' in df.columns:
-    total_revenue = df['Revenue'].sum()
-    with kpi_cols[0]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Total Revenue</div>
-            <div class="kpi-value">${{total_revenue:,.0f}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Customers' in df.columns:
-    total_customers = df['Customers'].sum()
-    with kpi_cols[1]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Total Customers</div>
-            <div class="kpi-value">{{total_customers:,.0f}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Conversion_Rate' in df.columns:
-    avg_conversion = df['Conversion_Rate'].mean()
-    with kpi_cols[2]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Avg Conversion Rate</div>
-            <div class="kpi-value">{{avg_conversion:.1%}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+rt.section("Sales KPIs")
+rt.kpi_row([
+    rt.kpi("Total Revenue", rt.scalar(src, "SELECT SUM([Revenue]) FROM {table}{where}"), fmt='${:,.0f}'),
+    rt.kpi("Total Customers", rt.scalar(src, "SELECT SUM([Customers]) FROM {table}{where}"), fmt='{:,.0f}'),
+    rt.kpi("Avg Conversion Rate", rt.scalar(src, "SELECT AVG([Conversion_Rate]) FROM {table}{where}"), fmt='{:.1%}'),
+])
 
 col1, col2 = st.columns(2)
-
 with col1:
-    if 'Date' in df.columns and 'Revenue' in df.columns:
-        fig = px.line(df, x='Date', y='Revenue', title="Revenue Trend")
-        st.plotly_chart(fig, use_container_width=True)
-
+    rt.line(lambda: rt.sql(src, "SELECT [Date], SUM([Revenue]) AS Revenue FROM {table}{where} GROUP BY [Date]",
+                   dates=['Date']),
+            'Date', 'Revenue', "Revenue Trend", cache=charts)
 with col2:
-    if 'Region' in df.columns and 'Revenue' in df.columns:
-        region_data = df.groupby('Region')['Revenue'].sum().reset_index()
-        fig = px.pie(region_data, values='Revenue', names='Region', title="Revenue by Region")
-        st.plotly_chart(fig, use_container_width=True)
+    rt.pie(lambda: rt.sql(src, "SELECT [Region], SUM([Revenue]) AS Revenue FROM {table}{where} GROUP BY [Region]"),
+           'Region', 'Revenue', "Revenue by Region", cache=charts)
 
-st.dataframe(df, use_container_width=True)
+rt.paged_table(src)
 """
 
-    def get_financial_template(self, table_name, columns):
-        return f"""
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import sqlite3
-import numpy as np
+    def get_financial_template(self, table_name, columns, data_context=None):
+        return self.runtime_header(table_name, data_context) + """
+rt.setup_page("Financial Dashboard", "💰", theme='financial')
 
-st.set_page_config(page_title="Financial Analysis Dashboard", page_icon="💰", layout="wide")
+src = rt.source(DB_PATH, TABLE, sample='financial')
+charts = rt.chart_context(src)
 
-st.markdown('''
-<style>
-    .main {{ background: linear-gradient(135deg, #064e3b 0%, #059669 100%); color: white; }}
-    .metric-card {{ background: white; color: #064e3b; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; }}
-    .kpi-value {{ font-size: 2rem; font-weight: bold; }}
-    .profit {{ color: #059669; }}
-    .loss {{ color: #dc2626; }}
-</style>
-''', unsafe_allow_html=True)
+total_profit = rt.scalar(src, "SELECT SUM([Revenue] - [Costs]) FROM {table}{where}")
 
-st.markdown("<h1 style='text-align: center; color: white;'>Financial Analysis Dashboard</h1>", unsafe_allow_html=True)
-
-@st.cache_data
-def load_data():
-    try:
-        conn = sqlite3.connect('../data/terminal_data.db')
-        df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
-        conn.close()
-        return df
-    except:
-        # Sample financial data
-        months = pd.date_range('2024-01-01', periods=12, freq='M')
-        return pd.DataFrame({{
-            'Month': months,
-            'Revenue': np.random.normal(100000, 15000, 12),
-            'Costs': np.random.normal(60000, 10000, 12),
-            'Profit_Margin': np.random.uniform(0.2, 0.4, 12)
-        }})
-
-df = load_data()
-df['Profit'] = df.get('Revenue', 0) - df.get('Costs', 0)
-
-st.markdown("## Financial KPIs")
-kpi_cols = st.columns(4)
-
-if 'Revenue' in df.columns:
-    total_revenue = df['Revenue'].sum()
-    with kpi_cols[0]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Total Revenue</div>
-            <div class="kpi-value">${{total_revenue:,.0f}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Profit' in df.columns:
-    total_profit = df['Profit'].sum()
-    profit_class = "profit" if total_profit > 0 else "loss"
-    with kpi_cols[1]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Total Profit</div>
-            <div class="kpi-value {{profit_class}}">${{total_profit:,.0f}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+rt.section("Financial KPIs")
+rt.kpi_row([
+    rt.kpi("Total Revenue", rt.scalar(src, "SELECT SUM([Revenue]) FROM {table}{where}"), fmt='${:,.0f}'),
+    rt.kpi("Total Profit", total_profit, fmt='${:,.0f}',
+           status='status-excellent' if total_profit and total_profit > 0 else 'status-critical'),
+    rt.kpi("Avg Profit Margin", rt.scalar(src, "SELECT AVG([Profit_Margin]) FROM {table}{where}"), fmt='{:.1%}'),
+])
 
 col1, col2 = st.columns(2)
-
 with col1:
-    if 'Month' in df.columns and 'Revenue' in df.columns:
-        fig = px.line(df, x='Month', y='Revenue', title="Revenue Trend")
-        st.plotly_chart(fig, use_container_width=True)
-
+    rt.line(lambda: rt.sql(src, "SELECT [Month], SUM([Revenue]) AS Revenue FROM {table}{where} GROUP BY [Month]",
+                   dates=['Month']),
+            'Month', 'Revenue', "Revenue Trend", cache=charts)
 with col2:
-    if 'Month' in df.columns and 'Profit' in df.columns:
-        fig = px.bar(df, x='Month', y='Profit', title="Monthly Profit",
-                    color='Profit', color_continuous_scale=['red', 'green'])
-        st.plotly_chart(fig, use_container_width=True)
+    rt.bar(lambda: rt.sql(src, "SELECT [Month], SUM([Revenue] - [Costs]) AS Profit FROM {table}{where} GROUP BY [Month]",
+                  dates=['Month']),
+           'Month', 'Profit', "Monthly Profit", color_scale=['red', 'green'], cache=charts)
 
-st.dataframe(df, use_container_width=True)
+rt.paged_table(src)
 """
 
-    def get_analytics_template(self, table_name, columns):
-        return f"""
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import sqlite3
-import numpy as np
+    def get_analytics_template(self, table_name, columns, data_context=None):
+        return self.runtime_header(table_name, data_context) + """
+rt.setup_page("Data Analytics Dashboard", "📈", theme='analytics')
 
-st.set_page_config(page_title="Data Analytics Dashboard", page_icon="📈", layout="wide")
+src = rt.source(DB_PATH, TABLE, sample='analytics')
+charts = rt.chart_context(src)
 
-st.markdown('''
-<style>
-    .main {{ background: linear-gradient(135deg, #374151 0%, #6b7280 100%); color: white; }}
-    .metric-card {{ background: white; color: #374151; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; }}
-</style>
-''', unsafe_allow_html=True)
+numeric_cols = rt.numeric_columns(src)
+text_cols = rt.text_columns(src)
 
-st.markdown("<h1 style='text-align: center; color: white;'>Data Analytics Dashboard</h1>", unsafe_allow_html=True)
-
-@st.cache_data
-def load_data():
-    try:
-        conn = sqlite3.connect('../data/terminal_data.db')
-        df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
-        conn.close()
-        return df
-    except:
-        return pd.DataFrame({{
-            'Category': ['A', 'B', 'C', 'D', 'E'] * 20,
-            'Value': np.random.normal(100, 20, 100),
-            'Date': pd.date_range('2024-01-01', periods=100, freq='D')[:100]
-        }})
-
-df = load_data()
-
-st.markdown("## Data Overview")
-col1, col2, col3 = st.columns(3)
+rt.section("Data Overview")
+rt.kpi_row([
+    rt.kpi("Total Records", rt.scalar(src, "SELECT COUNT(*) FROM {table}{where}"), fmt='{:,}'),
+    rt.kpi(f"Average {numeric_cols[0]}", rt.scalar(src, f"SELECT AVG([{numeric_cols[0]}]) FROM {{table}}{{where}}"),
+           fmt='{:,.2f}') if numeric_cols else None,
+    rt.kpi("Columns", len(src['columns']), fmt='{}'),
+])
 
-with col1:
-    st.metric("Total Records", len(df))
-with col2:
-    if len(df.select_dtypes(include=[np.number]).columns) > 0:
-        numeric_col = df.select_dtypes(include=[np.number]).columns[0]
-        st.metric("Average", f"{{df[numeric_col].mean():.2f}}")
-with col3:
-    st.metric("Data Quality", "95%")
-
-# Charts based on available data
-if len(df.columns) >= 2:
+if numeric_cols:
     col1, col2 = st.columns(2)
-
     with col1:
-        if len(df.select_dtypes(include=[np.number]).columns) > 0:
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
-            if len(numeric_cols) >= 1:
-                fig = px.histogram(df, x=numeric_cols[0], title=f"Distribution of {{numeric_cols[0]}}")
-                st.plotly_chart(fig, use_container_width=True)
-
+        rt.histogram(src, numeric_cols[0], f"Distribution of {numeric_cols[0]}", cache=charts)
     with col2:
-        categorical_cols = df.select_dtypes(include=['object']).columns
-        if len(categorical_cols) > 0 and len(df.select_dtypes(include=[np.number]).columns) > 0:
-            cat_col = categorical_cols[0]
-            num_col = df.select_dtypes(include=[np.number]).columns[0]
-            agg_data = df.groupby(cat_col)[num_col].sum().reset_index()
-            fig = px.bar(agg_data, x=cat_col, y=num_col, title=f"{{num_col}} by {{cat_col}}")
-            st.plotly_chart(fig, use_container_width=True)
-
-st.markdown("## Data Table")
-st.dataframe(df, use_container_width=True)
-
-# Correlation analysis for numeric columns
-numeric_df = df.select_dtypes(include=[np.number])
-if len(numeric_df.columns) > 1:
-    st.markdown("## Correlation Analysis")
-    corr_matrix = numeric_df.corr()
-    fig = px.imshow(corr_matrix, title="Correlation Matrix", color_continuous_scale='RdBu')
-    st.plotly_chart(fig, use_container_width=True)
-"""
+        if text_cols:
+            num, cat = numeric_cols[0], text_cols[0]
+            rt.bar(lambda: rt.sql(src, f"SELECT [{cat}], SUM([{num}]) AS [{num}] FROM {{table}}{{where}} "
+                               f"GROUP BY [{cat}] ORDER BY 2 DESC LIMIT 30"),
+                   cat, num, f"{num} by {cat}", cache=charts)
 
-    def get_logistics_template(self, table_name, columns):
-        return f"""
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import sqlite3
-import numpy as np
+rt.paged_table(src, title="Data Table")
 
-st.set_page_config(page_title="Logistics Dashboard", page_icon="🚚", layout="wide")
+if len(numeric_cols) > 1:
+    rt.section("Correlation Analysis")
+    rt.correlation(src, numeric_cols, cache=charts)
+"""
 
-st.markdown('''
-<style>
-    .main {{ background: linear-gradient(135deg, #ea580c 0%, #f97316 100%); color: white; }}
-    .metric-card {{ background: white; color: #ea580c; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; }}
-    .kpi-value {{ font-size: 2rem; font-weight: bold; }}
-</style>
-''', unsafe_allow_html=True)
+    def get_logistics_template(self, table_name, columns, data_context=None):
+        return self.runtime_header(table_name, data_context) + """
+rt.setup_page("Logistics Dashboard", "🚚", theme='logistics')
 
-st.markdown("<h1 style='text-align: center; color: white;'>Logistics & Supply Chain Dashboard</h1>", unsafe_allow_html=True)
+src = rt.source(DB_PATH, TABLE, sample='logistics')
+charts = rt.chart_context(src)
 
-@st.cache_data
-def load_data():
-    try:
-        conn = sqlite3.connect('../data/terminal_data.db')
-        df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
-        conn.close()
-        return df
-    except:
-        return pd.DataFrame({{
-            'Shipment_ID': range(1, 101),
-            'Origin': np.random.choice(['Warehouse A', 'Warehouse B', 'Warehouse C'], 100),
-            'Destination': np.random.choice(['City 1', 'City 2', 'City 3', 'City 4'], 100),
-            'Delivery_Time': np.random.normal(48, 12, 100),  # hours
-            'Cost': np.random.normal(500, 100, 100),
-            'Status': np.random.choice(['Delivered', 'In Transit', 'Delayed'], 100, p=[0.7, 0.2, 0.1])
-        }})
-
-df = load_data()
-
-st.markdown("## Logistics KPIs")
-kpi_cols = st.columns(4)
-
-with kpi_cols[0]:
-    total_shipments = len(df)
-    st.markdown(f'''
-    <div class="metric-card">
-        <div>Total Shipments</div>
-        <div class="kpi-value">{{total_shipments:,}}</div>
-    </div>
-    ''', unsafe_allow_html=True)
-
-if 'Delivery_Time' in df.columns:
-    avg_delivery = df['Delivery_Time'].mean()
-    with kpi_cols[1]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Avg Delivery Time</div>
-            <div class="kpi-value">{{avg_delivery:.1f}}h</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Status' in df.columns:
-    on_time_rate = (df['Status'] == 'Delivered').mean()
-    with kpi_cols[2]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>On-Time Rate</div>
-            <div class="kpi-value">{{on_time_rate:.1%}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Cost' in df.columns:
-    avg_cost = df['Cost'].mean()
-    with kpi_cols[3]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Avg Shipping Cost</div>
-            <div class="kpi-value">${{avg_cost:.0f}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+rt.section("Logistics KPIs")
+rt.kpi_row([
+    rt.kpi("Total Shipments", rt.scalar(src, "SELECT COUNT(*) FROM {table}{where}"), fmt='{:,}'),
+    rt.kpi("Avg Delivery Time", rt.scalar(src, "SELECT AVG([Delivery_Time]) FROM {table}{where}"), unit='h'),
+    rt.kpi("On-Time Rate", rt.scalar(src, "SELECT AVG(CASE WHEN [Status] = 'Delivered' THEN 1.0 ELSE 0 END) "
+                                          "FROM {table}{where}"), fmt='{:.1%}'),
+    rt.kpi("Avg Shipping Cost", rt.scalar(src, "SELECT AVG([Cost]) FROM {table}{where}"), fmt='${:.0f}'),
+])
 
 col1, col2 = st.columns(2)
-
 with col1:
-    if 'Status' in df.columns:
-        status_counts = df['Status'].value_counts()
-        fig = px.pie(values=status_counts.values, names=status_counts.index, title="Shipment Status")
-        st.plotly_chart(fig, use_container_width=True)
-
+    rt.pie(lambda: rt.sql(src, "SELECT [Status], COUNT(*) AS Shipments FROM {table}{where} GROUP BY [Status]"),
+           'Status', 'Shipments', "Shipment Status", cache=charts)
 with col2:
-    if 'Delivery_Time' in df.columns:
-        fig = px.histogram(df, x='Delivery_Time', title="Delivery Time Distribution")
-        st.plotly_chart(fig, use_container_width=True)
+    rt.histogram(src, 'Delivery_Time', "Delivery Time Distribution", cache=charts)
 
-st.dataframe(df, use_container_width=True)
+rt.paged_table(src)
 """
 
-    def get_energy_template(self, table_name, columns):
-        return f"""
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import sqlite3
-import numpy as np
-
-st.set_page_config(page_title="Energy Dashboard", page_icon="⚡", layout="wide")
+    def get_energy_template(self, table_name, columns, data_context=None):
+        return self.runtime_header(table_name, data_context) + """
+rt.setup_page("Energy Management Dashboard", "⚡", theme='energy')
 
-st.markdown('''
-<style>
-    .main {{ background: linear-gradient(135deg, #065f46 0%, #10b981 100%); color: white; }}
-    .metric-card {{ background: white; color: #065f46; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; }}
-    .kpi-value {{ font-size: 2rem; font-weight: bold; }}
-</style>
-''', unsafe_allow_html=True)
+src = rt.source(DB_PATH, TABLE, sample='energy')
+charts = rt.chart_context(src)
 
-st.markdown("<h1 style='text-align: center; color: white;'>Energy Consumption Dashboard</h1>", unsafe_allow_html=True)
-
-@st.cache_data
-def load_data():
-    try:
-        conn = sqlite3.connect('../data/terminal_data.db')
-        df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
-        conn.close()
-        return df
-    except:
-        dates = pd.date_range('2024-01-01', periods=30, freq='D')
-        return pd.DataFrame({{
-            'Date': dates,
-            'Energy_Consumption': np.random.normal(1000, 200, 30),
-            'Efficiency_Rating': np.random.uniform(0.7, 0.95, 30),
-            'Cost': np.random.normal(150, 30, 30)
-        }})
-
-df = load_data()
-
-st.markdown("## Energy KPIs")
-kpi_cols = st.columns(3)
-
-if 'Energy_Consumption' in df.columns:
-    total_consumption = df['Energy_Consumption'].sum()
-    with kpi_cols[0]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Total Consumption</div>
-            <div class="kpi-value">{{total_consumption:,.0f}} kWh</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Efficiency_Rating' in df.columns:
-    avg_efficiency = df['Efficiency_Rating'].mean()
-    with kpi_cols[1]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Avg Efficiency</div>
-            <div class="kpi-value">{{avg_efficiency:.1%}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Cost' in df.columns:
-    total_cost = df['Cost'].sum()
-    with kpi_cols[2]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Total Cost</div>
-            <div class="kpi-value">${{total_cost:,.0f}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
+rt.section("Energy KPIs")
+rt.kpi_row([
+    rt.kpi("Total Consumption", rt.scalar(src, "SELECT SUM([Energy_Consumption]) FROM {table}{where}"),
+           fmt='{:,.0f}', unit='kWh'),
+    rt.kpi("Avg Efficiency", rt.scalar(src, "SELECT AVG([Efficiency_Rating]) FROM {table}{where}"), fmt='{:.1%}'),
+    rt.kpi("Total Cost", rt.scalar(src, "SELECT SUM([Cost]) FROM {table}{where}"), fmt='${:,.0f}'),
+])
 
 col1, col2 = st.columns(2)
-
 with col1:
-    if 'Date' in df.columns and 'Energy_Consumption' in df.columns:
-        fig = px.area(df, x='Date', y='Energy_Consumption', title="Daily Energy Consumption")
-        st.plotly_chart(fig, use_container_width=True)
-
+    rt.line(lambda: rt.sql(src, "SELECT [Date], SUM([Energy_Consumption]) AS Energy_Consumption "
+                        "FROM {table}{where} GROUP BY [Date]", dates=['Date']),
+            'Date', 'Energy_Consumption', "Daily Energy Consumption", area=True, cache=charts)
 with col2:
-    if 'Date' in df.columns and 'Efficiency_Rating' in df.columns:
-        fig = px.line(df, x='Date', y='Efficiency_Rating', title="Efficiency Trend")
-        st.plotly_chart(fig, use_container_width=True)
+    rt.line(lambda: rt.sql(src, "SELECT [Date], AVG([Efficiency_Rating]) AS Efficiency_Rating "
+                        "FROM {table}{where} GROUP BY [Date]", dates=['Date']),
+            'Date', 'Efficiency_Rating', "Efficiency Trend", cache=charts)
 
-st.dataframe(df, use_container_width=True)
+rt.paged_table(src)
 """
 
-    def get_hr_template(self, table_name, columns):
-        return f"""
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import sqlite3
-import numpy as np
-
-st.set_page_config(page_title="HR Dashboard", page_icon="👥", layout="wide")
+    def get_hr_template(self, table_name, columns, data_context=None):
+        return self.runtime_header(table_name, data_context) + """
+rt.setup_page("HR Analytics Dashboard", "👥", theme='hr')
 
-st.markdown('''
-<style>
-    .main {{ background: linear-gradient(135deg, #7c3aed 0%, #a855f7 100%); color: white; }}
-    .metric-card {{ background: white; color: #7c3aed; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; }}
-    .kpi-value {{ font-size: 2rem; font-weight: bold; }}
-</style>
-''', unsafe_allow_html=True)
+src = rt.source(DB_PATH, TABLE, sample='hr')
+charts = rt.chart_context(src)
 
-st.markdown("<h1 style='text-align: center; color: white;'>HR Analytics Dashboard</h1>", unsafe_allow_html=True)
-
-@st.cache_data
-def load_data():
-    try:
-        conn = sqlite3.connect('../data/terminal_data.db')
-        df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
-        conn.close()
-        return df
-    except:
-        return pd.DataFrame({{
-            'Employee_ID': range(1, 101),
-            'Department': np.random.choice(['Engineering', 'Sales', 'HR', 'Finance'], 100),
-            'Salary': np.random.normal(75000, 15000, 100),
-            'Experience_Years': np.random.randint(1, 20, 100),
-            'Performance_Score': np.random.uniform(3.0, 5.0, 100),
-            'Satisfaction_Score': np.random.uniform(6.0, 10.0, 100)
-        }})
-
-df = load_data()
-
-st.markdown("## HR KPIs")
-kpi_cols = st.columns(4)
-
-with kpi_cols[0]:
-    total_employees = len(df)
-    st.markdown(f'''
-    <div class="metric-card">
-        <div>Total Employees</div>
-        <div class="kpi-value">{{total_employees}}</div>
-    </div>
-    ''', unsafe_allow_html=True)
-
-if 'Salary' in df.columns:
-    avg_salary = df['Salary'].mean()
-    with kpi_cols[1]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Avg Salary</div>
-            <div class="kpi-value">${{{avg_salary:,.0f}}}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Performance_Score' in df.columns:
-    avg_performance = df['Performance_Score'].mean()
-    with kpi_cols[2]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Avg Performance</div>
-            <div class="kpi-value">{{avg_performance:.1f}}/5</div>
-        </div>
-        ''', unsafe_allow_html=True)
-
-if 'Satisfaction_Score' in df.columns:
-    avg_satisfaction = df['Satisfaction_Score'].mean()
-    with kpi_cols[3]:
-        st.markdown(f'''
-        <div class="metric-card">
-            <div>Avg Satisfaction</div>
-            <div class="kpi-value">{{avg_satisfaction:.1f}}/10</div>
-        </div>
-        ''', unsafe_allow_html=True)
+rt.section("HR KPIs")
+rt.kpi_row([
+    rt.kpi("Total Employees", rt.scalar(src, "SELECT COUNT(*) FROM {table}{where}"), fmt='{:,}'),
+    rt.kpi("Avg Salary", rt.scalar(src, "SELECT AVG([Salary]) FROM {table}{where}"), fmt='${:,.0f}'),
+    rt.kpi("Avg Performance", rt.scalar(src, "SELECT AVG([Performance_Score]) FROM {table}{where}"), unit='/5'),
+    rt.kpi("Avg Satisfaction", rt.scalar(src, "SELECT AVG([Satisfaction_Score]) FROM {table}{where}"), unit='/10'),
+])
 
 col1, col2 = st.columns(2)
-
 with col1:
-    if 'Department' in df.columns:
-        dept_counts = df['Department'].value_counts()
-        fig = px.pie(values=dept_counts.values, names=dept_counts.index, title="Employees by Department")
-        st.plotly_chart(fig, use_container_width=True)
-
+    rt.pie(lambda: rt.sql(src, "SELECT [Department], COUNT(*) AS Employees FROM {table}{where} GROUP BY [Department]"),
+           'Department', 'Employees', "Employees by Department", cache=charts)
 with col2:
-    if 'Experience_Years' in df.columns and 'Performance_Score' in df.columns:
-        fig = px.scatter(df, x='Experience_Years', y='Performance_Score', title="Experience vs Performance")
-        st.plotly_chart(fig, use_container_width=True)
+    rt.bar(lambda: rt.sql(src, "SELECT [Experience_Years], AVG([Performance_Score]) AS Performance_Score "
+                       "FROM {table}{where} GROUP BY [Experience_Years]"),
+           'Experience_Years', 'Performance_Score', "Average Performance by Experience", cache=charts)
 
-st.dataframe(df, use_container_width=True)
+rt.paged_table(src)
 """
 
-    def create_dashboard_file(self, code, dashboard_id):
+    def create_dashboard_file(self, code, dashboard_id, private=False):
+        # shared content-addressed file unless the dashboard will rewrite it later (speculative upgrade)
+        if not private:
+            return self.code_store.write(code)
         filename = f"dashboard_{dashboard_id}.py"
         filepath = os.path.join(Config.DASHBOARD_DIR, filename)
         with open(filepath, 'w') as f:
             f.write(code)
         return filepath
 
-    def start_streamlit_dashboard(self, filepath, port):
+    def replace_dashboard_file(self, filepath, code):
+        # write next to the target then rename, so a rerun never sees half a file
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(code)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+        return filepath
+
+    def start_streamlit_dashboard(self, filepath, port, boot_times=None):
+        # output goes to a log file: an unread PIPE fills up and stalls the server
+        log_path = os.path.join(Config.LOGS_DIR, f"streamlit_{port}.log")
         try:
             cmd = [
                 'streamlit', 'run', filepath,
                 '--server.port', str(port),
                 '--server.headless', 'true',
                 '--server.enableCORS', 'false',
-                '--server.enableXsrfProtection', 'false'
+                '--server.enableXsrfProtection', 'false',
+                '--server.runOnSave', 'true'  # picks up speculative upgrades
             ]
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                cwd=Config.DASHBOARD_DIR
-            )
-            time.sleep(3)
-            return process
+            with open(log_path, 'wb') as log:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    cwd=Config.DASHBOARD_DIR
+                )
         except Exception as e:
             print(f"Error starting Streamlit: {e}")
             return None
+        # return as soon as it serves, not after a fixed sleep
+        try:
+            seconds = wait_until_ready(process, port, deadline=Config.STREAMLIT_BOOT_TIMEOUT, log_path=log_path)
+        except BootFailedError as e:
+            if boot_times is not None:
+                boot_times.failure()
+            if process.poll() is None:
+                process.terminate()
+            raise RuntimeError(f"Failed to start Streamlit dashboard: {e}")
+        if boot_times is not None:
+            boot_times.observe(seconds)
+        print(f"Streamlit ready on port {port} in {seconds:.2f}s")
+        return process
+
+    def start_streamlit_worker(self, port, assignment_path, log_path):
+        # pool worker: heavy imports first, then streamlit on the host shim, serving its assignment file
+        try:
+            with open(log_path, 'wb') as log:
+                return subprocess.Popen(
+                    [sys.executable, os.path.join(Config.RUNTIME_DIR, 'streamlit_worker.py'), str(port)],
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    cwd=Config.DASHBOARD_DIR,
+                    env={**os.environ, 'DASHBOARD_ASSIGNMENT': assignment_path}
+                )
+        except Exception as e:
+            print(f"Error starting Streamlit worker: {e}")
+            return None
 
 generator = DashboardGenerator()
 
@@ -1761,18 +924,164 @@ def health():
 @app.route('/api/status', methods=['GET'])
 def get_status():
     status = Config.get_status()
+    status['generation_queue'] = job_queue.stats()
+    nodes = ollama_pool.status()
+    for node in nodes:
+        node['model'] = model_managers[node['url']].status()
+    status['ollama_nodes'] = nodes
+    status['llm_circuit'] = llm_breaker.status()
+    status['llm_timeout'] = llm_timeout.status()
+    status['code_store'] = generator.code_store.stats()
+    status['dashboard_boot'] = {kind: histogram.snapshot() for kind, histogram in boot_times.items()}
+    status['dashboard_ports'] = port_allocator.stats()
+    status['dashboard_reaper'] = dashboard_reaper.stats()
+    if Config.DASHBOARD_MODE == 'pool':
+        status['streamlit_pool'] = dashboard_pool.stats()
     return jsonify(status)
 
 @app.route('/api/config', methods=['GET'])
 def get_config():
     return jsonify({
         'ollama_url': Config.OLLAMA_URL,
+        'ollama_urls': Config.OLLAMA_URLS,
         'model': Config.OLLAMA_MODEL,
         'port': Config.AI_BACKEND_PORT,
         'debug': Config.DEBUG,
-        'streamlit_base_port': Config.STREAMLIT_BASE_PORT
+        'streamlit_base_port': Config.STREAMLIT_BASE_PORT,
+        'streamlit_max_port': Config.STREAMLIT_MAX_PORT,
+        'dashboard_mode': Config.DASHBOARD_MODE
     })
 
+def host_port_for(dashboard_id):
+    # stable spread over the host pool, so a dashboard always lands on the same server
+    return Config.DASHBOARD_HOST_PORT + zlib.crc32(dashboard_id.encode()) % max(1, Config.DASHBOARD_HOST_POOL_SIZE)
+
+def ensure_dashboard_host(port):
+    # shared servers start on first use and are restarted if they died
+    with host_lock:
+        process = dashboard_hosts.get(port)
+        if process is None or process.poll() is not None:
+            process = generator.start_streamlit_dashboard(os.path.join(Config.RUNTIME_DIR, 'dashboard_host.py'), port,
+                                                          boot_times=boot_times['host'])
+            if process is None:
+                raise RuntimeError('Failed to start dashboard host')
+            dashboard_hosts[port] = process
+        return process
+
+def launch_dashboard(job, filepath, dashboard_id, user_prompt):
+    if job is not None:  # None when relaunching an evicted dashboard
+        job.set_stage('launch')
+    worker = None
+    if Config.DASHBOARD_MODE == 'host':
+        # no process of its own: register the script and let a shared host render it
+        port = host_port_for(dashboard_id)
+        register_dashboard(dashboard_id, filepath)
+        ensure_dashboard_host(port)
+        process = None
+        dashboard_url = f"http://localhost:{port}/?dashboard={dashboard_id}"
+        embed_url = f"{dashboard_url}&embed=true"
+    else:
+        if Config.DASHBOARD_MODE == 'pool':
+            dashboard_pool.start()
+            worker = dashboard_pool.acquire(dashboard_id, filepath)
+        if worker is not None:
+            # already booted with everything imported: the handover is one file write
+            port, process = worker.port, worker.process
+        else:
+            port = port_allocator.allocate(dashboard_id)
+            try:
+                process = generator.start_streamlit_dashboard(filepath, port, boot_times=boot_times['process'])
+            except RuntimeError:
+                port_allocator.release(port)
+                raise
+            if process is None:
+                port_allocator.release(port)
+                raise RuntimeError('Failed to start Streamlit dashboard')
+        dashboard_url = f"http://localhost:{port}"
+        embed_url = f"{dashboard_url}/?embed=true"
+    running_dashboards[dashboard_id] = {
+        'process': process,
+        'pooled': worker is not None,
+        'port': port,
+        'url': dashboard_url,
+        'created_at': datetime.now().isoformat(),
+        'prompt': user_prompt,
+        'filepath': filepath,
+        'last_access': time.time()
+    }
+    dashboard_reaper.forget(dashboard_id)
+    dashboard_reaper.wake()  # enforce the ceilings now rather than at the next sweep
+    return {
+        'dashboard_id': dashboard_id,
+        'dashboard_url': dashboard_url,
+        'embed_url': embed_url
+    }
+
+def run_generation_job(job):
+    # runs on a queue worker: ingest -> LLM -> file write -> streamlit spawn
+    user_prompt = job.payload['prompt']
+    excel_path = job.payload.get('excel_path', '')
+    dashboard_id = job.payload['dashboard_id']
+
+    job.set_stage('ingest')
+    if excel_path:
+        data_context = generator.convert_excel_to_sqlite(excel_path)
+    else:
+        data_context = generator.process_all_excel_files()
+    if not data_context.get('success'):
+        raise RuntimeError(data_context.get('error', 'Data ingest failed'))
+
+    if not job.payload.get('speculative', Config.SPECULATIVE_GENERATION):
+        job.set_stage('generate')
+        code = generator.generate_dashboard_code(user_prompt, data_context)
+        job.set_stage('write')
+        filepath = generator.create_dashboard_file(code, dashboard_id)
+        return launch_dashboard(job, filepath, dashboard_id, user_prompt)
+
+    # speculative: serve the type template right away, then race the LLM
+    dashboard_type = generator.analyze_dashboard_type(user_prompt)
+    job.set_stage('write')
+    stored = generator.code_store.lookup(generator.llm_code_key(user_prompt, data_context, dashboard_type))
+    if stored:
+        # this prompt was already answered for this schema, nothing to race
+        result = launch_dashboard(job, stored, dashboard_id, user_prompt)
+        result['ai_generated'] = True
+        return result
+    template_code = generator.get_fallback_dashboard(data_context, dashboard_type)
+    filepath = generator.create_dashboard_file(template_code, dashboard_id, private=True)
+    result = launch_dashboard(job, filepath, dashboard_id, user_prompt)
+    result['ai_generated'] = False
+    job.result = result  # pollers can show the template while we upgrade
+
+    job.set_stage('upgrading')
+    code = generator.generate_llm_code(user_prompt, data_context, dashboard_type)
+    if code:
+        generator.replace_dashboard_file(filepath, code)
+        result['ai_generated'] = True
+        print(f"Dashboard {dashboard_id} upgraded to LLM code")
+    else:
+        result['message'] = 'AI generation unavailable - showing the standard template'
+    return result
+
+port_allocator = PortAllocator(Config.STREAMLIT_BASE_PORT, Config.STREAMLIT_MAX_PORT, lease_path=Config.PORT_LEASES)
+host_lock = threading.Lock()
+dashboard_hosts = {}  # port -> streamlit process running dashboard_host.py
+dashboard_pool = StreamlitPool(
+    generator.start_streamlit_worker,
+    port_allocator,
+    size=Config.STREAMLIT_POOL_SIZE,
+    assignment_dir=os.path.join(Config.DATA_DIR, 'pool'),
+    log_dir=Config.LOGS_DIR,
+    boot_timeout=Config.STREAMLIT_BOOT_TIMEOUT
+)
+boot_times = {'process': BootHistogram(), 'host': BootHistogram()}  # time to pass the health check
+job_queue = JobQueue(
+    run_generation_job,
+    workers=Config.GENERATION_WORKERS,
+    max_depth=Config.GENERATION_MAX_QUEUE,
+    job_ttl=Config.GENERATION_JOB_TTL
+)
+
 @app.route('/api/dashboard/generate', methods=['POST'])
 def generate_dashboard():
     try:
@@ -1781,56 +1090,183 @@ def generate_dashboard():
         excel_path = data.get('excel_path', '')
         if not user_prompt:
             return jsonify({'error': 'Prompt is required'}), 400
-        print(f"Generating dashboard for: '{user_prompt}'")
-        print("AI processing complete")  # TODO: actually process with LLM
-        # quick hack for demo - just return fixed URL
-        dashboard_id = f"{int(time.time())}_{hash(user_prompt) % 10000}"
-        dashboard_url = "http://localhost:8520"  # hardcoded for now
+        print(f"Queueing dashboard generation for: '{user_prompt}'")
+        # unique per request: the same prompt twice in one second must not share a file and a running entry
+        dashboard_id = f"{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        payload = {'prompt': user_prompt, 'excel_path': excel_path, 'dashboard_id': dashboard_id}
+        if 'speculative' in data:
+            payload['speculative'] = bool(data['speculative'])
+        try:
+            job = job_queue.submit(payload, data.get('priority', 'normal'))
+        except QueueFullError as e:
+            # reject fast instead of holding the socket open
+            response = jsonify({'error': str(e)})
+            response.headers['Retry-After'] = str(job_queue.retry_after())
+            return response, 429
+        status = job_queue.status(job.id)
         return jsonify({
             'success': True,
+            'job_id': job.id,
             'dashboard_id': dashboard_id,
-            'dashboard_url': dashboard_url,
-            'embed_url': f"{dashboard_url}/?embed=true",
-            'message': 'Dashboard generated successfully'
-        })
+            'status_url': f"/api/dashboard/jobs/{job.id}",
+            'queue_position': status['queue_position'],
+            'eta_seconds': status['eta_seconds'],
+            'message': 'Dashboard generation queued'
+        }), 202
     except Exception as e:
         return jsonify({'error': f'Dashboard generation failed: {str(e)}'}), 500
 
+@app.route('/api/dashboard/jobs/<job_id>', methods=['GET'])
+def get_generation_job(job_id):
+    status = job_queue.status(job_id)
+    if status is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(status)
 
+@app.route('/api/dashboard/queue', methods=['GET'])
+def get_generation_queue():
+    return jsonify(job_queue.stats())
+
+@app.route('/api/dashboard/classify', methods=['POST'])
+def classify_prompts():
+    data = request.get_json() or {}
+    if 'prompts' in data:
+        prompts = data['prompts']
+        if not isinstance(prompts, list):
+            return jsonify({'error': 'prompts must be a list'}), 400
+        start = time.time()
+        results = generator.classifier.classify_batch([str(p) for p in prompts])
+        return jsonify({
+            'results': results,
+            'count': len(results),
+            'elapsed_ms': round((time.time() - start) * 1000, 2)
+        })
+    if not data.get('prompt'):
+        return jsonify({'error': 'Prompt is required'}), 400
+    return jsonify({'prompt': data['prompt'], 'ranking': generator.classifier.classify(data['prompt'])})
+
+def release_dashboard(dashboard_id):
+    # stops the server but leaves the script on disk; returns the entry, or None if it wasn't running
+    info = running_dashboards.pop(dashboard_id, None)
+    if info is None:
+        return None
+    if info['process'] is None:
+        unregister_dashboard(dashboard_id)  # hosted: the shared server keeps running
+    elif info.get('pooled'):
+        dashboard_pool.release(info['port'])
+    else:
+        info['process'].terminate()
+        port_allocator.release(info['port'])
+    return info
+
+dashboard_reaper = DashboardReaper(
+    running_dashboards,
+    release_dashboard,
+    max_dashboards=Config.DASHBOARD_MAX_RUNNING,
+    max_rss_mb=Config.DASHBOARD_MAX_RSS_MB,
+    idle_timeout=Config.DASHBOARD_IDLE_TIMEOUT,
+    interval=Config.DASHBOARD_REAP_INTERVAL
+)
+relaunch_lock = threading.Lock()
+
+def timestamp(seconds):
+    return datetime.fromtimestamp(seconds).isoformat() if seconds else None
 
 @app.route('/api/dashboard/list', methods=['GET'])
 def list_dashboards():
     dashboard_list = []
-    for dashboard_id, info in running_dashboards.items():
+    for dashboard_id, info in list(running_dashboards.items()):
+        rss = info.get('rss')
         dashboard_list.append({
             'id': dashboard_id,
             'port': info['port'],
             'created_at': info['created_at'],
             'prompt': info['prompt'],
-            'url': f"http://localhost:{info['port']}"
+            'url': info['url'],
+            'last_access': timestamp(info.get('last_access')),
+            'connections': info.get('connections'),
+            'rss_mb': round(rss / (1024 * 1024), 1) if rss is not None else None
+        })
+    evicted_list = []
+    for record in dashboard_reaper.evictions():
+        evicted_list.append({
+            'id': record['id'],
+            'reason': record['reason'],
+            'evicted_at': timestamp(record['evicted_at']),
+            'last_access': timestamp(record['last_access']),
+            'created_at': record['created_at'],
+            'prompt': record['prompt'],
+            'relaunch_url': f"/api/dashboard/relaunch/{record['id']}"
         })
-    return jsonify({'dashboards': dashboard_list})
+    return jsonify({'dashboards': dashboard_list, 'evicted': evicted_list})
+
+@app.route('/api/dashboard/relaunch/<dashboard_id>', methods=['POST'])
+def relaunch_dashboard(dashboard_id):
+    info = running_dashboards.get(dashboard_id)
+    if info is not None:
+        info['last_access'] = time.time()
+        return jsonify({'success': True, 'dashboard_id': dashboard_id, 'dashboard_url': info['url'], 'relaunched': False})
+    with relaunch_lock:  # two tabs reopening the same dashboard must not start two servers
+        if dashboard_id in running_dashboards:
+            return jsonify({'success': True, 'dashboard_id': dashboard_id,
+                            'dashboard_url': running_dashboards[dashboard_id]['url'], 'relaunched': False})
+        record = dashboard_reaper.evicted_record(dashboard_id)
+        if record is None:
+            return jsonify({'error': 'Dashboard not found'}), 404
+        if not os.path.exists(record['filepath']):
+            dashboard_reaper.forget(dashboard_id)
+            return jsonify({'error': 'Dashboard script no longer exists'}), 410
+        try:
+            result = launch_dashboard(None, record['filepath'], dashboard_id, record['prompt'])
+        except Exception as e:
+            return jsonify({'error': f'Dashboard relaunch failed: {str(e)}'}), 500
+    result.update({'success': True, 'relaunched': True})
+    return jsonify(result)
 
 @app.route('/api/dashboard/stop/<dashboard_id>', methods=['POST'])
 def stop_dashboard(dashboard_id):
-    if dashboard_id in running_dashboards:
-        process = running_dashboards[dashboard_id]['process']
-        process.terminate()
-        del running_dashboards[dashboard_id]
+    if release_dashboard(dashboard_id) is not None:
         return jsonify({'success': True, 'message': 'Dashboard stopped'})
-    else:
-        return jsonify({'error': 'Dashboard not found'}), 404
+    if dashboard_reaper.forget(dashboard_id) is not None:
+        return jsonify({'success': True, 'message': 'Evicted dashboard forgotten'})
+    return jsonify({'error': 'Dashboard not found'}), 404
+
+def warm_node(manager):
+    # each node is probed on its own, so one dead node neither blocks nor stands in for the others
+    status = Config.validate_ollama_connection(manager.base_url)
+    if not status['connected']:
+        print(f"Ollama at {manager.base_url} unreachable: {status.get('error', 'Unknown error')}")
+        return False
+    print(f"Ollama connected at {manager.base_url}")
+    return manager.warm_up()
+
+def serving_process():
+    # with debug on, the reloader re-runs this file in a child (WERKZEUG_RUN_MAIN) that does the serving;
+    # background threads belong in that one process, not in the file watcher as well
+    return not Config.DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
 
 if __name__ == '__main__':
     print("Starting AI dashboard backend...")  # simple startup
     print(f"Config: {Config.OLLAMA_URL} | Model: {Config.OLLAMA_MODEL}")
-    # check if ollama is running
-    status = Config.validate_ollama_connection()
-    if status['connected']:
-        print("Ollama connected")
-    else:
-        print(f"Ollama connection failed: {status.get('error', 'Unknown error')}")
-        print("Start Ollama with: ollama serve")  # reminder
+    if serving_process():
+        job_queue.start()
+        dashboard_reaper.start()
+        if Config.DASHBOARD_MODE == 'pool':
+            print(f"Booting {Config.STREAMLIT_POOL_SIZE} Streamlit worker(s)...")
+            dashboard_pool.start()
+
+    # load the model on every reachable node before serving so no request pays the cold start
+    print(f"Warming up {Config.OLLAMA_MODEL} on {len(model_managers)} node(s) (keep_alive={Config.OLLAMA_KEEP_ALIVE})...")
+    warmed = []
+    warmers = [threading.Thread(target=lambda m=m: warmed.append(warm_node(m))) for m in model_managers.values()]
+    for t in warmers:
+        t.start()
+    for t in warmers:
+        t.join()
+    if not any(warmed):
+        print("No Ollama node reachable - start Ollama with: ollama serve")  # reminder
+    for manager in model_managers.values():
+        manager.start()  # keeps re-warming while traffic is idle
     # start the flask app
     app.run(
         debug=Config.DEBUG,  # for development
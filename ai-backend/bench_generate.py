@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Load test for /api/dashboard/generate
+Run the backend against mock_ollama.py to measure queueing and generation throughput
+"""
+
+import argparse
+import statistics
+import threading
+import time
+import requests
+
+
+def run_one(base_url, prompt, results, lock, job_timeout=300):
+    start = time.time()
+    try:
+        response = requests.post(f"{base_url}/api/dashboard/generate",
+                                 json={'prompt': prompt, 'speculative': False}, timeout=10)
+    except requests.exceptions.RequestException as e:
+        with lock:
+            results.append({'outcome': 'error', 'error': str(e), 'seconds': time.time() - start})
+        return
+    accepted = time.time() - start
+    if response.status_code == 429:
+        with lock:
+            results.append({'outcome': 'rejected', 'seconds': accepted})
+        return
+    if response.status_code != 202:
+        with lock:
+            results.append({'outcome': 'error', 'error': f'HTTP {response.status_code}', 'seconds': accepted})
+        return
+
+    status_url = response.json()['status_url']
+    outcome, error = 'timeout', f'no result after {job_timeout}s'
+    while time.time() - start < job_timeout:
+        time.sleep(0.25)
+        try:
+            poll = requests.get(f"{base_url}{status_url}", timeout=10)
+        except requests.exceptions.RequestException as e:
+            outcome, error = 'error', str(e)
+            break
+        if poll.status_code != 200:
+            # e.g. 404 once the job outlived GENERATION_JOB_TTL
+            outcome, error = 'error', f'poll HTTP {poll.status_code}'
+            break
+        job = poll.json()
+        if job['status'] in ('done', 'failed'):
+            outcome, error = job['status'], job.get('error')
+            break
+    record = {'outcome': outcome, 'accept_seconds': accepted, 'seconds': time.time() - start}
+    if outcome not in ('done', 'failed'):
+        record['error'] = error
+    with lock:
+        results.append(record)
+
+
+def summarize(results, wall):
+    print(f"\nRequests: {len(results)} in {wall:.1f}s")
+    for outcome in ('done', 'failed', 'rejected', 'timeout', 'error'):
+        count = sum(1 for r in results if r['outcome'] == outcome)
+        if count:
+            print(f"  {outcome}: {count}")
+    finished = sorted(r['seconds'] for r in results if r['outcome'] == 'done')
+    if finished:
+        p95 = finished[min(len(finished) - 1, int(0.95 * len(finished)))]
+        print(f"End-to-end: p50 {statistics.median(finished):.2f}s | p95 {p95:.2f}s | max {finished[-1]:.2f}s")
+        print(f"Throughput: {len(finished) / wall:.2f} dashboards/s")
+    accepts = [r['accept_seconds'] for r in results if 'accept_seconds' in r]
+    if accepts:
+        print(f"Enqueue latency: p50 {statistics.median(accepts) * 1000:.0f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test dashboard generation')
+    parser.add_argument('--url', default='http://localhost:5247')
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=5)
+    parser.add_argument('--prompt', default='Show throughput by lane and bay with shift patterns')
+    parser.add_argument('--job-timeout', type=float, default=300, help='seconds before a job counts as timed out')
+    args = parser.parse_args()
+
+    results, lock = [], threading.Lock()
+    semaphore = threading.Semaphore(args.concurrency)
+
+    def worker(i):
+        with semaphore:
+            run_one(args.url, f"{args.prompt} #{i}", results, lock, args.job_timeout)
+
+    start = time.time()
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.requests)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    summarize(results, time.time() - start)
+
+
+if __name__ == '__main__':
+    main()
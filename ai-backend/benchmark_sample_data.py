@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the demo dataset generators in sample_data.py
+Times each generator from dashboard-default sizes up to a year of per-minute rows
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from sample_data import LANES, BAYS, PRODUCTS, manufacturing_frame, operational_frame, shipment_frame
+
+CASES = {
+    'default': [
+        ('manufacturing 7d hourly', lambda: manufacturing_frame(days=7, freq='h')),
+        ('operational 31d', lambda: operational_frame(days=31)),
+        ('shipments 9 months', lambda: shipment_frame()),
+    ],
+    'year': [
+        ('manufacturing 365d hourly', lambda: manufacturing_frame(days=365, freq='h')),
+        ('manufacturing 365d 15min', lambda: manufacturing_frame(days=365, freq='15min')),
+        ('operational 10y', lambda: operational_frame(days=3650)),
+        ('shipments 2024, 10x volume', lambda: shipment_frame('2024-01-01', '2024-12-31', (50, 250))),
+    ],
+    'minute': [
+        ('manufacturing 365d per minute', lambda: manufacturing_frame(days=365, freq='min')),
+        ('shipments 2024, 2000/day', lambda: shipment_frame('2024-01-01', '2024-12-31', 2000)),
+    ],
+}
+
+
+def row_loop_manufacturing(days):
+    # the per-row generator the runtime used to ship, kept as the baseline
+    rng = np.random.default_rng(42)
+    rows = []
+    for timestamp in pd.date_range(end=pd.Timestamp.now(), periods=days * 24, freq='h'):
+        hour = timestamp.hour
+        base = 100 if 8 <= hour <= 16 else 60
+        for lane in LANES:
+            for bay in BAYS:
+                throughput = max(0, base + rng.normal(0, 15))
+                availability = min(0.99, max(0.7, 0.85 + rng.normal(0, 0.05)))
+                performance = min(0.98, max(0.6, 0.82 + rng.normal(0, 0.08)))
+                quality = min(0.99, max(0.8, 0.94 + rng.normal(0, 0.03)))
+                rows.append({
+                    'Timestamp': timestamp, 'Date': timestamp.normalize(), 'Hour': hour,
+                    'Lane': lane, 'Bay': bay, 'Product': rng.choice(PRODUCTS),
+                    'Shift': 'Day_Shift' if 6 <= hour < 18 else 'Night_Shift',
+                    'Planned_Production': int(110 + rng.normal(0, 10)),
+                    'Actual_Production': int(throughput), 'Throughput_Units_Hour': int(throughput),
+                    'OEE_Percentage': round(availability * performance * quality * 100, 1),
+                    'Availability': round(availability * 100, 1), 'Performance': round(performance * 100, 1),
+                    'Quality': round(quality * 100, 1),
+                    'Schedule_Adherence': round(min(1.0, max(0.7, 0.88 + rng.normal(0, 0.06))) * 100, 1),
+                    'Downtime_Minutes': int(rng.exponential(5)),
+                    'Cycle_Time_Seconds': round(60 + rng.normal(0, 8), 1),
+                    'Energy_Consumption_kWh': round(50 + rng.normal(0, 8), 1),
+                    'Temperature_C': round(22 + rng.normal(0, 2), 1),
+                    'Operator': f"OP_{rng.integers(100, 999)}",
+                    'Quality_Score': round(quality * 100, 1),
+                })
+    return pd.DataFrame(rows)
+
+
+def timed(build, repeat):
+    best, frame = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        frame = build()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, frame
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the demo dataset generators')
+    parser.add_argument('--sizes', choices=['default', 'year', 'minute', 'all'], default='year')
+    parser.add_argument('--repeat', type=int, default=3, help='report the best of this many runs')
+    parser.add_argument('--compare', action='store_true', help='also time the old row loop (7 and 30 days)')
+    args = parser.parse_args()
+
+    groups = list(CASES) if args.sizes == 'all' else [args.sizes]
+    print(f"{'generator':<34} {'rows':>12} {'MB':>8} {'ms':>10} {'rows/s':>14}")
+    for group in groups:
+        for name, build in CASES[group]:
+            seconds, frame = timed(build, args.repeat)
+            mb = frame.memory_usage(deep=True).sum() / 1e6
+            print(f"{name:<34} {len(frame):>12,} {mb:>8.1f} {seconds * 1000:>10.1f} {len(frame) / seconds:>14,.0f}")
+
+    if args.compare:
+        print()
+        for days in (7, 30):
+            loop_seconds, _ = timed(lambda: row_loop_manufacturing(days), 1)
+            vector_seconds, frame = timed(lambda: manufacturing_frame(days=days, freq='h'), args.repeat)
+            print(f"manufacturing {days}d hourly ({len(frame):,} rows): row loop {loop_seconds * 1000:.0f}ms, "
+                  f"vectorized {vector_seconds * 1000:.1f}ms ({loop_seconds / vector_seconds:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import deque
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """Fails fast after repeated LLM failures, then lets a probe through to test recovery"""
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, half_open_probes=1):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0  # calls short-circuited while open
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == OPEN:
+                if time.time() - self.opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = HALF_OPEN
+                self._probes_in_flight = 0
+                print("LLM circuit half-open - probing")
+            if self.state == HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    self.rejected += 1
+                    return False
+                self._probes_in_flight += 1
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                print("LLM circuit closed")
+            self.state = CLOSED
+            self.failures = 0
+            self._probes_in_flight = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    print(f"LLM circuit open after {self.failures} failures - using templates for {self.reset_timeout}s")
+                self.state = OPEN
+                self.opened_at = time.time()
+                self._probes_in_flight = 0
+
+    def status(self):
+        with self._lock:
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = round(max(0.0, self.reset_timeout - (time.time() - self.opened_at)), 1)
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'failure_threshold': self.failure_threshold,
+                'rejected': self.rejected,
+                'retry_in_seconds': retry_in
+            }
+
+
+class AdaptiveTimeout:
+    """Request timeout derived from observed p95 generation latency"""
+
+    def __init__(self, initial, minimum, maximum, factor=1.5, window=50, min_samples=5):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.factor = factor
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.timeouts = 0
+
+    def observe(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def observe_timeout(self, timeout):
+        """A call that hit the timeout took at least that long; without this sample
+        slow generations would never be seen and the timeout could only shrink"""
+        with self._lock:
+            self._samples.append(timeout)
+            self.timeouts += 1
+
+    def p95(self):
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def current(self):
+        p95 = self.p95()
+        if p95 is None:
+            return self.initial
+        return max(self.minimum, min(self.maximum, p95 * self.factor))
+
+    def status(self):
+        p95 = self.p95()
+        return {
+            'timeout_seconds': round(self.current(), 1),
+            'p95_seconds': round(p95, 2) if p95 is not None else None,
+            'samples': len(self._samples),
+            'timeouts': self.timeouts,
+            'min': self.minimum,
+            'max': self.maximum
+        }
@@ -0,0 +1,115 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+def _digest(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def schema_fingerprint(data_context):
+    """Hash of what a dashboard script is rendered from: database, table and column list"""
+    return _digest(json.dumps([
+        data_context.get('db_path'),
+        data_context.get('table_name'),
+        list(data_context.get('columns', []))
+    ]))[:16]
+
+
+def code_key(kind, dashboard_type, data_context, prompt=None, model=None):
+    """Lookup key for generated code; LLM output also depends on the prompt and the model"""
+    parts = [kind, dashboard_type, schema_fingerprint(data_context)]
+    if prompt is not None:
+        parts += [_digest(prompt.strip().lower())[:16], model or '']
+    return ':'.join(parts)
+
+
+class CodeStore:
+    """Content-addressed dashboard sources: one file per distinct script, reused by every dashboard.
+
+    Files are named after the hash of their contents, so identical code from two requests lands
+    on the same file. A small index maps lookup keys to those files; LLM entries are persisted to
+    disk since regenerating them costs a model call, templates are cheap to re-render after a restart.
+    """
+
+    def __init__(self, directory, index_name='code_index.json', max_keys=512):
+        self.directory = directory
+        self.index_path = os.path.join(directory, index_name)
+        self.max_keys = max_keys
+        self._keys = OrderedDict()  # key -> (filename, persist)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        for key, filename in saved.items():
+            if os.path.exists(os.path.join(self.directory, filename)):
+                self._keys[key] = (filename, True)
+
+    def _save(self):
+        persisted = {key: filename for key, (filename, persist) in self._keys.items() if persist}
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(persisted, f, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def path_for(self, code):
+        return os.path.join(self.directory, f"dashboard_{_digest(code)[:16]}.py")
+
+    def write(self, code):
+        """Path of the file holding exactly this code, writing it only if no such file exists yet"""
+        filepath = self.path_for(code)
+        if not os.path.exists(filepath):
+            tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(code)
+            os.replace(tmp_path, filepath)
+        return filepath
+
+    def lookup(self, key):
+        """Stored file for key, or None"""
+        with self._lock:
+            entry = self._keys.get(key)
+            if entry is not None:
+                filepath = os.path.join(self.directory, entry[0])
+                if os.path.exists(filepath):
+                    self._keys.move_to_end(key)
+                    self.hits += 1
+                    return filepath
+                del self._keys[key]  # someone cleaned the directory
+            self.misses += 1
+            return None
+
+    def read(self, key):
+        filepath = self.lookup(key)
+        if filepath is None:
+            return None
+        with open(filepath) as f:
+            return f.read()
+
+    def put(self, key, code, persist=False):
+        filepath = self.write(code)
+        with self._lock:
+            self._keys[key] = (os.path.basename(filepath), persist)
+            self._keys.move_to_end(key)
+            while len(self._keys) > self.max_keys:
+                self._keys.popitem(last=False)  # only the index entry goes; the file may still be in use
+            if persist:
+                self._save()
+        return filepath
+
+    def stats(self):
+        with self._lock:
+            return {
+                'keys': len(self._keys),
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -0,0 +1,261 @@
+import ast
+import builtins
+import os
+import re
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+
+# top-level packages a generated dashboard may import
+ALLOWED_IMPORTS = {
+    'streamlit', 'pandas', 'numpy', 'plotly', 'sqlite3', 'datetime', 'time', 'math',
+    'json', 're', 'collections', 'itertools', 'functools', 'statistics', 'typing',
+    'calendar', 'decimal', 'warnings', 'dashboard_runtime',
+}
+# importable, but only these attributes may be used (no os.system, os.remove, ...)
+RESTRICTED_IMPORTS = {'os': {'path', 'getenv', 'getcwd', 'sep'}, 'sys': {'path'}}
+# builtins that would get around the import whitelist
+BLOCKED_BUILTINS = {'__import__', 'eval', 'exec', 'compile'}
+
+# a string is checked as SQL when it is passed to a query call, or when it has the shape of
+# SQL with upper-case keywords; UI text like "Select data from evaluation" is neither
+_SQL_CALLS = {'read_sql', 'read_sql_query', 'execute', 'executemany', 'executescript', 'sql', 'scalar', 'query'}
+_SQL_SHAPE_RE = re.compile(
+    r"^\s*(?:SELECT\b.*\bFROM\b|WITH\b.*\bAS\s*\(|INSERT\s+INTO\b|UPDATE\b.*\bSET\b|DELETE\s+FROM\b)", re.DOTALL)
+_SQL_TABLE_RE = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE)\s+[\[\"`]?([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
+_SQL_ALIAS_RE = re.compile(r"\bAS\s+[\[\"`]?([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
+_FRAME_NAME_RE = re.compile(r"df|data|frame", re.IGNORECASE)
+_SYSTEM_TABLES = {'sqlite_master', 'sqlite_schema', 'sqlite_sequence'}
+# names a script can read without binding them
+_PREDEFINED = set(dir(builtins)) | {'__file__', '__name__', '__doc__', '__builtins__', '__spec__', '__loader__'}
+
+# executes the script outside a streamlit server; st.* calls run in bare mode
+_DRY_RUN_SNIPPET = """
+import runpy, sys
+try:
+    from streamlit.runtime.scriptrunner import StopException
+except Exception:
+    StopException = ()
+try:
+    runpy.run_path(sys.argv[1], run_name='__main__')
+except StopException:
+    pass
+"""
+
+
+class DashboardCodeValidator:
+    """Cheap checks on generated dashboard code before it costs a Streamlit launch"""
+
+    def __init__(self, dry_run=None, dry_run_timeout=None, dry_run_workers=None):
+        self.dry_run = Config.VALIDATION_DRY_RUN if dry_run is None else dry_run
+        self.dry_run_timeout = dry_run_timeout or Config.VALIDATION_DRY_RUN_TIMEOUT
+        self._pool = ThreadPoolExecutor(max_workers=dry_run_workers or Config.VALIDATION_DRY_RUN_WORKERS,
+                                        thread_name_prefix='dry-run')
+
+    def validate(self, code, data_context, dry_run=None):
+        start = time.time()
+        errors = self.static_errors(code, data_context)
+        if not errors and (self.dry_run if dry_run is None else dry_run):
+            errors = self._pool.submit(self.dry_run_errors, code).result()
+        return {
+            'valid': not errors,
+            'errors': errors,
+            'elapsed_ms': round((time.time() - start) * 1000, 1)
+        }
+
+    def static_errors(self, code, data_context):
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as e:
+            # IndentationError is a SyntaxError too
+            return [f"{type(e).__name__} on line {e.lineno}: {e.msg}"]
+
+        errors = []
+        errors.extend(self._import_errors(tree))
+        errors.extend(self._restricted_use_errors(tree))
+        errors.extend(self._undefined_name_errors(tree))
+
+        strings = self._string_constants(tree)
+        statements = self._sql_statements(tree, strings)
+        table = data_context.get('table_name')
+        if table:
+            for s in statements:
+                for name in _SQL_TABLE_RE.findall(s):
+                    if name != table and name.lower() not in _SYSTEM_TABLES:
+                        errors.append(f"Unknown table '{name}' in SQL - use '{table}'")
+
+        columns = data_context.get('columns')
+        if columns:
+            defined = set(columns) | self._defined_names(tree, statements)
+            for name in sorted(self._referenced_columns(tree) - defined):
+                errors.append(f"Unknown column '{name}'")
+
+        return list(dict.fromkeys(errors))
+
+    def dry_run_errors(self, code):
+        path = os.path.join(Config.DASHBOARD_DIR, f".validate_{uuid.uuid4().hex[:8]}.py")
+        with open(path, 'w') as f:
+            f.write(code)
+        try:
+            proc = subprocess.run(
+                [sys.executable, '-c', _DRY_RUN_SNIPPET, path],
+                capture_output=True, text=True, timeout=self.dry_run_timeout, cwd=Config.DASHBOARD_DIR
+            )
+            if proc.returncode != 0:
+                tail = proc.stderr.strip().splitlines()[-3:]
+                return ['Dry run failed: ' + ' | '.join(tail)]
+            return []
+        except subprocess.TimeoutExpired:
+            return [f"Dry run exceeded {self.dry_run_timeout}s"]
+        finally:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _import_errors(self, tree):
+        errors = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                modules = [node.module or '']
+            else:
+                continue
+            for module in modules:
+                top = module.split('.')[0]
+                if top in RESTRICTED_IMPORTS:
+                    # from os import system / import os.wait are held to the same attributes as os.<name>
+                    attrs = module.split('.')[1:2] or (
+                        [alias.name for alias in node.names] if isinstance(node, ast.ImportFrom) else [])
+                    for attr in attrs:
+                        if attr not in RESTRICTED_IMPORTS[top]:
+                            errors.append(f"'{top}.{attr}' is not allowed")
+                elif top not in ALLOWED_IMPORTS:
+                    errors.append(f"Import of '{module}' is not allowed")
+        return errors
+
+    def _restricted_use_errors(self, tree):
+        aliases = {}  # local name -> restricted module
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    top = alias.name.split('.')[0]
+                    if top in RESTRICTED_IMPORTS:
+                        aliases[alias.asname or top] = top
+        errors = []
+        allowed_uses = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id in aliases:
+                module = aliases[node.value.id]
+                allowed_uses.add(id(node.value))  # judged by its attribute here, not as a bare name below
+                if node.attr not in RESTRICTED_IMPORTS[module]:
+                    errors.append(f"'{module}.{node.attr}' is not allowed")
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load)):
+                continue
+            if node.id in aliases and id(node) not in allowed_uses:
+                # e.g. getattr(os, 'system') would dodge the attribute check
+                errors.append(f"Module '{aliases[node.id]}' may only be used as "
+                              + ', '.join(f"{aliases[node.id]}.{a}" for a in sorted(RESTRICTED_IMPORTS[aliases[node.id]])))
+            elif node.id in BLOCKED_BUILTINS:
+                errors.append(f"Use of '{node.id}' is not allowed")
+        return errors
+
+    def _undefined_name_errors(self, tree):
+        # px.bar(...) without `import plotly.express as px` would only fail inside streamlit.
+        # Scopes are flattened: a name bound anywhere counts, so this never flags valid code
+        # and still catches missing imports and typos.
+        bound = set()
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    if alias.name == '*':
+                        return []  # star imports make every name possible
+                    bound.add(alias.asname or alias.name.split('.')[0])
+            elif isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+                bound.add(node.id)  # assignments, for/with/comprehension targets, walrus
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                bound.add(node.name)
+            elif isinstance(node, ast.arg):
+                bound.add(node.arg)
+            elif isinstance(node, ast.ExceptHandler) and node.name:
+                bound.add(node.name)
+            elif isinstance(node, (ast.Global, ast.Nonlocal)):
+                bound.update(node.names)
+            elif isinstance(node, (ast.MatchAs, ast.MatchStar)) and node.name:
+                bound.add(node.name)
+            elif isinstance(node, ast.MatchMapping) and node.rest:
+                bound.add(node.rest)
+        errors = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load) and node.id not in bound | _PREDEFINED:
+                errors.append(f"Name '{node.id}' is not defined on line {node.lineno} - missing import?")
+        return errors
+
+    def _string_constants(self, tree):
+        return [node.value for node in ast.walk(tree)
+                if isinstance(node, ast.Constant) and isinstance(node.value, str)]
+
+    def _literal_text(self, node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return [node.value]
+        if isinstance(node, ast.JoinedStr):
+            # f"SELECT * FROM {TABLE}": a placeholder never reads as a table name
+            return [''.join(v.value if isinstance(v, ast.Constant) else '{}' for v in node.values)]
+        return []
+
+    def _sql_statements(self, tree, strings):
+        assigned = {}  # query = "SELECT ..." then pd.read_sql(query, conn)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                assigned.setdefault(node.targets[0].id, []).extend(self._literal_text(node.value))
+        statements = [s for s in strings if _SQL_SHAPE_RE.match(s)]
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in _SQL_CALLS:
+                for arg in list(node.args) + [kw.value for kw in node.keywords]:
+                    if isinstance(arg, ast.Name):
+                        statements.extend(assigned.get(arg.id, []))
+                    else:
+                        statements.extend(self._literal_text(arg))
+        return list(dict.fromkeys(statements))
+
+    def _referenced_columns(self, tree):
+        # df['Col'] and filtered_df[['A', 'B']] reads on frame-like variables only,
+        # so dict and session_state lookups don't count as columns
+        names = set()
+        for node in ast.walk(tree):
+            if (isinstance(node, ast.Subscript) and isinstance(node.ctx, ast.Load)
+                    and isinstance(node.value, ast.Name) and _FRAME_NAME_RE.search(node.value.id)):
+                names.update(self._subscript_keys(node))
+        return names
+
+    def _subscript_keys(self, node):
+        key = node.slice
+        if isinstance(key, ast.Constant) and isinstance(key.value, str):
+            return {key.value}
+        if isinstance(key, ast.List):
+            return {e.value for e in key.elts if isinstance(e, ast.Constant) and isinstance(e.value, str)}
+        return set()
+
+    def _defined_names(self, tree, statements):
+        # anything the script creates itself is fair game to read back
+        names = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Subscript) and isinstance(node.ctx, ast.Store):
+                names.update(self._subscript_keys(node))
+            elif isinstance(node, ast.Dict):
+                names.update(k.value for k in node.keys if isinstance(k, ast.Constant) and isinstance(k.value, str))
+            elif isinstance(node, ast.Call):
+                for kw in node.keywords:
+                    if kw.arg:
+                        names.add(kw.arg)  # df.assign(New=...), agg(Named=...)
+                    if kw.arg in ('columns', 'names', 'name', 'value_name', 'var_name', 'key'):
+                        names.update(e.value for e in ast.walk(kw.value)
+                                     if isinstance(e, ast.Constant) and isinstance(e.value, str))
+        for s in statements:
+            names.update(_SQL_ALIAS_RE.findall(s))
+        return names
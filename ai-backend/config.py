@@ -6,8 +6,32 @@ class Config:
 
     # ollama settings
     OLLAMA_URL: str = os.getenv('OLLAMA_URL', 'http://localhost:11434')
+    # comma separated list of ollama processes to balance across, e.g. one per port
+    OLLAMA_URLS: list = [u.strip() for u in os.getenv('OLLAMA_URLS', OLLAMA_URL).split(',') if u.strip()]
+    OLLAMA_EJECT_AFTER: int = int(os.getenv('OLLAMA_EJECT_AFTER', '3'))  # consecutive failures before ejecting a node
+    OLLAMA_EJECT_SECONDS: int = int(os.getenv('OLLAMA_EJECT_SECONDS', '30'))
+
+    # circuit breaker and adaptive timeout around LLM calls (OLLAMA_TIMEOUT is the ceiling)
+    LLM_BREAKER_FAILURES: int = int(os.getenv('LLM_BREAKER_FAILURES', '5'))
+    LLM_BREAKER_RESET_SECONDS: int = int(os.getenv('LLM_BREAKER_RESET_SECONDS', '30'))
+    LLM_TIMEOUT_MIN: int = int(os.getenv('LLM_TIMEOUT_MIN', '10'))
+    LLM_TIMEOUT_P95_FACTOR: float = float(os.getenv('LLM_TIMEOUT_P95_FACTOR', '1.5'))
     OLLAMA_MODEL: str = os.getenv('OLLAMA_MODEL', 'llama3:latest')  # default model
     OLLAMA_TIMEOUT: int = int(os.getenv('OLLAMA_TIMEOUT', '60'))  # 60 sec timeout
+    OLLAMA_KEEP_ALIVE: str = os.getenv('OLLAMA_KEEP_ALIVE', '30m')  # how long ollama keeps the model in memory
+    OLLAMA_REWARM_INTERVAL: int = int(os.getenv('OLLAMA_REWARM_INTERVAL', '600'))  # re-warm after this many idle seconds
+    OLLAMA_WARMUP_TIMEOUT: int = int(os.getenv('OLLAMA_WARMUP_TIMEOUT', '300'))  # cold loads from disk are slow
+
+    # prompt size limits - prompt eval dominates on CPU-only ollama
+    PROMPT_TOKEN_BUDGET: int = int(os.getenv('PROMPT_TOKEN_BUDGET', '1200'))
+    PROMPT_MAX_COLUMNS: int = int(os.getenv('PROMPT_MAX_COLUMNS', '20'))
+    PROMPT_MAX_VALUE_CHARS: int = int(os.getenv('PROMPT_MAX_VALUE_CHARS', '40'))
+    PROMPT_SAMPLE_ROWS: int = int(os.getenv('PROMPT_SAMPLE_ROWS', '3'))
+
+    # time-series charts above CHART_MAX_POINTS are reduced with lttb, minmax (keeps every peak) or off
+    CHART_MAX_POINTS: int = int(os.getenv('CHART_MAX_POINTS', '1500'))
+    CHART_DOWNSAMPLE: str = os.getenv('CHART_DOWNSAMPLE', 'lttb').lower()
+    FIGURE_CACHE_MB: int = int(os.getenv('FIGURE_CACHE_MB', '64'))  # per dashboard process, shared by its sessions
 
     # server config
     AI_BACKEND_PORT: int = int(os.getenv('AI_BACKEND_PORT', '5247'))  # our port
@@ -17,15 +41,46 @@ class Config:
     # TODO: make CORS more restrictive for production
     CORS_ORIGINS: list = os.getenv('CORS_ORIGINS', 'http://localhost:3000').split(',')
 
+    # dashboard processes and pool workers lease ports from STREAMLIT_BASE_PORT..STREAMLIT_MAX_PORT
     STREAMLIT_BASE_PORT: int = int(os.getenv('STREAMLIT_BASE_PORT', '8501'))
+    STREAMLIT_MAX_PORT: int = int(os.getenv('STREAMLIT_MAX_PORT', '8999'))
+    STREAMLIT_BOOT_TIMEOUT: int = int(os.getenv('STREAMLIT_BOOT_TIMEOUT', '30'))  # seconds to pass the health check
+    # process: one streamlit server per dashboard
+    # host: dashboards are served by a small fixed pool of shared servers (dashboard_host.py), routed by ?dashboard=<id>
+    # pool: like process, but the server is a pre-booted worker (streamlit_worker.py) handed the script on launch
+    DASHBOARD_MODE: str = os.getenv('DASHBOARD_MODE', 'process').lower()
+    DASHBOARD_HOST_PORT: int = int(os.getenv('DASHBOARD_HOST_PORT', '8400'))  # first host; more hosts take the next ports
+    DASHBOARD_HOST_POOL_SIZE: int = int(os.getenv('DASHBOARD_HOST_POOL_SIZE', '1'))
+    STREAMLIT_POOL_SIZE: int = int(os.getenv('STREAMLIT_POOL_SIZE', '2'))  # idle workers kept booted
+    # the reaper stops least-recently-used dashboard servers past these limits; scripts stay on disk for relaunch
+    DASHBOARD_MAX_RUNNING: int = int(os.getenv('DASHBOARD_MAX_RUNNING', '20'))
+    DASHBOARD_MAX_RSS_MB: int = int(os.getenv('DASHBOARD_MAX_RSS_MB', '4096'))  # all dashboard servers together, 0 = no limit
+    DASHBOARD_IDLE_TIMEOUT: int = int(os.getenv('DASHBOARD_IDLE_TIMEOUT', '1800'))  # seconds without a browser connected, 0 = never
+    DASHBOARD_REAP_INTERVAL: int = int(os.getenv('DASHBOARD_REAP_INTERVAL', '30'))
     MAX_DASHBOARD_SIZE: str = os.getenv('MAX_DASHBOARD_SIZE', '10MB')
     DASHBOARD_TIMEOUT: int = int(os.getenv('DASHBOARD_TIMEOUT', '30000'))
     DEFAULT_CHART_TYPE: str = os.getenv('DEFAULT_CHART_TYPE', 'auto')
 
+    # generation job queue
+    # at least one worker per ollama node, otherwise extra nodes sit idle
+    GENERATION_WORKERS: int = int(os.getenv('GENERATION_WORKERS', str(max(2, len(OLLAMA_URLS)))))
+    GENERATION_MAX_QUEUE: int = int(os.getenv('GENERATION_MAX_QUEUE', '20'))  # beyond this we answer 429
+    GENERATION_JOB_TTL: int = int(os.getenv('GENERATION_JOB_TTL', '3600'))  # keep finished jobs pollable for 1h
+    # checks on LLM code before launch; the dry run executes it headless in a subprocess
+    VALIDATION_DRY_RUN: bool = os.getenv('VALIDATION_DRY_RUN', 'false').lower() == 'true'
+    VALIDATION_DRY_RUN_TIMEOUT: int = int(os.getenv('VALIDATION_DRY_RUN_TIMEOUT', '15'))
+    VALIDATION_DRY_RUN_WORKERS: int = int(os.getenv('VALIDATION_DRY_RUN_WORKERS', '2'))
+    VALIDATION_REPAIR_ATTEMPTS: int = int(os.getenv('VALIDATION_REPAIR_ATTEMPTS', '1'))
+    # launch the type template immediately and swap in LLM code when it arrives
+    SPECULATIVE_GENERATION: bool = os.getenv('SPECULATIVE_GENERATION', 'true').lower() == 'true'
+
     PROJECT_ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     DASHBOARD_DIR: str = os.path.join(PROJECT_ROOT, 'generated-dashboards')
     DATA_DIR: str = os.path.join(PROJECT_ROOT, 'data')
+    DASHBOARD_REGISTRY: str = os.path.join(DATA_DIR, 'dashboard_registry.json')  # dashboard id -> script for the hosts
+    PORT_LEASES: str = os.path.join(DATA_DIR, 'port_leases.json')  # survives restarts so orphaned servers keep their ports
     LOGS_DIR: str = os.path.join(PROJECT_ROOT, 'logs')
+    RUNTIME_DIR: str = os.path.dirname(os.path.abspath(__file__))  # generated dashboards import dashboard_runtime from here
 
     # Logging
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'info').upper()
@@ -37,11 +92,11 @@ class Config:
             os.makedirs(directory, exist_ok=True)
 
     @classmethod
-    def validate_ollama_connection(cls) -> dict:
-        """Validate Ollama connection"""
+    def validate_ollama_connection(cls, url=None) -> dict:
+        """Validate Ollama connection (OLLAMA_URL unless another node is given)"""
         try:
             import requests
-            response = requests.get(f"{cls.OLLAMA_URL}/api/tags", timeout=5)
+            response = requests.get(f"{url or cls.OLLAMA_URL}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 model_names = [model['name'] for model in models]
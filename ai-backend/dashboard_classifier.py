@@ -0,0 +1,105 @@
+import re
+from functools import lru_cache
+
+# keyword -> weight per dashboard type; shared words ('revenue') get split weights
+KEYWORDS = {
+    'manufacturing': {
+        'lane': 2.0, 'bay': 2.0, 'throughput': 1.5, 'capacity': 1.0, 'production': 2.0,
+        'manufacturing': 3.0, 'terminal': 1.5, 'schedule': 1.0, 'adherence': 1.5, 'oee': 3.0,
+        'downtime': 1.5, 'shift': 1.0, 'yield': 1.0, 'cycle time': 2.0, 'takt': 2.0,
+    },
+    'financial': {
+        'financial': 3.0, 'finance': 3.0, 'revenue': 1.0, 'profit': 2.0, 'margin': 2.0,
+        'cost': 1.0, 'budget': 2.0, 'earnings': 2.0, 'income': 2.0, 'expense': 2.0, 'roi': 2.0,
+    },
+    'sales': {
+        'sales': 3.0, 'revenue': 1.0, 'customer': 1.5, 'conversion': 2.0, 'lead': 1.5,
+        'pipeline': 1.5, 'order': 1.0, 'funnel': 2.0, 'region': 0.5, 'regional': 0.5,
+    },
+    'operational': {
+        'operational': 3.0, 'efficiency': 1.5, 'uptime': 2.0, 'performance': 0.5,
+        'productivity': 1.5, 'operations': 2.0, 'kpi': 0.5,
+    },
+    'logistics': {
+        'logistics': 3.0, 'supply': 1.0, 'supply chain': 2.0, 'inventory': 2.0, 'shipment': 1.5,
+        'delivery': 2.0, 'warehouse': 2.0, 'freight': 2.0, 'route': 1.5, 'carrier': 1.5,
+    },
+    'analytics': {
+        'analytics': 1.0, 'analysis': 0.5, 'report': 0.5, 'insights': 0.5, 'trends': 0.5,
+        'statistics': 1.0, 'correlation': 1.5, 'distribution': 1.0,
+    },
+    'energy': {
+        'fuel': 2.0, 'energy': 3.0, 'consumption': 1.5, 'volume': 0.5, 'flow': 0.5,
+        'rate': 0.3, 'kwh': 2.0, 'emissions': 1.5, 'power': 1.5,
+    },
+    'hr': {
+        'employee': 3.0, 'hr': 3.0, 'staff': 2.0, 'workforce': 3.0, 'personnel': 3.0,
+        'hiring': 3.0, 'salary': 2.0, 'retention': 2.0, 'attrition': 2.0, 'headcount': 3.0,
+    },
+}
+
+# tie-break order, same precedence the old if-chain had
+TYPE_ORDER = ['manufacturing', 'financial', 'sales', 'operational', 'logistics', 'analytics', 'energy', 'hr']
+DEFAULT_TYPE = 'analytics'
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+class DashboardClassifier:
+    """Scores every dashboard type from a keyword index built once"""
+
+    def __init__(self, keywords=None, cache_size=4096):
+        keywords = keywords or KEYWORDS
+        self._single = {}   # token -> [(type, weight)]
+        self._phrases = {}  # first token -> [(token tuple, type, weight)]
+        for dashboard_type, words in keywords.items():
+            for phrase, weight in words.items():
+                tokens = tuple(_TOKEN_RE.findall(phrase.lower()))
+                if len(tokens) == 1:
+                    self._single.setdefault(tokens[0], []).append((dashboard_type, weight))
+                else:
+                    self._phrases.setdefault(tokens[0], []).append((tokens, dashboard_type, weight))
+        self._rank = {t: i for i, t in enumerate(TYPE_ORDER)}
+        self._classify_cached = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _normalize(self, token):
+        if token in self._single or token in self._phrases:
+            return token
+        # cheap plural folding: shipments -> shipment, deliveries -> delivery
+        if token.endswith('ies') and token[:-3] + 'y' in self._single:
+            return token[:-3] + 'y'
+        if token.endswith('s') and token[:-1] in self._single:
+            return token[:-1]
+        return token
+
+    def _classify(self, prompt_lower):
+        tokens = [self._normalize(t) for t in _TOKEN_RE.findall(prompt_lower)]
+        scores = dict.fromkeys(TYPE_ORDER, 0.0)
+        for i, tok in enumerate(tokens):
+            for dashboard_type, weight in self._single.get(tok, ()):
+                scores[dashboard_type] += weight
+            for phrase, dashboard_type, weight in self._phrases.get(tok, ()):
+                if tuple(tokens[i:i + len(phrase)]) == phrase:
+                    scores[dashboard_type] += weight
+
+        total = sum(scores.values())
+        if total == 0:
+            return ({'type': DEFAULT_TYPE, 'score': 0.0, 'confidence': 0.0},)
+        ranked = sorted((t for t in scores if scores[t] > 0),
+                        key=lambda t: (-scores[t], self._rank.get(t, len(self._rank))))
+        return tuple({'type': t, 'score': round(scores[t], 2), 'confidence': round(scores[t] / total, 3)}
+                     for t in ranked)
+
+    def classify(self, prompt):
+        """Ranked dashboard types with confidence, best first"""
+        return [dict(r) for r in self._classify_cached(' '.join(prompt.lower().split()))]
+
+    def best_type(self, prompt):
+        return self._classify_cached(' '.join(prompt.lower().split()))[0]['type']
+
+    def classify_batch(self, prompts):
+        return [self.classify(p) for p in prompts]
+
+    def cache_info(self):
+        info = self._classify_cached.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max_size': info.maxsize}
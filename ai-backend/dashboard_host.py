@@ -0,0 +1,56 @@
+"""
+Multi-tenant Streamlit host: one server renders every registered dashboard
+Open /?dashboard=<id>; the backend maps ids to generated scripts in dashboard_registry
+Pool workers run the same script but serve the single dashboard in their assignment file
+"""
+
+import json
+import os
+import sys
+
+RUNTIME_DIR = os.path.dirname(os.path.abspath(__file__))
+if RUNTIME_DIR not in sys.path:  # this script reruns for every session and interaction
+    sys.path.insert(0, RUNTIME_DIR)
+
+import streamlit as st
+
+# imported once per server instead of once per dashboard process
+import dashboard_runtime  # noqa: F401
+from dashboard_registry import lookup_dashboard
+
+
+@st.cache_resource(max_entries=512, show_spinner=False)
+def compiled_script(path, mtime):
+    # keyed on mtime, so a speculative upgrade is picked up on the next rerun
+    with open(path) as f:
+        return compile(f.read(), path, 'exec')
+
+
+def assigned_script():
+    # a pool worker (streamlit_worker.py) serves the one script the backend handed it
+    path = os.environ.get('DASHBOARD_ASSIGNMENT')
+    try:
+        with open(path) as f:
+            assignment = json.load(f)
+    except (TypeError, OSError, ValueError):
+        return None, None
+    return assignment.get('dashboard_id'), assignment.get('script')
+
+
+if os.environ.get('DASHBOARD_ASSIGNMENT'):
+    dashboard_id, script_path = assigned_script()
+else:
+    dashboard_id = st.query_params.get('dashboard')
+    script_path = lookup_dashboard(dashboard_id) if dashboard_id else None
+if not script_path or not os.path.exists(script_path):
+    st.error(f"Dashboard {dashboard_id!r} is not registered on this host" if dashboard_id
+             else "No dashboard selected - open this host with ?dashboard=<id>")
+    st.stop()
+
+code = compiled_script(script_path, os.path.getmtime(script_path))
+# each script gets its own module name so st.cache_data entries of different scripts never mix
+exec(code, {
+    '__name__': os.path.splitext(os.path.basename(script_path))[0],
+    '__file__': script_path,
+    '__builtins__': __builtins__
+})
@@ -0,0 +1,224 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import psutil
+except ImportError:
+    psutil = None  # falls back to /proc on Linux; elsewhere only the count ceiling applies
+
+TCP_ESTABLISHED = '01'  # state column of /proc/net/tcp
+
+
+def _proc_children(pid):
+    children = []
+    try:
+        for tid in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{tid}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return children
+
+
+def _proc_rss(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        return None
+    return 0
+
+
+def process_rss(pid):
+    """Resident bytes of pid and its children, or None if it can't be measured here"""
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            tree = [process] + process.children(recursive=True)
+            total = 0
+            for member in tree:
+                try:
+                    total += member.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    pass
+            return total
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+    if not os.path.isdir('/proc'):
+        return None
+    total, pending, seen = 0, [pid], set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        rss = _proc_rss(current)
+        if rss is None and current == pid:
+            return None
+        total += rss or 0
+        pending.extend(_proc_children(current))
+    return total
+
+
+def open_connections(port):
+    """Established client connections to a local server port, or None if unknown.
+
+    Every open browser tab holds a websocket to its Streamlit server, so a non-zero
+    count means somebody is looking at the dashboard right now.
+    """
+    if psutil is not None:
+        try:
+            return sum(1 for conn in psutil.net_connections(kind='tcp')
+                       if conn.laddr and conn.laddr.port == port and conn.status == psutil.CONN_ESTABLISHED)
+        except (psutil.AccessDenied, OSError):
+            pass  # e.g. macOS without root; try /proc anyway
+    count, found = 0, False
+    for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+        try:
+            with open(table) as f:
+                next(f)  # header
+                for line in f:
+                    fields = line.split()
+                    if int(fields[1].rsplit(':', 1)[1], 16) == port and fields[3] == TCP_ESTABLISHED:
+                        count += 1
+            found = True
+        except (OSError, StopIteration, IndexError, ValueError):
+            continue
+    return count if found else None
+
+
+class DashboardReaper:
+    """Stops least-recently-used dashboard servers so forgotten ones don't pile up.
+
+    Every interval it marks dashboards that still have browser connections as accessed,
+    then stops, oldest access first: dashboards idle longer than idle_timeout, dashboards
+    beyond max_dashboards, and dashboards while the servers together use more than
+    max_rss_mb. Only entries with a process of their own are considered; hosted
+    dashboards cost their shared server next to nothing. The script stays on disk and
+    the eviction is remembered, so the dashboard can be relaunched on demand.
+    """
+
+    def __init__(self, dashboards, evict, max_dashboards=20, max_rss_mb=4096, idle_timeout=1800,
+                 interval=30, max_evicted=500):
+        self.dashboards = dashboards  # the backend's running_dashboards dict
+        self.evict = evict  # evict(dashboard_id) -> info dict of the stopped dashboard, or None
+        self.max_dashboards = max_dashboards
+        self.max_rss = max_rss_mb * 1024 * 1024  # 0 disables the memory ceiling
+        self.idle_timeout = idle_timeout  # 0 disables idle eviction
+        self.interval = interval
+        self.max_evicted = max_evicted
+        self.evicted = OrderedDict()  # dashboard id -> eviction record, oldest first
+        self._cond = threading.Condition()
+        self._thread = None
+        self.sweeps = 0
+        self.total_rss = None
+
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="dashboard-reaper", daemon=True)
+            self._thread.start()
+
+    def wake(self):
+        """Sweep now instead of at the next interval, e.g. right after a launch"""
+        with self._cond:
+            self._cond.notify_all()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                self._cond.wait(timeout=self.interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"Dashboard reaper sweep failed: {e}")
+
+    def sweep(self):
+        """One pass over the running dashboards; returns the ids it evicted"""
+        now = time.time()
+        candidates = []
+        for dashboard_id, info in list(self.dashboards.items()):
+            process = info.get('process')
+            if process is None:
+                continue
+            connections = open_connections(info['port'])
+            if connections:
+                info['last_access'] = now
+            info['connections'] = connections
+            info['rss'] = process_rss(process.pid)
+            candidates.append((info.get('last_access', 0), dashboard_id, info))
+        candidates.sort(key=lambda candidate: candidate[0])  # least recently used first
+
+        evictions = []
+        total_rss = sum(info['rss'] or 0 for _, _, info in candidates)
+        for last_access, dashboard_id, info in candidates:
+            remaining = len(candidates) - len(evictions)
+            if self.idle_timeout and info['connections'] == 0 and now - last_access > self.idle_timeout:
+                reason = 'idle'
+            elif remaining > self.max_dashboards:
+                reason = 'max_dashboards'
+            elif self.max_rss and total_rss > self.max_rss:
+                reason = 'memory'
+            else:
+                continue
+            if self._evict(dashboard_id, reason, now):
+                evictions.append(dashboard_id)
+                total_rss -= info['rss'] or 0
+        with self._cond:
+            self.sweeps += 1
+            self.total_rss = total_rss
+        return evictions
+
+    def _evict(self, dashboard_id, reason, now):
+        info = self.evict(dashboard_id)
+        if info is None:
+            return False  # stopped by someone else meanwhile
+        print(f"Evicted dashboard {dashboard_id} ({reason})")
+        with self._cond:
+            self.evicted.pop(dashboard_id, None)
+            self.evicted[dashboard_id] = {
+                'reason': reason,
+                'evicted_at': now,
+                'last_access': info.get('last_access'),
+                'rss': info.get('rss'),
+                'created_at': info['created_at'],
+                'prompt': info['prompt'],
+                'filepath': info['filepath']
+            }
+            while len(self.evicted) > self.max_evicted:
+                self.evicted.popitem(last=False)
+        return True
+
+    def forget(self, dashboard_id):
+        """Drop the eviction record, e.g. once the dashboard is relaunched"""
+        with self._cond:
+            return self.evicted.pop(dashboard_id, None)
+
+    def evicted_record(self, dashboard_id):
+        with self._cond:
+            record = self.evicted.get(dashboard_id)
+            return dict(record) if record else None
+
+    def evictions(self):
+        with self._cond:
+            return [dict(record, id=dashboard_id) for dashboard_id, record in self.evicted.items()]
+
+    def stats(self):
+        with self._cond:
+            reasons = {}
+            for record in self.evicted.values():
+                reasons[record['reason']] = reasons.get(record['reason'], 0) + 1
+            return {
+                'max_dashboards': self.max_dashboards,
+                'max_rss_mb': self.max_rss // (1024 * 1024),
+                'idle_timeout': self.idle_timeout,
+                'total_rss_mb': round(self.total_rss / (1024 * 1024), 1) if self.total_rss is not None else None,
+                'sweeps': self.sweeps,
+                'evicted': len(self.evicted),
+                'evicted_by_reason': reasons
+            }
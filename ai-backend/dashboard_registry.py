@@ -0,0 +1,55 @@
+import json
+import os
+import threading
+
+from config import Config
+
+# dashboard id -> script path, written by the backend and read by dashboard_host.py
+_lock = threading.Lock()
+_cache = {'version': None, 'entries': {}}
+
+
+def _load(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(entries, path):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(entries, f, indent=1)
+    os.replace(tmp_path, path)  # readers never see a half-written registry
+
+
+def register_dashboard(dashboard_id, script_path, path=None):
+    path = path or Config.DASHBOARD_REGISTRY
+    with _lock:
+        entries = _load(path)
+        entries[dashboard_id] = script_path
+        _save(entries, path)
+
+
+def unregister_dashboard(dashboard_id, path=None):
+    path = path or Config.DASHBOARD_REGISTRY
+    with _lock:
+        entries = _load(path)
+        if entries.pop(dashboard_id, None) is not None:
+            _save(entries, path)
+
+
+def lookup_dashboard(dashboard_id, path=None):
+    """Script registered for dashboard_id, or None; re-reads the file only when it changed"""
+    path = path or Config.DASHBOARD_REGISTRY
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    version = (path, stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        if _cache['version'] != version:
+            _cache['entries'] = _load(path)
+            _cache['version'] = version
+        return _cache['entries'].get(dashboard_id)
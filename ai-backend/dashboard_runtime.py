@@ -0,0 +1,656 @@
+"""
+Shared runtime for generated Streamlit dashboards
+Generated scripts import this instead of inlining loaders, CSS and chart code
+"""
+
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+from config import Config
+from downsample import downsample_frame
+from figure_cache import FigureCache, chart_fingerprint, figure_key, normalize_selection
+from filter_engine import FilterCube
+from ingest_manifest import read_generations
+from sample_data import manufacturing_frame, operational_frame
+
+# background gradient, accent, card text colour per dashboard type
+THEMES = {
+    'manufacturing': {'bg': ('#1a202c', '#2d3748'), 'accent': '#3182ce', 'text': '#1a202c'},
+    'operational': {'bg': ('#0f172a', '#1e293b'), 'accent': '#3b82f6', 'text': '#0f172a'},
+    'sales': {'bg': ('#1e3a8a', '#3b82f6'), 'accent': '#1e3a8a', 'text': '#1e3a8a'},
+    'financial': {'bg': ('#064e3b', '#059669'), 'accent': '#059669', 'text': '#064e3b'},
+    'analytics': {'bg': ('#374151', '#6b7280'), 'accent': '#374151', 'text': '#374151'},
+    'logistics': {'bg': ('#ea580c', '#f97316'), 'accent': '#ea580c', 'text': '#ea580c'},
+    'energy': {'bg': ('#065f46', '#10b981'), 'accent': '#065f46', 'text': '#065f46'},
+    'hr': {'bg': ('#7c3aed', '#a855f7'), 'accent': '#7c3aed', 'text': '#7c3aed'},
+}
+
+_CSS = """
+<style>
+    .main {{ background: linear-gradient(135deg, {bg0} 0%, {bg1} 100%); color: white; }}
+    .metric-card {{
+        background: linear-gradient(135deg, #ffffff 0%, #f7fafc 100%);
+        color: {text};
+        padding: 1.5rem;
+        border-radius: 12px;
+        box-shadow: 0 8px 32px rgba(0,0,0,0.12);
+        margin: 0.5rem 0;
+        border-left: 6px solid {accent};
+    }}
+    .kpi-header {{ font-size: 0.9rem; font-weight: 700; color: #4a5568; margin-bottom: 0.5rem; text-transform: uppercase; }}
+    .kpi-value {{ font-size: 2.2rem; font-weight: 800; color: {text}; margin: 0; line-height: 1.1; }}
+    .kpi-unit {{ font-size: 1.1rem; color: #718096; margin-left: 0.4rem; }}
+    .kpi-delta {{ font-size: 0.85rem; margin-top: 0.4rem; font-weight: 600; color: #4a5568; }}
+    .status-excellent {{ color: #38a169; }}
+    .status-good {{ color: #4299e1; }}
+    .status-warning {{ color: #ed8936; }}
+    .status-critical {{ color: #e53e3e; }}
+    .section-header {{
+        color: white; font-size: 1.6rem; font-weight: 700; margin: 2rem 0 1rem 0;
+        padding-bottom: 0.5rem; border-bottom: 3px solid {accent};
+    }}
+    .stPlotlyChart {{ background: rgba(255,255,255,0.97); border-radius: 12px; padding: 1rem; box-shadow: 0 4px 16px rgba(0,0,0,0.1); }}
+    .alert-banner {{ background: #fed7d7; color: #c53030; padding: 1rem; border-radius: 12px; margin: 1rem 0; font-weight: 600; border-left: 6px solid #e53e3e; }}
+    .target-banner {{ background: #c6f6d5; color: #2f855a; padding: 1rem; border-radius: 12px; margin: 1rem 0; font-weight: 600; border-left: 6px solid #38a169; }}
+</style>
+"""
+
+
+# --- page layout ---
+
+def setup_page(title, icon, theme='analytics', subtitle=None):
+    st.set_page_config(page_title=title, page_icon=icon, layout="wide", initial_sidebar_state="expanded")
+    colors = THEMES.get(theme, THEMES['analytics'])
+    st.markdown(_CSS.format(bg0=colors['bg'][0], bg1=colors['bg'][1], accent=colors['accent'], text=colors['text']),
+                unsafe_allow_html=True)
+    st.markdown(f"<h1 style='text-align: center; color: white; margin-bottom: 1rem;'>{icon} {title}</h1>",
+                unsafe_allow_html=True)
+    if subtitle:
+        st.markdown(f"<h3 style='text-align: center; color: #a0aec0; margin-bottom: 2rem;'>{subtitle}</h3>",
+                    unsafe_allow_html=True)
+
+
+def section(title):
+    st.markdown(f'<div class="section-header">{title}</div>', unsafe_allow_html=True)
+
+
+def banner(text, kind='alert'):
+    st.markdown(f'<div class="{kind}-banner">{text}</div>', unsafe_allow_html=True)
+
+
+# --- data access ---
+
+class _Database:
+    """One sqlite connection per db file, shared by all sessions behind a lock"""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self._version = None
+        self._generations = {}
+
+    def read(self, sql, params=()):
+        with self.lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def has_table(self, table):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type IN ('table', 'view') AND name = ?", (table,)).fetchone()
+        return row is not None
+
+    def generation(self, table=None):
+        """Cache token for table (or the whole db) that changes only when ingest rewrites it"""
+        with self.lock:
+            # data_version moves when another connection commits, so this is one cheap pragma per rerun
+            version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if version != self._version:
+                self._version = version
+                self._generations = read_generations(self.conn)
+            if table in self._generations:
+                return ('ingest', self._generations[table])
+            return ('version', version)  # not written by ingest, any commit invalidates
+
+    def columns(self, table):
+        with self.lock:
+            return [(row[1], (row[2] or '').upper()) for row in self.conn.execute(f"PRAGMA table_info([{table}])")]
+
+
+SAMPLE_PREFIX = 'sample:'
+SAMPLE_TABLE = 'sample'
+
+
+@st.cache_resource(show_spinner=False)
+def get_database(db_path):
+    if db_path.startswith(SAMPLE_PREFIX):
+        # sample datasets live in an in-memory db so SQL paging and filters work the same on them
+        db = _Database(':memory:')
+        SAMPLES[db_path[len(SAMPLE_PREFIX):]]().to_sql(SAMPLE_TABLE, db.conn, index=False)
+        return db
+    return _Database(db_path)
+
+
+def data_generation(db_path, table=None):
+    return get_database(db_path).generation(table)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _query(db_path, sql, params, generation):
+    return get_database(db_path).read(sql, params)
+
+
+def query(db_path, sql, params=(), table=None):
+    """Cached read, reused until the data generation of table (or the db) changes"""
+    return _query(db_path, sql, tuple(params), data_generation(db_path, table))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _describe(db_path, table, generation):
+    db = get_database(db_path)
+    if not db.has_table(table) or db.read(f"SELECT 1 FROM [{table}] LIMIT 1").empty:
+        return None
+    return dict(db.columns(table))
+
+
+def source(db_path, table, sample=None):
+    """Where a dashboard reads from: {'db_path', 'table', 'columns': {name: sqlite type}}.
+    Falls back to the named sample dataset when the table is missing or empty."""
+    columns = None
+    try:
+        columns = _describe(db_path, table, data_generation(db_path, table))
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+    if columns is None and sample:
+        st.info("No data in the database yet - showing sample data for demonstration")
+        db_path, table = SAMPLE_PREFIX + sample, SAMPLE_TABLE
+        columns = _describe(db_path, table, data_generation(db_path, table))
+    return {'db_path': db_path, 'table': table, 'columns': columns or {}}
+
+
+def numeric_columns(src):
+    return [c for c, kind in src['columns'].items() if any(k in kind for k in ('INT', 'REAL', 'FLOA', 'DOUB', 'NUM'))]
+
+
+def text_columns(src):
+    return [c for c, kind in src['columns'].items() if kind in ('TEXT', '')]
+
+
+def where_clause(selection=None, search=None, search_columns=(), columns=None):
+    """SQL WHERE and params for a sidebar selection plus an optional free-text search.
+    Selections on columns the table doesn't have are ignored."""
+    clauses, params = [], []
+    date = (selection or {}).get('date')
+    if date and (columns is None or date[0] in columns):
+        column, lo, hi = date
+        # dates are stored as ISO text, so compare against the day after hi
+        clauses.append(f"[{column}] >= ? AND [{column}] < ?")
+        params += [str(lo), str(pd.Timestamp(hi) + pd.Timedelta(days=1))[:10]]
+    for column, values in (selection or {}).get('values', {}).items():
+        if columns is not None and column not in columns:
+            continue
+        clauses.append(f"[{column}] IN ({', '.join('?' * len(values))})")
+        params += [v.item() if hasattr(v, 'item') else v for v in values]
+    if search and search_columns:
+        clauses.append('(' + ' OR '.join(f"CAST([{c}] AS TEXT) LIKE ?" for c in search_columns) + ')')
+        params += [f"%{search}%"] * len(search_columns)
+    return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+
+_MISSING_SCHEMA = ('no such column', 'no such table')
+
+
+def sql(src, statement, selection=None, params=(), dates=()):
+    """Aggregate query against a source. {table} and {where} are filled in, with the
+    selection's params ahead of params. Empty when the table lacks a referenced column;
+    any other database error is shown on the page and also gives an empty frame."""
+    if not src['columns']:
+        return pd.DataFrame()
+    where, where_params = where_clause(selection, columns=src['columns'])
+    try:
+        data = query(src['db_path'], statement.format(table=f"[{src['table']}]", where=where),
+                     where_params + list(params), table=src['table'])
+    except (pd.errors.DatabaseError, sqlite3.OperationalError) as e:
+        if not any(reason in str(e) for reason in _MISSING_SCHEMA):
+            st.error(f"Query failed: {e}")  # locked db, bad SQL, lost connection: don't pass off as no data
+        return pd.DataFrame()
+    for column in dates:
+        if column in data.columns:
+            data[column] = pd.to_datetime(data[column], errors='coerce')
+    return data
+
+
+def scalar(src, statement, selection=None, params=()):
+    """First cell of an aggregate query, None when missing or NULL"""
+    data = sql(src, statement, selection, params)
+    if data.empty:
+        return None
+    value = data.iat[0, 0]
+    return None if pd.isna(value) else value
+
+
+# --- sidebar filters ---
+
+def sidebar_filters(src, date_column=None, choices=None, title="## 📊 Dashboard Controls"):
+    """Date range plus one multiselect per {column: label}, with bounds and options read
+    in SQL. Returns the selection for sql()/where_clause; untouched widgets add nothing."""
+    st.sidebar.markdown(title)
+    selection = {'date': None, 'values': {}}
+    if date_column in src['columns']:
+        bounds = sql(src, f"SELECT MIN([{date_column}]) AS lo, MAX([{date_column}]) AS hi FROM {{table}}",
+                     dates=['lo', 'hi'])
+        if not bounds.empty and not bounds.isna().any(axis=None):
+            lo, hi = bounds['lo'][0].date(), bounds['hi'][0].date()
+            picked = st.sidebar.date_input("Select Date Range", value=[lo, hi], min_value=lo, max_value=hi)
+            if len(picked) == 2 and tuple(picked) != (lo, hi):
+                selection['date'] = (date_column, picked[0], picked[1])
+    for column, label in (choices or {}).items():
+        if column not in src['columns']:
+            continue
+        options = sql(src, f"SELECT DISTINCT [{column}] AS v FROM {{table}} WHERE [{column}] IS NOT NULL ORDER BY 1")
+        options = options['v'].tolist() if not options.empty else []
+        picked = st.sidebar.multiselect(label, options=options, default=options)
+        if picked and len(picked) < len(options):
+            selection['values'][column] = picked
+    return selection
+
+
+@st.cache_resource(show_spinner="Indexing filters...", max_entries=8)
+def _filter_cube(db_path, table, dimensions, measures, date_dimension, generation):
+    columns = _describe(db_path, table, generation) or {}
+    dims = [d for d in dimensions if d in columns]
+    if date_dimension in columns:
+        dims.append(date_dimension)
+    measures = [m for m in measures if m in columns]
+    select = [f"substr([{d}], 1, 10) AS [{d}]" if d == date_dimension else f"[{d}]" for d in dims]
+    select += [f"SUM([{m}]) AS [sum_{m}], COUNT([{m}]) AS [cnt_{m}]" for m in measures]
+    group_by = f" GROUP BY {', '.join(str(i + 1) for i in range(len(dims)))}" if dims else ''
+    frame = get_database(db_path).read(f"SELECT {', '.join(select + ['COUNT(*) AS n'])} FROM [{table}]{group_by}")
+    return FilterCube(frame, dims, measures, date_dimension=date_dimension)
+
+
+def filter_cube(src, dimensions, measures, date_dimension=None):
+    """Bitmap-indexed cube of the table aggregated over dimensions (days for date_dimension),
+    shared across sessions and rebuilt once per data generation"""
+    return _filter_cube(src['db_path'], src['table'], tuple(dimensions), tuple(measures), date_dimension,
+                        data_generation(src['db_path'], src['table']))
+
+
+def cube_filters(cube, choices=None, title="## 📊 Dashboard Controls"):
+    """sidebar_filters for a FilterCube: options come from the cube, no queries per rerun"""
+    st.sidebar.markdown(title)
+    selection = {'date': None, 'values': {}}
+    bounds = cube.date_bounds()
+    if bounds:
+        lo, hi = bounds
+        picked = st.sidebar.date_input("Select Date Range", value=[lo, hi], min_value=lo, max_value=hi)
+        if len(picked) == 2 and tuple(picked) != (lo, hi):
+            selection['date'] = (cube.date_dimension, picked[0], picked[1])
+    for column, label in (choices or {}).items():
+        options = cube.options(column)
+        if not options:
+            continue
+        picked = st.sidebar.multiselect(label, options=options, default=options)
+        if picked and len(picked) < len(options):
+            selection['values'][column] = picked
+    return selection
+
+
+# --- KPI cards ---
+
+def kpi(label, value, fmt='{:,.1f}', unit='', delta='', status=''):
+    if value is None:
+        return None
+    return {'label': label, 'value': fmt.format(value), 'unit': unit, 'delta': delta, 'status': status}
+
+
+def kpi_row(cards):
+    cards = [c for c in cards if c]
+    if not cards:
+        return
+    for col, card in zip(st.columns(len(cards)), cards):
+        with col:
+            unit = f'<span class="kpi-unit">{card["unit"]}</span>' if card['unit'] else ''
+            delta = f'<div class="kpi-delta">{card["delta"]}</div>' if card['delta'] else ''
+            st.markdown(f'''
+            <div class="metric-card">
+                <div class="kpi-header">{card["label"]}</div>
+                <div class="kpi-value {card["status"]}">{card["value"]}{unit}</div>
+                {delta}
+            </div>
+            ''', unsafe_allow_html=True)
+
+
+def threshold_status(value, excellent, good, warning=None):
+    if value is None:
+        return ''
+    if value >= excellent:
+        return 'status-excellent'
+    if value >= good:
+        return 'status-good'
+    if warning is None or value >= warning:
+        return 'status-warning'
+    return 'status-critical'
+
+
+# --- charts, drawn from already aggregated frames ---
+# data may be a frame or a zero-argument callable; with cache=chart_context(...) the callable
+# only runs when the figure isn't already in the shared figure cache
+
+@st.cache_resource(show_spinner=False)
+def figure_cache():
+    return FigureCache(max_bytes=Config.FIGURE_CACHE_MB * 1024 * 1024)
+
+
+def chart_context(src, selection=None):
+    """Figure cache scope for this rerun: source, normalized filter state and data generation"""
+    return {
+        'scope': f"{src['db_path']}:{src['table']}",
+        'filters': normalize_selection(selection),
+        'generation': data_generation(src['db_path'], src['table']) if src['columns'] else None
+    }
+
+
+def _frame(data):
+    return data() if callable(data) else data
+
+
+def _has(data, *columns):
+    return data is not None and not data.empty and all(c in data.columns for c in columns if c)
+
+
+def show(fig, height=400):
+    fig.update_layout(height=height)
+    st.plotly_chart(fig, use_container_width=True)
+
+
+def _render(chart_id, build, height, cache=None, source=None, **options):
+    """Draw build(), through the figure cache when given one. source (the chart's data or
+    loader) and options (style arguments) go into the key along with chart_id."""
+    if cache is None:
+        fig = build()
+        if fig is not None:
+            show(fig, height)
+        return
+    store = figure_cache()
+    chart_id = f"{chart_id}:{chart_fingerprint(source, dict(options, height=height))}"
+    key = figure_key(f"{cache['scope']}:{chart_id}", cache['filters'], cache['generation'])
+    spec = store.get(key)
+    if spec is None:
+        fig = build()
+        spec = '' if fig is None else fig.update_layout(height=height).to_json()
+        store.put(key, spec)  # '' remembers that there was nothing to draw
+    if spec:
+        st.plotly_chart(pio.from_json(spec), use_container_width=True)
+
+
+def line(data, x, y, title, color=None, targets=(), height=400, area=False, cache=None):
+    """Line (or area) of y over x; targets are (value, label) reference lines"""
+    def build():
+        frame = _frame(data)
+        if not _has(frame, x, y):
+            return None
+        frame = downsample_frame(frame.sort_values(x), x, y, Config.CHART_MAX_POINTS, Config.CHART_DOWNSAMPLE)
+        plot = px.area if area else px.line
+        fig = plot(frame, x=x, y=y, title=title, color_discrete_sequence=[color] if color else None)
+        for value, label in targets:
+            fig.add_hline(y=value, line_dash="dash", line_color="red", annotation_text=label)
+        fig.update_layout(showlegend=False)
+        return fig
+    _render(f"line:{x}:{y}:{title}", build, height, cache, data, color=color, targets=targets, area=area)
+
+
+def bar(data, x, y, title, color_scale=None, height=400, labels=None, cache=None):
+    """Bars of y per x; several x columns become one "A - B" axis"""
+    keys = [x] if isinstance(x, str) else list(x)
+
+    def build():
+        frame = _frame(data)
+        if not _has(frame, y, *keys):
+            return None
+        axis = keys[0]
+        if len(keys) > 1:
+            axis = '_'.join(keys)
+            frame = frame.assign(**{axis: frame[keys].astype(str).agg(' - '.join, axis=1)})
+        fig = px.bar(frame, x=axis, y=y, title=title, labels=labels,
+                     color=y if color_scale else None, color_continuous_scale=color_scale)
+        fig.update_layout(showlegend=False)
+        return fig
+    _render(f"bar:{'/'.join(keys)}:{y}:{title}", build, height, cache, data, color_scale=color_scale, labels=labels)
+
+
+def grouped_bars(data, x, series, title, height=400, cache=None):
+    """Side by side bars per x for each {column: legend name}"""
+    def build():
+        frame = _frame(data)
+        if not _has(frame, x, *series):
+            return None
+        fig = go.Figure([go.Bar(name=name, x=frame[x], y=frame[col]) for col, name in series.items()])
+        fig.update_layout(title=title, barmode='group')
+        return fig
+    _render(f"grouped:{x}:{'/'.join(series)}:{title}", build, height, cache, data, series=series)
+
+
+def pie(data, names, values, title, height=400, cache=None):
+    def build():
+        frame = _frame(data)
+        if not _has(frame, names, values):
+            return None
+        return px.pie(frame, values=values, names=names, title=title,
+                      color_discrete_sequence=px.colors.qualitative.Set3)
+    _render(f"pie:{names}:{values}:{title}", build, height, cache, data)
+
+
+def histogram(src, column, title, selection=None, bins=30, height=400, cache=None):
+    """Distribution of a numeric column, binned in SQL"""
+    def build():
+        bounds = sql(src, f"SELECT MIN([{column}]) AS lo, MAX([{column}]) AS hi FROM {{table}}{{where}}", selection)
+        if bounds.empty or bounds.isna().any(axis=None):
+            return None
+        lo, hi = float(bounds['lo'][0]), float(bounds['hi'][0])
+        width = (hi - lo) / bins or 1.0
+        data = sql(src, f"SELECT MIN(CAST(([{column}] - ({lo!r})) / {width!r} AS INTEGER), {bins - 1}) AS bin, "
+                        f"COUNT(*) AS n FROM {{table}}{{where}} GROUP BY 1", selection).dropna()
+        if data.empty:
+            return None
+        data[column] = lo + (data['bin'] + 0.5) * width
+        fig = px.bar(data, x=column, y='n', title=title, labels={'n': 'count'})
+        fig.update_layout(bargap=0.02)
+        return fig
+    _render(f"histogram:{column}:{bins}:{title}", build, height, cache)
+
+
+def _heatmap_figure(matrix, title, color_scale='RdYlGn', label=None):
+    if matrix is None or matrix.empty:
+        return None
+    return px.imshow(matrix, color_continuous_scale=color_scale, aspect="auto", title=title,
+                     labels=dict(color=label) if label else None)
+
+
+def heatmap(matrix, title, color_scale='RdYlGn', height=400, label=None, cache=None):
+    _render(f"heatmap:{title}", lambda: _heatmap_figure(_frame(matrix), title, color_scale, label), height, cache,
+            matrix, color_scale=color_scale, label=label)
+
+
+def pivot_heatmap(data, index, columns, values, title, color_scale='RdYlGn', height=400, label=None, cache=None):
+    def build():
+        frame = _frame(data)
+        if not _has(frame, index, columns, values):
+            return None
+        return _heatmap_figure(frame.pivot(index=index, columns=columns, values=values), title, color_scale, label)
+    _render(f"pivot:{index}:{columns}:{values}:{title}", build, height, cache, data,
+            color_scale=color_scale, label=label)
+
+
+def correlation(src, columns, title="Correlation Matrix", selection=None, height=500, cache=None):
+    """Pearson correlation from SQL moments, so no rows are loaded"""
+    columns = list(columns)[:8]
+    if len(columns) < 2:
+        return
+
+    def build():
+        terms = [f"AVG([{c}]) AS m{i}" for i, c in enumerate(columns)]
+        terms += [f"AVG([{a}] * [{b}]) AS p{i}_{j}" for i, a in enumerate(columns)
+                  for j, b in enumerate(columns) if j >= i]
+        moments = sql(src, f"SELECT {', '.join(terms)} FROM {{table}}{{where}}", selection)
+        if moments.empty:
+            return None
+        m = moments.iloc[0]
+        k = len(columns)
+        cov = np.empty((k, k))
+        for i in range(k):
+            for j in range(i, k):
+                cov[i, j] = cov[j, i] = m[f"p{i}_{j}"] - m[f"m{i}"] * m[f"m{j}"]
+        std = np.sqrt(np.clip(np.diag(cov), 1e-12, None))
+        return _heatmap_figure(pd.DataFrame(cov / np.outer(std, std), index=columns, columns=columns), title,
+                               color_scale='RdBu')
+    _render(f"correlation:{'/'.join(columns)}:{title}", build, height, cache)
+
+
+def gauge(value, title, reference, axis_max, bands, threshold, height=350):
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number+delta",
+        value=value,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': title},
+        delta={'reference': reference},
+        gauge={
+            'axis': {'range': [None, axis_max]},
+            'bar': {'color': "#3b82f6"},
+            'steps': [{'range': list(r), 'color': c} for r, c in bands],
+            'threshold': {'line': {'color': "red", 'width': 4}, 'thickness': 0.75, 'value': threshold}
+        }
+    ))
+    show(fig, height)
+
+
+def paged_table(src, selection=None, columns=None, title=None, page_size=50, height=400, key='table'):
+    """Raw rows one page at a time: sort, search and paging run in SQL, only the page is sent"""
+    if title:
+        section(title)
+    names = list(src['columns'])
+    shown = [c for c in columns if c in names] if columns else names
+    if not shown:
+        st.info("No rows to display")
+        return
+
+    search_col, sort_col, order_col, page_col = st.columns([3, 2, 1, 1])
+    search = search_col.text_input("Search", key=f"{key}_search", placeholder="Filter rows...").strip()
+    sort_by = sort_col.selectbox("Sort by", shown, key=f"{key}_sort")
+    descending = order_col.selectbox("Order", ["desc", "asc"], key=f"{key}_order") == "desc"
+
+    text = [c for c in text_columns(src) if c in shown] or shown
+    where, params = where_clause(selection, search, text, columns=src['columns'])
+    table = src['table']
+    total = int(query(src['db_path'], f"SELECT COUNT(*) AS n FROM [{table}]{where}", params, table=table)['n'][0])
+    pages = max(1, -(-total // page_size))
+    page = page_col.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key=f"{key}_page")
+
+    select = ', '.join(f"[{c}]" for c in shown)
+    order = f" ORDER BY [{sort_by}] {'DESC' if descending else 'ASC'}"
+    rows = query(src['db_path'], f"SELECT {select} FROM [{table}]{where}{order} LIMIT ? OFFSET ?",
+                 params + [page_size, (int(page) - 1) * page_size], table=table)
+    st.dataframe(rows, use_container_width=True, height=height, hide_index=True)
+    first = (int(page) - 1) * page_size + 1 if total else 0
+    st.caption(f"Rows {first:,}–{first + len(rows) - 1 if total else 0:,} of {total:,}")
+
+
+# --- sample datasets for demos when the database is empty ---
+
+@st.cache_data
+def sample_manufacturing_data():
+    return manufacturing_frame(days=7, freq='h')
+
+
+@st.cache_data
+def sample_operational_data():
+    return operational_frame(days=31)
+
+
+@st.cache_data
+def sample_sales_data():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=30, freq='D'),
+        'Revenue': rng.normal(50000, 10000, 30),
+        'Customers': rng.poisson(200, 30),
+        'Conversion_Rate': rng.uniform(0.1, 0.2, 30),
+        'Region': rng.choice(['North', 'South', 'East', 'West'], 30),
+    })
+
+
+@st.cache_data
+def sample_financial_data():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'Month': pd.date_range('2024-01-01', periods=12, freq='MS'),
+        'Revenue': rng.normal(100000, 15000, 12),
+        'Costs': rng.normal(60000, 10000, 12),
+        'Profit_Margin': rng.uniform(0.2, 0.4, 12),
+    })
+
+
+@st.cache_data
+def sample_analytics_data():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'Category': ['A', 'B', 'C', 'D', 'E'] * 20,
+        'Value': rng.normal(100, 20, 100),
+        'Date': pd.date_range('2024-01-01', periods=100, freq='D'),
+    })
+
+
+@st.cache_data
+def sample_logistics_data():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'Shipment_ID': range(1, 101),
+        'Origin': rng.choice(['Warehouse A', 'Warehouse B', 'Warehouse C'], 100),
+        'Destination': rng.choice(['City 1', 'City 2', 'City 3', 'City 4'], 100),
+        'Delivery_Time': rng.normal(48, 12, 100),  # hours
+        'Cost': rng.normal(500, 100, 100),
+        'Status': rng.choice(['Delivered', 'In Transit', 'Delayed'], 100, p=[0.7, 0.2, 0.1]),
+    })
+
+
+@st.cache_data
+def sample_energy_data():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=30, freq='D'),
+        'Energy_Consumption': rng.normal(1000, 200, 30),
+        'Efficiency_Rating': rng.uniform(0.7, 0.95, 30),
+        'Cost': rng.normal(150, 30, 30),
+    })
+
+
+@st.cache_data
+def sample_hr_data():
+    rng = np.random.default_rng(42)
+    return pd.DataFrame({
+        'Employee_ID': range(1, 101),
+        'Department': rng.choice(['Engineering', 'Sales', 'HR', 'Finance'], 100),
+        'Salary': rng.normal(75000, 15000, 100),
+        'Experience_Years': rng.integers(1, 20, 100),
+        'Performance_Score': rng.uniform(3.0, 5.0, 100),
+        'Satisfaction_Score': rng.uniform(6.0, 10.0, 100),
+    })
+
+
+SAMPLES = {
+    'manufacturing': sample_manufacturing_data,
+    'operational': sample_operational_data,
+    'sales': sample_sales_data,
+    'financial': sample_financial_data,
+    'analytics': sample_analytics_data,
+    'logistics': sample_logistics_data,
+    'energy': sample_energy_data,
+    'hr': sample_hr_data,
+}
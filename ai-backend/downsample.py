@@ -0,0 +1,62 @@
+import numpy as np
+
+# chart series above this many points get reduced before plotly serializes them
+DEFAULT_MAX_POINTS = 1500
+
+
+def _as_numeric(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ns]').astype(np.int64).astype(float)
+    if np.issubdtype(values.dtype, np.number):
+        return values.astype(float)
+    return np.arange(len(values), dtype=float)  # categories: keep their order
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: n_out indices that keep the visual shape of y over x"""
+    x, y = _as_numeric(x), np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # first and last points are fixed, n_out - 2 buckets in between
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    picked = np.empty(n_out, dtype=np.int64)
+    picked[0], picked[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        if i + 2 < len(edges):
+            nxt = slice(edges[i + 1], max(edges[i + 2], edges[i + 1] + 1))
+            avg_x, avg_y = x[nxt].mean(), y[nxt].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        picked[i + 1] = a
+    return picked
+
+
+def minmax_indices(y, n_out):
+    """Min and max of each bucket, so every peak and trough survives"""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+    bucket = np.arange(n) * (n_out // 2) // n
+    order = np.lexsort((y, bucket))
+    starts = np.flatnonzero(np.r_[True, np.diff(bucket[order]) != 0])
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.r_[0, order[starts], order[ends], n - 1])
+
+
+def downsample_frame(df, x, y, max_points=DEFAULT_MAX_POINTS, method='lttb'):
+    """Rows of df (sorted by x) reduced to about max_points; unchanged when already small"""
+    if method in (None, 'off') or len(df) <= max_points:
+        return df
+    data = df.dropna(subset=[y])
+    if method == 'minmax':
+        idx = minmax_indices(data[y].to_numpy(), max_points)
+    else:
+        idx = lttb_indices(data[x].to_numpy(), data[y].to_numpy(), max_points)
+    return data.iloc[idx]
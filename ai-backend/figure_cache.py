@@ -0,0 +1,110 @@
+import hashlib
+import json
+import threading
+import types
+from collections import OrderedDict
+
+
+def normalize_selection(selection):
+    """Stable string for a sidebar selection, so equal filters hit the same entry"""
+    if not selection:
+        return ''
+    date = selection.get('date')
+    values = {col: sorted(str(v) for v in picked) for col, picked in (selection.get('values') or {}).items()}
+    return json.dumps({'date': [str(d) for d in date] if date else None, 'values': values}, sort_keys=True)
+
+
+_PLAIN = (str, int, float, bool, type(None))
+
+
+def _plain(value):
+    return isinstance(value, _PLAIN) or (isinstance(value, (tuple, list)) and all(isinstance(v, _PLAIN) for v in value))
+
+
+def _code_text(code):
+    # bytecode, names and constants (the SQL text lives here), nested code objects included
+    parts = [code.co_code.hex(), repr(code.co_names)]
+    for const in code.co_consts:
+        parts.append(_code_text(const) if isinstance(const, types.CodeType) else repr(const))
+    return '|'.join(parts)
+
+
+def source_fingerprint(data):
+    """What a chart's data comes from, so two charts with the same axes but different queries
+    never share a figure: a loader's code plus the plain values it closes over or reads
+    from globals (SQL text, column names), or the contents of a frame"""
+    if data is None:
+        return ''
+    if callable(data):
+        code = getattr(data, '__code__', None)
+        if code is None:
+            return repr(data)
+        values = []
+        for cell in data.__closure__ or ():
+            try:
+                values.append(cell.cell_contents)
+            except ValueError:  # cell not filled yet
+                continue
+        values += [data.__globals__.get(name) for name in code.co_names]
+        return _code_text(code) + '|' + repr([v for v in values if _plain(v)])
+    import pandas as pd
+    return repr(list(data.columns)) + ':' + str(int(pd.util.hash_pandas_object(data, index=True).sum()))
+
+
+def chart_fingerprint(data, options):
+    """Short hash of a chart's data source and render options"""
+    text = source_fingerprint(data) + '|' + repr(sorted(options.items()))
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def figure_key(chart_id, filters, generation):
+    return f"{chart_id}|{filters}|{generation}"
+
+
+class FigureCache:
+    """LRU of serialized figures bounded by total bytes, safe to share across sessions"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = len(value.encode('utf-8'))
+        if size > self.max_bytes:
+            return  # one huge figure shouldn't flush everything else
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
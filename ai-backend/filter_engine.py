@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+
+
+class FilterCube:
+    """Pre-aggregated dashboard rows with a packed bitmap per dimension value.
+
+    Built once per data generation from a GROUP BY over the dimensions, carrying
+    sum_<m> / cnt_<m> per measure and n (source rows). A filter change is then a
+    few bitwise ops over the bitmaps instead of a frame copy and isin masks.
+    """
+
+    def __init__(self, frame, dimensions, measures, date_dimension=None):
+        self.size = len(frame)
+        self.dimensions = [d for d in dimensions if d in frame.columns]
+        self.date_dimension = date_dimension if date_dimension in self.dimensions else None
+        self.values, self.codes, self.index, self.bitmaps, self.valid = {}, {}, {}, {}, {}
+        for dim in self.dimensions:
+            codes, uniques = pd.factorize(frame[dim], sort=True)
+            self.codes[dim] = codes
+            self.values[dim] = list(uniques)
+            self.index[dim] = {v: i for i, v in enumerate(self.values[dim])}
+            # one packed row of bits per distinct value; built per value to avoid a dense one-hot
+            bitmaps = np.empty((len(uniques), (self.size + 7) // 8), dtype=np.uint8)
+            for i in range(len(uniques)):
+                bitmaps[i] = np.packbits(codes == i)
+            self.bitmaps[dim] = bitmaps
+            self.valid[dim] = np.packbits(codes >= 0)
+        self._days = (pd.to_datetime(pd.Series(self.values[self.date_dimension]), errors='coerce')
+                      if self.date_dimension else None)
+        self.rows = frame['n'].to_numpy(float) if 'n' in frame.columns else np.ones(self.size)
+        self.sums = {m: frame[f"sum_{m}"].fillna(0).to_numpy(float) for m in measures if f"sum_{m}" in frame.columns}
+        self.counts = {m: frame[f"cnt_{m}"].fillna(0).to_numpy(float) for m in measures if f"cnt_{m}" in frame.columns}
+
+    def options(self, dim):
+        return list(self.values.get(dim, []))
+
+    def date_bounds(self):
+        if self._days is None or self._days.dropna().empty:
+            return None
+        return self._days.min().date(), self._days.max().date()
+
+    def _wanted(self, selection):
+        # dimension -> selected value codes, for every dimension the selection narrows
+        wanted = {}
+        date = (selection or {}).get('date')
+        if date and date[0] == self.date_dimension:
+            _, lo, hi = date
+            in_range = (self._days >= pd.Timestamp(lo)) & (self._days <= pd.Timestamp(hi))
+            wanted[self.date_dimension] = np.flatnonzero(in_range.to_numpy())
+        for dim, picked in (selection or {}).get('values', {}).items():
+            if dim in self.index:
+                wanted[dim] = np.array([self.index[dim][v] for v in picked if v in self.index[dim]], dtype=np.int64)
+        return wanted
+
+    def _dim_bits(self, dim, wanted):
+        bitmaps = self.bitmaps[dim]
+        if len(wanted) * 2 <= len(bitmaps):
+            if not len(wanted):
+                return np.zeros(bitmaps.shape[1], dtype=np.uint8)
+            return np.bitwise_or.reduce(bitmaps[wanted], axis=0)
+        # most values picked: clear the few that weren't instead of OR-ing the many that were
+        rest = np.setdiff1d(np.arange(len(bitmaps)), wanted)
+        if not len(rest):
+            return self.valid[dim]
+        return self.valid[dim] & ~np.bitwise_or.reduce(bitmaps[rest], axis=0)
+
+    def mask(self, selection=None):
+        """Boolean row mask for a sidebar selection ({'date': (dim, lo, hi), 'values': {dim: [...]}})"""
+        packed = None
+        for dim, wanted in self._wanted(selection).items():
+            bits = self._dim_bits(dim, wanted)
+            packed = bits if packed is None else packed & bits
+        if packed is None:
+            return np.ones(self.size, dtype=bool)
+        return np.unpackbits(packed, count=self.size).astype(bool)
+
+    def row_count(self, mask=None):
+        return float(self.rows[mask].sum()) if mask is not None else float(self.rows.sum())
+
+    def total(self, measure, mask=None, how='sum'):
+        """sum or mean of a measure over the masked rows; None if the measure is missing or empty"""
+        if measure not in self.sums:
+            return None
+        keep = slice(None) if mask is None else mask
+        count = self.counts[measure][keep].sum()
+        if not count:
+            return None
+        total = self.sums[measure][keep].sum()
+        return float(total if how == 'sum' else total / count)
+
+    def group(self, dims, measures, mask=None, how='sum'):
+        """Frame of measures per value of dims (one or two dimensions) over the masked rows"""
+        dims = [dims] if isinstance(dims, str) else list(dims)
+        measures = [measures] if isinstance(measures, str) else list(measures)
+        if any(d not in self.codes for d in dims) or any(m not in self.sums for m in measures):
+            return pd.DataFrame()
+        keep = np.ones(self.size, dtype=bool) if mask is None else mask.copy()
+        for d in dims:
+            keep &= self.codes[d] >= 0
+        sizes = [len(self.values[d]) for d in dims]
+        key = np.zeros(int(keep.sum()), dtype=np.int64)
+        for d, size in zip(dims, sizes):
+            key = key * size + self.codes[d][keep]
+        cells = int(np.prod(sizes))
+        counts = {m: np.bincount(key, weights=self.counts[m][keep], minlength=cells) for m in measures}
+        present = np.flatnonzero(np.sum(list(counts.values()), axis=0) > 0)
+
+        out, rest = {}, present
+        for d, size in reversed(list(zip(dims, sizes))):
+            labels = self._days.to_numpy() if d == self.date_dimension else np.asarray(self.values[d], dtype=object)
+            out[d] = labels[rest % size]
+            rest = rest // size
+        data = pd.DataFrame({d: out[d] for d in dims})
+        for m in measures:
+            sums = np.bincount(key, weights=self.sums[m][keep], minlength=cells)[present]
+            if how == 'sum':
+                data[m] = sums
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    data[m] = np.where(counts[m][present] > 0, sums / counts[m][present], np.nan)
+        return data
@@ -1,10 +1,17 @@
+import os
+from datetime import date
+
 import streamlit as st
-import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-import numpy as np
-from datetime import datetime, timedelta
-import random
+
+from sample_data import shipment_frame
+
+# dataset size; the sidebar starts from these and can change them per session
+DEFAULT_START = os.getenv('SHIPMENT_SAMPLE_START', '2024-01-01')
+DEFAULT_END = os.getenv('SHIPMENT_SAMPLE_END', '2024-09-27')
+DEFAULT_ROWS_PER_DAY = (int(os.getenv('SHIPMENT_SAMPLE_MIN_PER_DAY', '5')),
+                        int(os.getenv('SHIPMENT_SAMPLE_MAX_PER_DAY', '25')))
+SEED = int(os.getenv('SHIPMENT_SAMPLE_SEED', '42'))
 
 # Set page config
 st.set_page_config(page_title="AI Generated Dashboard", layout="wide", initial_sidebar_state="collapsed")
@@ -22,54 +29,55 @@ st.markdown("""
 st.title("📊 AI-Generated Shipment Analytics Dashboard")
 st.markdown("*Powered by AI - Generated based on your prompt*")
 
-# Generate sample data
-@st.cache_data
-def load_data():
-    # Create realistic shipment data
-    dates = pd.date_range(start='2024-01-01', end='2024-09-27', freq='D')
-    data = []
-
-    bay_codes = ['LANE01', 'LANE02', 'LANE03', 'LANE04', 'LANE05', 'BAY_A', 'BAY_B', 'BAY_C']
-    product_codes = ['210403', '210404', '210405', '310201', '310202', '410501', '410502']
-
-    for date in dates:
-        # Multiple shipments per day
-        num_shipments = random.randint(5, 25)
-        for _ in range(num_shipments):
-            data.append({
-                'Date': date,
-                'GrossQuantity': random.choice([0, 0, 0] + list(range(50, 1000, 50))),
-                'FlowRate': round(random.uniform(5, 50), 1),
-                'BayCode': random.choice(bay_codes),
-                'BaseProductCode': random.choice(product_codes),
-                'ShipmentID': f"SHIP-{random.randint(10000,99999)}",
-                'ExitTime': f"{random.randint(6,22)}:{random.randint(0,59):02d}",
-                'CreatedTime': f"{random.randint(1,23)}:{random.randint(0,59):02d}"
-            })
-
-    return pd.DataFrame(data)
-
-# Load data
-df = load_data()
+# Dataset controls
+with st.sidebar:
+    st.markdown("## ⚙️ Sample Data")
+    date_range = st.date_input("Date range",
+                               value=(date.fromisoformat(DEFAULT_START), date.fromisoformat(DEFAULT_END)))
+    rows_per_day = st.slider("Shipments per day", 1, 2000, DEFAULT_ROWS_PER_DAY)
+start, end = date_range if len(date_range) == 2 else (date_range[0], date_range[0])
+
+
+# Everything the page shows, computed once per dataset and shared by all sessions.
+# Only these small frames are cached, never the raw shipments.
+@st.cache_data(show_spinner="Generating shipments...")
+def load_aggregates(start, end, rows_per_day, seed):
+    df = shipment_frame(start, end, rows_per_day, seed)
+    bay_product = df.groupby(['BayCode', 'BaseProductCode'], observed=True)['GrossQuantity'].sum().reset_index()
+    return {
+        'total_shipments': len(df),
+        'avg_quantity': df['GrossQuantity'].mean(),
+        'active_bays': df['BayCode'].nunique(),
+        'avg_flow_rate': df['FlowRate'].mean(),
+        'daily_volume': df.groupby('Date')['GrossQuantity'].sum().reset_index(),
+        'bay_performance': df.groupby('BayCode', observed=True).agg({
+            'GrossQuantity': 'sum',
+            'FlowRate': 'mean'
+        }).reset_index(),
+        'product_dist': df['BaseProductCode'].value_counts(),
+        # 500 points is plenty for a scatter; seeded so reruns don't reshuffle it
+        'scatter_sample': df.sample(min(500, len(df)), random_state=seed),
+        'heatmap': bay_product.pivot(index='BayCode', columns='BaseProductCode', values='GrossQuantity').fillna(0),
+        'recent': df.head(10)
+    }
+
+
+agg = load_aggregates(start, end, tuple(rows_per_day), SEED)
 
 # Create metrics row
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    total_shipments = len(df)
-    st.metric("Total Shipments", f"{total_shipments:,}", "↗️ +12.5%")
+    st.metric("Total Shipments", f"{agg['total_shipments']:,}", "↗️ +12.5%")
 
 with col2:
-    avg_quantity = df['GrossQuantity'].mean()
-    st.metric("Avg Quantity", f"{avg_quantity:.0f}", "↗️ +8.2%")
+    st.metric("Avg Quantity", f"{agg['avg_quantity']:.0f}", "↗️ +8.2%")
 
 with col3:
-    active_bays = df['BayCode'].nunique()
-    st.metric("Active Bays", active_bays, "→ Stable")
+    st.metric("Active Bays", agg['active_bays'], "→ Stable")
 
 with col4:
-    avg_flow_rate = df['FlowRate'].mean()
-    st.metric("Avg Flow Rate", f"{avg_flow_rate:.1f}", "↗️ +5.1%")
+    st.metric("Avg Flow Rate", f"{agg['avg_flow_rate']:.1f}", "↗️ +5.1%")
 
 st.markdown("---")
 
@@ -80,8 +88,7 @@ with left_col:
     st.subheader("📈 Shipment Volume Trend")
 
     # Daily shipment volume
-    daily_volume = df.groupby('Date')['GrossQuantity'].sum().reset_index()
-    fig1 = px.line(daily_volume, x='Date', y='GrossQuantity',
+    fig1 = px.line(agg['daily_volume'], x='Date', y='GrossQuantity',
                    title='Daily Shipment Volume Over Time',
                    color_discrete_sequence=['#1f77b4'])
     fig1.update_traces(line=dict(width=3))
@@ -92,12 +99,7 @@ with right_col:
     st.subheader("🏭 Bay Performance Analysis")
 
     # Bay performance
-    bay_performance = df.groupby('BayCode').agg({
-        'GrossQuantity': 'sum',
-        'FlowRate': 'mean'
-    }).reset_index()
-
-    fig2 = px.bar(bay_performance, x='BayCode', y='GrossQuantity',
+    fig2 = px.bar(agg['bay_performance'], x='BayCode', y='GrossQuantity',
                   title='Total Quantity by Bay Code',
                   color='GrossQuantity',
                   color_continuous_scale='viridis')
@@ -110,8 +112,8 @@ left_col2, right_col2 = st.columns(2)
 with left_col2:
     st.subheader("🎯 Product Mix Distribution")
 
-    product_dist = df['BaseProductCode'].value_counts()
-    fig3 = px.pie(values=product_dist.values, names=product_dist.index,
+    product_dist = agg['product_dist']
+    fig3 = px.pie(values=product_dist.values, names=product_dist.index.astype(str),
                   title='Product Code Distribution')
     fig3.update_traces(textposition='inside', textinfo='percent+label')
     fig3.update_layout(height=400)
@@ -120,9 +122,7 @@ with left_col2:
 with right_col2:
     st.subheader("⚡ Flow Rate vs Quantity")
 
-    # Sample 500 points for performance
-    sample_df = df.sample(min(500, len(df)))
-    fig4 = px.scatter(sample_df, x='FlowRate', y='GrossQuantity',
+    fig4 = px.scatter(agg['scatter_sample'], x='FlowRate', y='GrossQuantity',
                       color='BayCode', title='Flow Rate vs Gross Quantity',
                       hover_data=['BaseProductCode'])
     fig4.update_layout(height=400)
@@ -130,10 +130,7 @@ with right_col2:
 
 # Heatmap section
 st.subheader("🔥 Operational Heatmap")
-heatmap_data = df.groupby(['BayCode', 'BaseProductCode'])['GrossQuantity'].sum().reset_index()
-heatmap_pivot = heatmap_data.pivot(index='BayCode', columns='BaseProductCode', values='GrossQuantity').fillna(0)
-
-fig5 = px.imshow(heatmap_pivot,
+fig5 = px.imshow(agg['heatmap'],
                  title='Quantity Heatmap: Bay Code vs Product Code',
                  color_continuous_scale='RdYlBu_r',
                  aspect='auto')
@@ -142,8 +139,8 @@ st.plotly_chart(fig5, use_container_width=True)
 
 # Data table
 st.subheader("📋 Recent Shipments Data")
-st.dataframe(df.head(10), use_container_width=True)
+st.dataframe(agg['recent'], use_container_width=True)
 
 # Footer
 st.markdown("---")
-st.markdown("*🤖 This dashboard was generated using AI based on your prompt. Data refreshes automatically.*")
\ No newline at end of file
+st.markdown("*🤖 This dashboard was generated using AI based on your prompt. Data refreshes automatically.*")
@@ -0,0 +1,42 @@
+import time
+
+# one row per ingested table; generation goes up by one on every load
+MANIFEST_TABLE = '_ingest_manifest'
+
+
+def ensure_manifest(conn):
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS {MANIFEST_TABLE} (
+            table_name TEXT PRIMARY KEY,
+            generation INTEGER NOT NULL,
+            row_count INTEGER,
+            source TEXT,
+            updated_at REAL
+        )
+    """)
+
+
+def bump_generation(conn, table_name, row_count=None, source=None):
+    """Record a fresh load of table_name and return its new generation"""
+    ensure_manifest(conn)
+    with conn:
+        conn.execute(f"""
+            INSERT INTO {MANIFEST_TABLE} (table_name, generation, row_count, source, updated_at)
+            VALUES (?, 1, ?, ?, ?)
+            ON CONFLICT(table_name) DO UPDATE SET
+                generation = generation + 1,
+                row_count = excluded.row_count,
+                source = excluded.source,
+                updated_at = excluded.updated_at
+        """, (table_name, row_count, source, time.time()))
+    row = conn.execute(f"SELECT generation FROM {MANIFEST_TABLE} WHERE table_name = ?", (table_name,)).fetchone()
+    return row[0]
+
+
+def read_generations(conn):
+    """{table_name: generation} for every table ingest has recorded, empty if none"""
+    exists = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                          (MANIFEST_TABLE,)).fetchone()
+    if not exists:
+        return {}
+    return dict(conn.execute(f"SELECT table_name, generation FROM {MANIFEST_TABLE}").fetchall())
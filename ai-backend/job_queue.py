@@ -0,0 +1,168 @@
+import heapq
+import itertools
+import threading
+import time
+import uuid
+
+# lower number runs first
+PRIORITIES = {'high': 0, 'normal': 1, 'low': 2}
+
+
+class QueueFullError(Exception):
+    """Raised when the job queue is already at its max depth"""
+
+
+class GenerationJob:
+    def __init__(self, payload, priority):
+        self.id = uuid.uuid4().hex[:12]
+        self.payload = payload
+        self.priority = priority
+        self.status = 'queued'  # queued -> running -> done / failed
+        self.stage = 'queued'
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def set_stage(self, stage):
+        self.stage = stage
+        print(f"Job {self.id}: {stage}")
+
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'stage': self.stage,
+            'priority': self.priority,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'result': self.result,
+            'error': self.error
+        }
+
+
+class JobQueue:
+    """Bounded priority queue of generation jobs served by a fixed worker pool"""
+
+    def __init__(self, handler, workers=2, max_depth=20, job_ttl=3600, default_duration=30.0):
+        self.handler = handler  # handler(job) -> result dict, raises on failure
+        self.workers = max(1, workers)
+        self.max_depth = max_depth
+        self.job_ttl = job_ttl
+        self._heap = []
+        self._jobs = {}
+        self._seq = itertools.count()  # keeps FIFO order within a priority
+        self._cond = threading.Condition()
+        self._avg_duration = default_duration
+        self._running = 0
+        self._threads = []
+
+    def start(self):
+        if self._threads:
+            return
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker, name=f"generation-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def submit(self, payload, priority='normal'):
+        if priority not in PRIORITIES:
+            priority = 'normal'
+        with self._cond:
+            self._prune()
+            if len(self._heap) >= self.max_depth:
+                raise QueueFullError(f"Generation queue is full ({self.max_depth} jobs waiting)")
+            job = GenerationJob(payload, priority)
+            self._jobs[job.id] = job
+            heapq.heappush(self._heap, (PRIORITIES[priority], next(self._seq), job))
+            self._cond.notify()
+        return job
+
+    def get(self, job_id):
+        with self._cond:
+            return self._jobs.get(job_id)
+
+    def status(self, job_id):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            info = job.to_dict()
+            info['queue_position'] = self._position(job)
+            info['eta_seconds'] = self._eta(job, info['queue_position'])
+            return info
+
+    def stats(self):
+        with self._cond:
+            return {
+                'workers': self.workers,
+                'running': self._running,
+                'queued': len(self._heap),
+                'max_depth': self.max_depth,
+                'avg_job_seconds': round(self._avg_duration, 2)
+            }
+
+    def retry_after(self):
+        """Rough seconds until a queue slot frees up, for 429 responses"""
+        with self._cond:
+            return max(1, int(self._avg_duration / self.workers))
+
+    def _position(self, job):
+        if job.status != 'queued':
+            return 0
+        key = (PRIORITIES[job.priority], None)
+        ahead = 0
+        for prio, seq, other in self._heap:
+            if other is job:
+                key = (prio, seq)
+                break
+        for prio, seq, other in self._heap:
+            if (prio, seq) < key:
+                ahead += 1
+        return ahead + 1
+
+    def _eta(self, job, position):
+        if job.status == 'queued':
+            # jobs ahead drain in waves of `workers`, plus our own run
+            waves = (position - 1) // self.workers
+            if self._running >= self.workers:
+                waves += 1
+            return round((waves + 1) * self._avg_duration, 1)
+        if job.status == 'running':
+            elapsed = time.time() - job.started_at
+            return round(max(0.0, self._avg_duration - elapsed), 1)
+        return 0.0
+
+    def _prune(self):
+        # drop finished jobs once nobody is likely to poll them
+        cutoff = time.time() - self.job_ttl
+        stale = [jid for jid, j in self._jobs.items() if j.finished_at and j.finished_at < cutoff]
+        for jid in stale:
+            del self._jobs[jid]
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                _, _, job = heapq.heappop(self._heap)
+                job.status = 'running'
+                job.started_at = time.time()
+                self._running += 1
+            try:
+                job.result = self.handler(job)
+                job.status = 'done'
+                job.stage = 'done'
+            except Exception as e:
+                print(f"Job {job.id} failed: {e}")
+                job.error = str(e)
+                job.status = 'failed'
+            finally:
+                job.finished_at = time.time()
+                with self._cond:
+                    self._running -= 1
+                    duration = job.finished_at - job.started_at
+                    # moving average keeps ETAs in line with recent load
+                    self._avg_duration = 0.8 * self._avg_duration + 0.2 * duration
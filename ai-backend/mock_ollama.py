@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Mock Ollama server for load testing without a model or GPU
+Implements /api/tags, /api/ps, /api/generate (streaming and not) and embeddings
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CANNED_DASHBOARD = '''```python
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import sqlite3
+
+st.set_page_config(page_title="Mock Dashboard", layout="wide")
+st.title("Mock Ollama Dashboard")
+
+@st.cache_data
+def load_data():
+    conn = sqlite3.connect("{db_path}")
+    df = pd.read_sql_query("SELECT * FROM [{table_name}]", conn)
+    conn.close()
+    return df
+
+df = load_data()
+st.metric("Rows", len(df))
+if 'Lane' in df.columns and 'GrossQuantity' in df.columns:
+    lane_totals = df.groupby('Lane')['GrossQuantity'].sum().reset_index()
+    st.plotly_chart(px.bar(lane_totals, x='Lane', y='GrossQuantity'), use_container_width=True)
+st.dataframe(df.head(50), use_container_width=True)
+```'''
+
+
+class MockSettings:
+    def __init__(self, args):
+        self.model = args.model
+        self.ttft = args.ttft
+        self.tokens_per_sec = args.tokens_per_sec
+        self.error_rate = args.error_rate
+        self.load_time = args.load_time
+        self.embedding_dim = args.embedding_dim
+        self.response_text = CANNED_DASHBOARD
+        if args.response_file:
+            with open(args.response_file) as f:
+                self.response_text = f.read()
+        self.loaded_until = 0.0
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+
+def tokenize(text):
+    # chunk into ~4 char pieces so streamed output looks like model tokens
+    return [text[i:i + 4] for i in range(0, len(text), 4)] or ['']
+
+
+def fake_embedding(text, dim):
+    # deterministic per input so cache tests see stable vectors
+    seed = int(hashlib.sha256(text.encode()).hexdigest()[:16], 16)
+    rng = random.Random(seed)
+    vec = [rng.uniform(-1, 1) for _ in range(dim)]
+    norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+    return [v / norm for v in vec]
+
+
+def fill_template(text, prompt):
+    # point the canned code at the table the backend asked for, when we can find it
+    db_path, table_name = 'data/evaluation_data.db', 'evaluation_data'
+    for line in prompt.splitlines():
+        if 'SQLite database:' in line:
+            db_path = line.split('SQLite database:', 1)[1].strip()
+        elif line.strip().startswith('- Table') and ':' in line:
+            table_name = line.rsplit(':', 1)[1].strip()
+    return text.replace('{db_path}', db_path).replace('{table_name}', table_name)
+
+
+def make_handler(settings):
+    class MockOllamaHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def log_message(self, fmt, *args):
+            pass  # keep load tests quiet
+
+        def _json(self, status, body):
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _body(self):
+            length = int(self.headers.get('Content-Length', 0) or 0)
+            if not length:
+                return {}
+            try:
+                return json.loads(self.rfile.read(length))
+            except ValueError:
+                return {}
+
+        def do_GET(self):
+            if self.path == '/api/tags':
+                self._json(200, {'models': [{'name': settings.model, 'model': settings.model, 'size': 4661224676}]})
+            elif self.path == '/api/ps':
+                models = []
+                if settings.loaded_until > time.time():
+                    expires = datetime.now(timezone.utc) + timedelta(seconds=settings.loaded_until - time.time())
+                    models.append({'name': settings.model, 'model': settings.model, 'size': 4661224676,
+                                   'size_vram': 0, 'expires_at': expires.isoformat()})
+                self._json(200, {'models': models})
+            elif self.path == '/':
+                self._json(200, {'status': 'Ollama is running (mock)', 'requests': settings.requests,
+                                 'errors': settings.errors})
+            else:
+                self._json(404, {'error': 'not found'})
+
+        def do_POST(self):
+            body = self._body()
+            if self.path == '/api/generate':
+                self._generate(body)
+            elif self.path in ('/api/embeddings', '/api/embed'):
+                self._embed(body)
+            else:
+                self._json(404, {'error': 'not found'})
+
+        def _load_model(self, keep_alive):
+            # first request after expiry pays the load time, like a real cold start
+            load_seconds = 0.0
+            with settings.lock:
+                if settings.loaded_until <= time.time():
+                    load_seconds = settings.load_time
+                settings.loaded_until = time.time() + load_seconds + parse_keep_alive(keep_alive)
+            time.sleep(load_seconds)
+            return load_seconds
+
+        def _generate(self, body):
+            with settings.lock:
+                settings.requests += 1
+                fail = random.random() < settings.error_rate
+                if fail:
+                    settings.errors += 1
+            if body.get('model') and body['model'] != settings.model:
+                self._json(404, {'error': f"model '{body['model']}' not found"})
+                return
+            if fail:
+                time.sleep(settings.ttft)
+                self._json(500, {'error': 'mock failure'})
+                return
+
+            start = time.time()
+            load_seconds = self._load_model(body.get('keep_alive', '5m'))
+            prompt = body.get('prompt', '')
+            num_predict = body.get('options', {}).get('num_predict')
+            tokens = tokenize(fill_template(settings.response_text, prompt))
+            if num_predict is not None:
+                tokens = tokens[:max(0, num_predict)]
+            prompt_tokens = max(1, len(prompt) // 4)
+
+            time.sleep(settings.ttft)
+            per_token = 1.0 / settings.tokens_per_sec if settings.tokens_per_sec > 0 else 0.0
+            stats = {
+                'load_duration': int(load_seconds * 1e9),
+                'prompt_eval_count': prompt_tokens,
+                'prompt_eval_duration': int(settings.ttft * 1e9),
+                'eval_count': len(tokens),
+                'eval_duration': int(len(tokens) * per_token * 1e9),
+            }
+
+            if body.get('stream', True):
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/x-ndjson')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                for tok in tokens:
+                    time.sleep(per_token)
+                    self._chunk({'model': settings.model, 'response': tok, 'done': False})
+                final = {'model': settings.model, 'response': '', 'done': True,
+                         'total_duration': int((time.time() - start) * 1e9)}
+                final.update(stats)
+                self._chunk(final)
+                self.wfile.write(b'0\r\n\r\n')
+            else:
+                time.sleep(per_token * len(tokens))
+                result = {'model': settings.model, 'response': ''.join(tokens), 'done': True,
+                          'total_duration': int((time.time() - start) * 1e9)}
+                result.update(stats)
+                self._json(200, result)
+
+        def _chunk(self, obj):
+            data = (json.dumps(obj) + '\n').encode()
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b'\r\n')
+            self.wfile.flush()
+
+        def _embed(self, body):
+            time.sleep(settings.ttft / 4)
+            if self.path == '/api/embed':
+                inputs = body.get('input', '')
+                if isinstance(inputs, str):
+                    inputs = [inputs]
+                self._json(200, {'model': settings.model,
+                                 'embeddings': [fake_embedding(t, settings.embedding_dim) for t in inputs]})
+            else:
+                self._json(200, {'embedding': fake_embedding(body.get('prompt', ''), settings.embedding_dim)})
+
+    return MockOllamaHandler
+
+
+def parse_keep_alive(value):
+    """Seconds from an ollama keep_alive value like 300, '5m', '1h' or -1"""
+    if isinstance(value, (int, float)):
+        return 10 ** 9 if value < 0 else float(value)
+    value = str(value).strip()
+    units = {'s': 1, 'm': 60, 'h': 3600}
+    try:
+        if value[-1] in units:
+            return float(value[:-1]) * units[value[-1]]
+        seconds = float(value)
+        return 10 ** 9 if seconds < 0 else seconds
+    except (ValueError, IndexError):
+        return 300.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock Ollama server for benchmarks')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=11434)
+    parser.add_argument('--model', default='llama3:latest')
+    parser.add_argument('--ttft', type=float, default=0.5, help='seconds to first token')
+    parser.add_argument('--tokens-per-sec', type=float, default=30.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='fraction of generations that fail with 500')
+    parser.add_argument('--load-time', type=float, default=0.0, help='cold model load seconds')
+    parser.add_argument('--embedding-dim', type=int, default=384)
+    parser.add_argument('--response-file', help='file with the text to return instead of the canned dashboard')
+    args = parser.parse_args()
+
+    settings = MockSettings(args)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(settings))
+    server.daemon_threads = True
+    print(f"Mock Ollama on http://{args.host}:{args.port} (model {args.model}, "
+          f"ttft {args.ttft}s, {args.tokens_per_sec} tok/s, error rate {args.error_rate})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+import threading
+import time
+import requests
+from config import Config
+
+
+class ModelManager:
+    """Keeps the Ollama model loaded so user requests never pay a cold load"""
+
+    def __init__(self, base_url=None, model=None, keep_alive=None, rewarm_interval=None):
+        self.base_url = base_url or Config.OLLAMA_URL
+        self.model = model or Config.OLLAMA_MODEL
+        self.keep_alive = keep_alive or Config.OLLAMA_KEEP_ALIVE
+        self.rewarm_interval = rewarm_interval or Config.OLLAMA_REWARM_INTERVAL
+        self.loaded = False
+        self.last_warmup = None
+        self.last_load_seconds = None
+        self.last_error = None
+        self.last_activity = 0.0
+        # last /api/ps answer, refreshed by the rewarm thread so status() never blocks on the node
+        self.residency = {'resident': None}
+        self.residency_checked_at = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def touch(self):
+        # any real generation also refreshes ollama's keep_alive timer
+        self.last_activity = time.time()
+
+    def warm_up(self):
+        """Load the model with a one-token generation"""
+        with self._lock:
+            payload = {
+                "model": self.model,
+                "prompt": "ok",
+                "stream": False,
+                "keep_alive": self.keep_alive,
+                "options": {"num_predict": 1}
+            }
+            start = time.time()
+            try:
+                response = requests.post(f"{self.base_url}/api/generate", json=payload,
+                                         timeout=Config.OLLAMA_WARMUP_TIMEOUT)
+                if response.status_code != 200:
+                    raise RuntimeError(f"HTTP {response.status_code} - {response.text[:200]}")
+                body = response.json()
+                # load_duration is ~0 when the model was already resident
+                load_ns = body.get('load_duration', 0)
+                self.last_load_seconds = round(load_ns / 1e9, 2)
+                self.loaded = True
+                self.last_error = None
+                print(f"Model {self.model} warm ({time.time() - start:.1f}s, load {self.last_load_seconds}s)")
+            except Exception as e:
+                self.loaded = False
+                self.last_error = str(e)
+                print(f"Model warm-up failed: {e}")
+            self.last_warmup = time.time()
+            self.touch()
+            return self.loaded
+
+    def resident_state(self):
+        """What ollama reports as currently loaded (/api/ps)"""
+        try:
+            response = requests.get(f"{self.base_url}/api/ps", timeout=5)
+            if response.status_code != 200:
+                return {'resident': False, 'error': f'HTTP {response.status_code}'}
+            for m in response.json().get('models', []):
+                if m.get('name') == self.model or m.get('model') == self.model:
+                    return {
+                        'resident': True,
+                        'expires_at': m.get('expires_at'),
+                        'size': m.get('size'),
+                        'size_vram': m.get('size_vram')
+                    }
+            return {'resident': False}
+        except Exception as e:
+            return {'resident': False, 'error': str(e)}
+
+    def refresh_residency(self):
+        self.residency = self.resident_state()
+        self.residency_checked_at = time.time()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._rewarm_loop, name="model-rewarm", daemon=True)
+        self._thread.start()
+
+    def _rewarm_loop(self):
+        check_every = max(5, min(60, self.rewarm_interval // 2))
+        self.refresh_residency()
+        while True:
+            time.sleep(check_every)
+            idle = time.time() - self.last_activity
+            if idle >= self.rewarm_interval:
+                print(f"Model idle for {idle:.0f}s - re-warming")
+                self.warm_up()
+            elif not self.loaded:
+                self.warm_up()
+            self.refresh_residency()
+
+    def status(self):
+        state = {
+            'model': self.model,
+            'loaded': self.loaded,
+            'keep_alive': self.keep_alive,
+            'rewarm_interval': self.rewarm_interval,
+            'last_warmup': self.last_warmup,
+            'last_load_seconds': self.last_load_seconds,
+            'idle_seconds': round(time.time() - self.last_activity, 1) if self.last_activity else None,
+            'error': self.last_error,
+            'residency_checked_at': self.residency_checked_at
+        }
+        state.update(self.residency)
+        return state
@@ -0,0 +1,105 @@
+import random
+import threading
+import time
+from collections import deque
+
+
+class NoHealthyNodeError(Exception):
+    """Raised when every Ollama node is ejected"""
+
+
+class OllamaNode:
+    def __init__(self, url):
+        self.url = url.rstrip('/')
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.last_error = None
+        self.latency_ewma = None
+        self._latencies = deque(maxlen=50)
+        self._results = deque(maxlen=20)  # True/False for recent calls
+
+    @property
+    def ejected(self):
+        return self.ejected_until > time.time()
+
+    def health(self):
+        if not self._results:
+            return 1.0
+        # floor keeps a recovering node from starving forever
+        return max(0.1, sum(self._results) / len(self._results))
+
+    def score(self, default_latency):
+        latency = self.latency_ewma or default_latency
+        return (self.outstanding + 1) * latency / self.health()
+
+    def percentile(self, pct):
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return round(ordered[index], 2)
+
+    def to_dict(self):
+        return {
+            'url': self.url,
+            'outstanding': self.outstanding,
+            'requests': self.requests,
+            'failures': self.failures,
+            'health': round(self.health(), 2),
+            'ejected': self.ejected,
+            'ejected_for_seconds': round(max(0.0, self.ejected_until - time.time()), 1),
+            'latency_avg': round(self.latency_ewma, 2) if self.latency_ewma else None,
+            'latency_p50': self.percentile(50),
+            'latency_p95': self.percentile(95),
+            'last_error': self.last_error
+        }
+
+
+class OllamaPool:
+    """Routes LLM calls across Ollama endpoints by least outstanding requests weighted by health"""
+
+    def __init__(self, urls, eject_after=3, eject_seconds=30):
+        self.nodes = [OllamaNode(url) for url in urls if url.strip()]
+        self.eject_after = eject_after
+        self.eject_seconds = eject_seconds
+        self._lock = threading.Lock()
+
+    def acquire(self, exclude=()):
+        with self._lock:
+            candidates = [n for n in self.nodes if not n.ejected and n not in exclude]
+            if not candidates:
+                raise NoHealthyNodeError('All Ollama nodes are ejected or failed')
+            known = [n.latency_ewma for n in self.nodes if n.latency_ewma]
+            default_latency = sum(known) / len(known) if known else 1.0
+            best = min(n.score(default_latency) for n in candidates)
+            # random tie-break spreads load across identical idle nodes
+            node = random.choice([n for n in candidates if n.score(default_latency) == best])
+            node.outstanding += 1
+            node.requests += 1
+            return node
+
+    def release(self, node, ok, latency=None, error=None):
+        with self._lock:
+            node.outstanding = max(0, node.outstanding - 1)
+            node._results.append(bool(ok))
+            if ok:
+                node.consecutive_failures = 0
+                if latency is not None:
+                    node._latencies.append(latency)
+                    node.latency_ewma = latency if node.latency_ewma is None else 0.7 * node.latency_ewma + 0.3 * latency
+                return
+            node.failures += 1
+            node.consecutive_failures += 1
+            node.last_error = error
+            if node.consecutive_failures >= self.eject_after:
+                # after the window passes the node gets traffic again; one more failure re-ejects it
+                node.ejected_until = time.time() + self.eject_seconds
+                node.consecutive_failures = self.eject_after - 1
+                print(f"Ejecting Ollama node {node.url} for {self.eject_seconds}s: {error}")
+
+    def status(self):
+        with self._lock:
+            return [n.to_dict() for n in self.nodes]
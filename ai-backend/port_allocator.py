@@ -0,0 +1,107 @@
+import json
+import os
+import socket
+import threading
+import time
+
+
+class PortExhaustedError(Exception):
+    """Raised when every port in the range is leased or taken by another program"""
+
+
+def port_is_bindable(port, host='127.0.0.1'):
+    # same options Streamlit's server uses, so TIME_WAIT leftovers don't count as taken
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            sock.bind((host, port))
+        except OSError:
+            return False
+    return True
+
+
+class PortAllocator:
+    """Leases ports from [first, last] to dashboard processes.
+
+    allocate() runs under one lock, so concurrent launches never get the same port,
+    and only hands out ports it could bind right now. Leases are written to lease_path,
+    so after a backend restart ports still held by orphaned Streamlit processes stay
+    reserved. A round-robin cursor means a freshly released port is reused last.
+    """
+
+    def __init__(self, first, last, lease_path=None, host='127.0.0.1'):
+        if last < first:
+            raise ValueError(f"empty port range {first}-{last}")
+        self.first = first
+        self.last = last
+        self.lease_path = lease_path
+        self.host = host
+        self._leases = {}  # port -> {'owner', 'leased_at'}
+        self._cursor = first
+        self._lock = threading.Lock()
+        self.allocations = 0
+        self.skipped_busy = 0
+        self._load()
+
+    def _load(self):
+        if not self.lease_path:
+            return
+        try:
+            with open(self.lease_path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        for port, lease in saved.items():
+            port = int(port)
+            # a lease only survives the restart if something still listens on it
+            if self.first <= port <= self.last and not port_is_bindable(port, self.host):
+                self._leases[port] = lease
+        self._save()
+
+    def _save(self):
+        if not self.lease_path:
+            return
+        tmp_path = f"{self.lease_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({str(port): lease for port, lease in sorted(self._leases.items())}, f, indent=1)
+        os.replace(tmp_path, self.lease_path)
+
+    def allocate(self, owner):
+        """Lease a free, bindable port to owner (e.g. a dashboard id)"""
+        with self._lock:
+            size = self.last - self.first + 1
+            for step in range(size):
+                port = self.first + (self._cursor - self.first + step) % size
+                if port in self._leases:
+                    continue
+                if not port_is_bindable(port, self.host):
+                    self.skipped_busy += 1
+                    continue
+                self._leases[port] = {'owner': owner, 'leased_at': time.time()}
+                self._cursor = port + 1 if port < self.last else self.first
+                self.allocations += 1
+                self._save()
+                return port
+        raise PortExhaustedError(f"No free port in {self.first}-{self.last} ({len(self._leases)} leased)")
+
+    def release(self, port):
+        with self._lock:
+            if self._leases.pop(port, None) is None:
+                return False
+            self._save()
+            return True
+
+    def owner(self, port):
+        with self._lock:
+            lease = self._leases.get(port)
+            return lease['owner'] if lease else None
+
+    def stats(self):
+        with self._lock:
+            return {
+                'range': f"{self.first}-{self.last}",
+                'leased': len(self._leases),
+                'free': self.last - self.first + 1 - len(self._leases),
+                'allocations': self.allocations,
+                'skipped_busy': self.skipped_busy
+            }
@@ -0,0 +1,159 @@
+import json
+import math
+import re
+from config import Config
+
+# rough BPE estimate: words cost ~1 token per 4 chars, punctuation 1 each
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+_CAMEL_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+# columns the ingest always produces for shipment data - described once if present
+KEY_SCHEMA = {
+    'BayCode': 'lane/bay performance analysis',
+    'Lane': 'lane extracted from BayCode',
+    'GrossQuantity': 'shipment quantities for throughput analysis',
+    'FlowRate': 'operational flow rates',
+    'ScheduledDate': 'schedule vs actual analysis',
+    'ExitTime': 'timing analysis and shift patterns',
+    'Shift': 'Day_Shift / Night_Shift derived from ExitTime',
+    'BaseProductCode': 'product mix analysis',
+    'ShipmentID': 'operational tracking',
+    'ShipmentCompartmentID': 'operational tracking',
+}
+
+
+def count_tokens(text):
+    total = 0
+    for tok in _TOKEN_RE.findall(text):
+        total += max(1, math.ceil(len(tok) / 4)) if tok[0].isalnum() or tok[0] == '_' else 1
+    return total
+
+
+def _words(text):
+    words = set()
+    for part in re.split(r"[^A-Za-z0-9]+", text):
+        for w in _CAMEL_RE.findall(part):
+            if len(w) > 1:
+                words.add(w.lower())
+    return words
+
+
+class PromptBuilder:
+    """Builds the dashboard generation prompt within a token budget"""
+
+    def __init__(self, token_budget=None, max_columns=None, max_value_chars=None, sample_rows=None):
+        self.token_budget = token_budget or Config.PROMPT_TOKEN_BUDGET
+        self.max_columns = max_columns or Config.PROMPT_MAX_COLUMNS
+        self.max_value_chars = max_value_chars or Config.PROMPT_MAX_VALUE_CHARS
+        self.sample_rows = sample_rows if sample_rows is not None else Config.PROMPT_SAMPLE_ROWS
+
+    def rank_columns(self, columns, user_prompt):
+        prompt_words = _words(user_prompt)
+        scored = []
+        for index, col in enumerate(columns):
+            score = 3 * len(_words(col) & prompt_words)
+            if col in KEY_SCHEMA:
+                score += 2
+            scored.append((-score, index, col))
+        return [col for _, _, col in sorted(scored)]
+
+    def _truncate(self, value):
+        if value is None:
+            return None
+        if isinstance(value, float):
+            if math.isnan(value):
+                return None
+            return round(value, 3)
+        if isinstance(value, (int, bool)):
+            return value
+        text = str(value)
+        if len(text) > self.max_value_chars:
+            text = text[:self.max_value_chars - 3] + '...'
+        return text
+
+    def compact_rows(self, rows, columns, max_rows):
+        # header once, then plain value arrays - no indentation, no repeated keys
+        lines = [json.dumps(columns, separators=(',', ':'))]
+        for row in rows[:max_rows]:
+            values = [self._truncate(row.get(col)) for col in columns]
+            lines.append(json.dumps(values, separators=(',', ':'), default=str))
+        return '\n'.join(lines)
+
+    def _sections(self, user_prompt, dashboard_type, data_context, requirements, columns, n_cols, n_rows, n_req):
+        table = data_context['table_name']
+        shown = columns[:n_cols]
+        hidden = len(columns) - len(shown)
+        column_line = ', '.join(shown) + (f" (+{hidden} more)" if hidden else '')
+
+        sections = [f"""You are an expert Python developer creating a Streamlit dashboard for shipment/logistics data analysis.
+
+USER REQUEST: "{user_prompt}"
+DASHBOARD TYPE: {dashboard_type}
+
+DATA:
+- SQLite database: {data_context['db_path']}
+- Table (use EXACTLY this name, not the Excel filename): {table}
+- Query: SELECT * FROM [{table}]
+- Rows: {data_context.get('total_rows', 'Unknown')}
+- Columns: {column_line}"""]
+
+        if n_rows:
+            sample = self.compact_rows(data_context.get('sample_data', []), shown, n_rows)
+            sections.append(f"SAMPLE ROWS (header, then values):\n{sample}")
+
+        hints = [f"- {col}: {KEY_SCHEMA[col]}" for col in shown if col in KEY_SCHEMA]
+        if hints:
+            sections.append("KEY COLUMNS:\n" + '\n'.join(hints))
+
+        if n_req:
+            sections.append("DASHBOARD REQUIREMENTS:\n" + '\n'.join(requirements[:n_req]))
+
+        sections.append("""RULES:
+1. Load real data with sqlite3 and the query above. NO sample data generation.
+2. Use only the columns listed above and handle missing/null values.
+3. Use Plotly for interactive charts and include filtering and date range selection.
+
+Generate ONLY the Python code for the Streamlit dashboard. Start directly with imports, no explanations.
+
+```python
+""")
+        return '\n\n'.join(sections)
+
+    def build(self, user_prompt, dashboard_type, data_context, requirements_text):
+        columns = self.rank_columns(data_context.get('columns', []), user_prompt)
+        # de-duplicate requirement lines while keeping their order
+        requirements = list(dict.fromkeys(
+            line.strip() for line in requirements_text.splitlines() if line.strip()))
+
+        n_cols = min(self.max_columns, len(columns))
+        n_rows = min(self.sample_rows, len(data_context.get('sample_data', [])))
+        n_req = len(requirements)
+
+        prompt = self._sections(user_prompt, dashboard_type, data_context, requirements, columns, n_cols, n_rows, n_req)
+        tokens = count_tokens(prompt)
+        # shed the least useful context first until we fit
+        while tokens > self.token_budget:
+            if n_rows > 1:
+                n_rows -= 1
+            elif n_req > 2:
+                n_req -= 1
+            elif n_cols > 8:
+                n_cols -= 2
+            elif n_rows:
+                n_rows = 0
+            elif n_req:
+                n_req = 0
+            else:
+                break
+            prompt = self._sections(user_prompt, dashboard_type, data_context, requirements, columns, n_cols, n_rows, n_req)
+            tokens = count_tokens(prompt)
+
+        stats = {
+            'tokens': tokens,
+            'chars': len(prompt),
+            'columns_shown': n_cols,
+            'sample_rows': n_rows,
+            'requirement_lines': n_req,
+            'budget': self.token_budget
+        }
+        return prompt, stats
@@ -0,0 +1,96 @@
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+
+HEALTH_PATH = '/_stcore/health'
+
+
+class BootFailedError(Exception):
+    """Raised when a Streamlit process exits or misses its deadline before serving"""
+
+
+def log_tail(path, max_bytes=2000):
+    """Last max_bytes of a process log, for error messages"""
+    if not path:
+        return ''
+    try:
+        with open(path, 'rb') as f:
+            f.seek(0, 2)
+            f.seek(max(0, f.tell() - max_bytes))
+            return f.read().decode('utf-8', errors='replace').strip()
+    except OSError:
+        return ''
+
+
+def probe(port, host='127.0.0.1', timeout=0.5):
+    """True when Streamlit's health endpoint answers ok"""
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}{HEALTH_PATH}", timeout=timeout) as response:
+            return response.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def wait_until_ready(process, port, deadline=30.0, first_delay=0.05, max_delay=0.25, log_path=None):
+    """Seconds until the server on port passed its health check.
+
+    Polls with exponential backoff (first_delay doubling up to max_delay) and raises
+    BootFailedError, with the tail of log_path, if the process exits or deadline passes first.
+    """
+    start = time.time()
+    delay = first_delay
+    while True:
+        code = process.poll()
+        if code is not None:
+            tail = log_tail(log_path)
+            raise BootFailedError(f"Streamlit exited with code {code} before serving"
+                                  + (f":\n{tail}" if tail else ''))
+        if probe(port):
+            return time.time() - start
+        elapsed = time.time() - start
+        if elapsed >= deadline:
+            raise BootFailedError(f"Streamlit on port {port} not ready after {deadline:.0f}s")
+        time.sleep(min(delay, deadline - elapsed))
+        delay = min(delay * 2, max_delay)
+
+
+class BootHistogram:
+    """Boot durations in fixed buckets plus recent samples for percentiles"""
+
+    BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 21, 34)
+
+    def __init__(self, window=200):
+        self._counts = [0] * (len(self.BUCKETS) + 1)  # last one is overflow
+        self._recent = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.failures = 0
+
+    def observe(self, seconds):
+        with self._lock:
+            index = next((i for i, bound in enumerate(self.BUCKETS) if seconds <= bound), len(self.BUCKETS))
+            self._counts[index] += 1
+            self._recent.append(seconds)
+            self.count += 1
+            self.total += seconds
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def snapshot(self):
+        with self._lock:
+            recent = sorted(self._recent)
+            pct = lambda p: round(recent[min(len(recent) - 1, int(p * len(recent)))], 3) if recent else None
+            labels = [f"le_{bound}" for bound in self.BUCKETS] + ['inf']
+            return {
+                'count': self.count,
+                'failures': self.failures,
+                'mean_seconds': round(self.total / self.count, 3) if self.count else None,
+                'p50_seconds': pct(0.5),
+                'p95_seconds': pct(0.95),
+                'buckets': dict(zip(labels, self._counts))
+            }
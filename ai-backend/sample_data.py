@@ -0,0 +1,115 @@
+"""
+Synthetic datasets for demo dashboards, built column-at-a-time with a seeded RNG.
+No streamlit here, so the runtime, the hardcoded dashboard and the benchmarks share them.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.frequencies import to_offset
+
+LANES = ['Lane_A', 'Lane_B', 'Lane_C', 'Lane_D']
+BAYS = ['Bay_1', 'Bay_2', 'Bay_3']
+PRODUCTS = ['Product_X', 'Product_Y', 'Product_Z']
+SHIFTS = ['Night_Shift', 'Day_Shift']
+DEPARTMENTS = ['Production', 'Logistics', 'Warehouse']
+
+BAY_CODES = ['LANE01', 'LANE02', 'LANE03', 'LANE04', 'LANE05', 'BAY_A', 'BAY_B', 'BAY_C']
+PRODUCT_CODES = ['210403', '210404', '210405', '310201', '310202', '410501', '410502']
+# three zeros in the pool: cancelled / empty loads are common
+QUANTITIES = np.array([0, 0, 0] + list(range(50, 1000, 50)))
+
+# "H:MM" for every minute of the day; indexing this beats formatting millions of strings
+CLOCK = np.array([f"{h}:{m:02d}" for h in range(24) for m in range(60)], dtype=object)
+_SHIPMENT_IDS = None
+
+
+def _shipment_ids():
+    global _SHIPMENT_IDS
+    if _SHIPMENT_IDS is None:
+        _SHIPMENT_IDS = np.array([f"SHIP-{i}" for i in range(10000, 100000)], dtype=object)
+    return _SHIPMENT_IDS
+
+
+def _periods(days, freq):
+    return max(1, int(pd.Timedelta(days=days) / pd.Timedelta(to_offset(freq))))
+
+
+def _labels(codes, names):
+    return pd.Categorical.from_codes(codes, categories=names)
+
+
+def manufacturing_frame(days=7, freq='h', seed=42, end=None):
+    """One row per timestamp x lane x bay: OEE components, production, energy and operator"""
+    rng = np.random.default_rng(seed)
+    stamps = pd.date_range(end=end or datetime.now(), periods=_periods(days, freq), freq=freq)
+    cells = len(LANES) * len(BAYS)
+    n = len(stamps) * cells
+    timestamp = stamps.repeat(cells)
+    hour = timestamp.hour.to_numpy()
+
+    base = np.where((hour >= 8) & (hour <= 16), 100, 60)
+    throughput = np.maximum(0, base + rng.normal(0, 15, n)).astype(np.int64)
+    availability = np.clip(0.85 + rng.normal(0, 0.05, n), 0.7, 0.99)
+    performance = np.clip(0.82 + rng.normal(0, 0.08, n), 0.6, 0.98)
+    quality = np.clip(0.94 + rng.normal(0, 0.03, n), 0.8, 0.99)
+    return pd.DataFrame({
+        'Timestamp': timestamp,
+        'Date': timestamp.normalize(),
+        'Hour': hour,
+        'Lane': _labels(np.tile(np.repeat(np.arange(len(LANES)), len(BAYS)), len(stamps)), LANES),
+        'Bay': _labels(np.tile(np.arange(len(BAYS)), len(stamps) * len(LANES)), BAYS),
+        'Product': _labels(rng.integers(0, len(PRODUCTS), n), PRODUCTS),
+        'Shift': _labels(((hour >= 6) & (hour < 18)).astype(np.int8), SHIFTS),
+        'Planned_Production': (110 + rng.normal(0, 10, n)).astype(np.int64),
+        'Actual_Production': throughput,
+        'Throughput_Units_Hour': throughput,
+        'OEE_Percentage': np.round(availability * performance * quality * 100, 1),
+        'Availability': np.round(availability * 100, 1),
+        'Performance': np.round(performance * 100, 1),
+        'Quality': np.round(quality * 100, 1),
+        'Schedule_Adherence': np.round(np.clip(0.88 + rng.normal(0, 0.06, n), 0.7, 1.0) * 100, 1),
+        'Downtime_Minutes': rng.exponential(5, n).astype(np.int64),
+        'Cycle_Time_Seconds': np.round(60 + rng.normal(0, 8, n), 1),
+        'Energy_Consumption_kWh': np.round(50 + rng.normal(0, 8, n), 1),
+        'Temperature_C': np.round(22 + rng.normal(0, 2, n), 1),
+        'Operator': 'OP_' + rng.integers(100, 999, n).astype(str),
+        'Quality_Score': np.round(quality * 100, 1),
+    })
+
+
+def operational_frame(days=31, seed=42, end=None):
+    """One row per day: efficiency, uptime, fuel and throughput"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(end=(end or datetime.now()).date(), periods=days, freq='D')
+    return pd.DataFrame({
+        'Date': dates,
+        'Operational_Efficiency': np.round(85 + rng.normal(0, 5, days), 2),
+        'Uptime_Percentage': np.round(np.clip(95 + rng.normal(0, 3, days), 80, 99.9), 2),
+        'Fuel_Volume_Liters': np.round(5000 + rng.normal(0, 500, days) + np.arange(days) * 10, 0),
+        'Daily_Throughput': np.round(1000 + rng.normal(0, 100, days), 0),
+        'Cost_Per_Unit': np.round(2.5 + rng.normal(0, 0.2, days), 2),
+        'Energy_Consumption': np.round(800 + rng.normal(0, 50, days), 0),
+        'Department': _labels(rng.integers(0, len(DEPARTMENTS), days), DEPARTMENTS),
+        'Shift': _labels(rng.integers(0, 2, days), ['Day', 'Night']),
+    })
+
+
+def shipment_frame(start='2024-01-01', end='2024-09-27', rows_per_day=(5, 25), seed=42):
+    """Shipments between start and end; rows_per_day is a count or an inclusive (low, high) range"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start=start, end=end, freq='D')
+    low, high = (rows_per_day, rows_per_day) if np.isscalar(rows_per_day) else rows_per_day
+    per_day = rng.integers(low, high + 1, len(dates))
+    n = int(per_day.sum())
+    return pd.DataFrame({
+        'Date': dates.repeat(per_day),
+        'GrossQuantity': rng.choice(QUANTITIES, n),
+        'FlowRate': np.round(rng.uniform(5, 50, n), 1),
+        'BayCode': _labels(rng.integers(0, len(BAY_CODES), n), BAY_CODES),
+        'BaseProductCode': _labels(rng.integers(0, len(PRODUCT_CODES), n), PRODUCT_CODES),
+        'ShipmentID': _shipment_ids()[rng.integers(0, 90000, n)],
+        'ExitTime': CLOCK[rng.integers(6, 23, n) * 60 + rng.integers(0, 60, n)],
+        'CreatedTime': CLOCK[rng.integers(1, 24, n) * 60 + rng.integers(0, 60, n)],
+    })
@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+import time
+
+from port_allocator import PortExhaustedError
+from readiness import BootFailedError, BootHistogram, wait_until_ready
+
+
+def write_assignment(path, dashboard_id, script_path):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'dashboard_id': dashboard_id, 'script': script_path}, f)
+    os.replace(tmp_path, path)
+
+
+class StreamlitWorker:
+    def __init__(self, port, process, assignment_path, log_path):
+        self.port = port
+        self.process = process
+        self.assignment_path = assignment_path
+        self.log_path = log_path
+        self.started_at = time.time()
+        self.ready_at = None
+        self.dashboard_id = None
+
+    def alive(self):
+        return self.process.poll() is None
+
+
+class StreamlitPool:
+    """Idle, already booted Streamlit workers waiting for a dashboard script.
+
+    Each worker runs streamlit_worker.py (heavy imports done, health check passing) and
+    renders whatever script the backend writes into its assignment file. acquire() hands
+    one over in the time it takes to write that file; a background thread boots
+    replacements so the pool stays at its target size.
+    """
+
+    def __init__(self, start_worker, ports, size=2, assignment_dir=None, log_dir=None, boot_timeout=60):
+        self.start_worker = start_worker  # start_worker(port, assignment_path, log_path) -> Popen or None
+        self.ports = ports  # PortAllocator shared with the other launch paths
+        self.size = size
+        self.assignment_dir = assignment_dir
+        self.log_dir = log_dir or assignment_dir
+        self.boot_timeout = boot_timeout
+        self._idle = []  # booted and healthy
+        self._booting = []
+        self._assigned = {}  # port -> worker
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = False
+        self.hits = 0
+        self.misses = 0
+        self.boot_times = BootHistogram()
+
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            os.makedirs(self.assignment_dir, exist_ok=True)
+            self._thread = threading.Thread(target=self._refill_loop, name="streamlit-pool", daemon=True)
+            self._thread.start()
+
+    def _refill_loop(self):
+        while True:
+            with self._cond:
+                while not self._stopped and len(self._idle) + len(self._booting) >= self.size:
+                    self._cond.wait(timeout=5)
+                    self._drop_dead_idle()
+                if self._stopped:
+                    return
+                try:
+                    port = self.ports.allocate('pool-worker')
+                except PortExhaustedError:
+                    self._cond.wait(timeout=5)
+                    continue
+                assignment_path = os.path.join(self.assignment_dir, f"worker_{port}.json")
+                if os.path.exists(assignment_path):
+                    os.remove(assignment_path)  # a fresh worker must not pick up an old dashboard
+                log_path = os.path.join(self.log_dir, f"streamlit_worker_{port}.log")
+                process = self.start_worker(port, assignment_path, log_path)
+                if process is None:
+                    self.boot_times.failure()
+                    self.ports.release(port)
+                    self._cond.wait(timeout=5)
+                    continue
+                worker = StreamlitWorker(port, process, assignment_path, log_path)
+                self._booting.append(worker)
+            # boots run side by side; the loop goes on to the next one right away
+            threading.Thread(target=self._wait_until_ready, args=(worker,), daemon=True).start()
+
+    def _wait_until_ready(self, worker):
+        try:
+            seconds = wait_until_ready(worker.process, worker.port, deadline=self.boot_timeout,
+                                       log_path=worker.log_path)
+        except BootFailedError as e:
+            print(f"Streamlit worker on port {worker.port} failed to boot: {e}")
+            seconds = None
+        with self._cond:
+            self._booting.remove(worker)
+            if seconds is not None:
+                worker.ready_at = time.time()
+                self.boot_times.observe(seconds)
+                self._idle.append(worker)
+            else:
+                self.boot_times.failure()
+                if worker.alive():
+                    worker.process.terminate()
+                self.ports.release(worker.port)
+            self._cond.notify_all()
+
+    def _discard(self, worker):
+        """Give back the port and assignment file of a worker that died; caller holds _cond"""
+        if os.path.exists(worker.assignment_path):
+            os.remove(worker.assignment_path)
+        self.ports.release(worker.port)
+
+    def _drop_dead_idle(self):
+        for worker in [w for w in self._idle if not w.alive()]:
+            self._idle.remove(worker)
+            self._discard(worker)
+
+    def acquire(self, dashboard_id, script_path):
+        """Hand script_path to an idle worker and return it, or None if none is warm yet"""
+        with self._cond:
+            while self._idle:
+                worker = self._idle.pop(0)
+                if worker.alive():
+                    break
+                self._discard(worker)
+            else:
+                self.misses += 1
+                self._cond.notify_all()
+                return None
+            write_assignment(worker.assignment_path, dashboard_id, script_path)
+            worker.dashboard_id = dashboard_id
+            self._assigned[worker.port] = worker
+            self.hits += 1
+            self._cond.notify_all()  # wake the refill thread
+            return worker
+
+    def release(self, port):
+        """Stop the worker serving port; its port goes back to the pool"""
+        with self._cond:
+            worker = self._assigned.pop(port, None)
+            self._cond.notify_all()
+        if worker is None:
+            return False
+        if worker.alive():
+            worker.process.terminate()
+        if os.path.exists(worker.assignment_path):
+            os.remove(worker.assignment_path)
+        self.ports.release(port)
+        return True
+
+    def shutdown(self):
+        with self._cond:
+            self._stopped = True
+            workers = self._idle + self._booting + list(self._assigned.values())
+            self._idle, self._assigned = [], {}
+            self._cond.notify_all()
+        for worker in workers:
+            if worker.alive():
+                worker.process.terminate()
+            self.ports.release(worker.port)
+
+    def stats(self):
+        with self._cond:
+            return {
+                'target_size': self.size,
+                'idle': len(self._idle),
+                'booting': len(self._booting),
+                'assigned': len(self._assigned),
+                'hits': self.hits,
+                'misses': self.misses,
+                'boot': self.boot_times.snapshot()
+            }
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Pre-warmed Streamlit worker for the dashboard pool
+Imports the heavy libraries first, then boots Streamlit on dashboard_host.py in the same interpreter,
+so the first dashboard run finds pandas, plotly and the runtime already in sys.modules
+
+usage: streamlit_worker.py <port>   (DASHBOARD_ASSIGNMENT names the file the backend writes the script into)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dashboard_runtime  # noqa: F401 - pulls in streamlit, pandas, numpy and plotly
+from streamlit.web import cli
+
+HOST_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard_host.py')
+
+
+if __name__ == '__main__':
+    sys.argv = [
+        'streamlit', 'run', HOST_SCRIPT,
+        '--server.port', sys.argv[1],
+        '--server.headless', 'true',
+        '--server.enableCORS', 'false',
+        '--server.enableXsrfProtection', 'false'
+    ]
+    sys.exit(cli.main())
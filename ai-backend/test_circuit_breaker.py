@@ -0,0 +1,102 @@
+import time
+import unittest
+
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, AdaptiveTimeout, CircuitBreaker
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def open_breaker(self, **kwargs):
+        breaker = CircuitBreaker(failure_threshold=3, **kwargs)
+        for _ in range(3):
+            self.assertTrue(breaker.allow())
+            breaker.record_failure()
+        return breaker
+
+    def expire(self, breaker):
+        breaker.opened_at = time.time() - breaker.reset_timeout - 1
+
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        breaker.record_failure()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CLOSED)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, OPEN)
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertEqual(breaker.failures, 1)
+
+    def test_open_rejects_until_reset_timeout(self):
+        breaker = self.open_breaker(reset_timeout=30)
+        self.assertFalse(breaker.allow())
+        self.assertFalse(breaker.allow())
+        status = breaker.status()
+        self.assertEqual(status['rejected'], 2)
+        self.assertGreater(status['retry_in_seconds'], 0)
+
+    def test_half_open_lets_one_probe_through(self):
+        breaker = self.open_breaker(reset_timeout=30, half_open_probes=1)
+        self.expire(breaker)
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, HALF_OPEN)
+        self.assertFalse(breaker.allow())  # probe still in flight
+
+    def test_successful_probe_closes(self):
+        breaker = self.open_breaker()
+        self.expire(breaker)
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, CLOSED)
+        self.assertTrue(breaker.allow())
+        self.assertTrue(breaker.allow())
+
+    def test_failed_probe_reopens_immediately(self):
+        breaker = self.open_breaker(reset_timeout=30)
+        self.expire(breaker)
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, OPEN)
+        self.assertFalse(breaker.allow())
+        # the next window starts a fresh probe budget
+        self.expire(breaker)
+        self.assertTrue(breaker.allow())
+
+
+class AdaptiveTimeoutTest(unittest.TestCase):
+    def test_initial_until_enough_samples(self):
+        timeout = AdaptiveTimeout(initial=60, minimum=10, maximum=120, min_samples=5)
+        for _ in range(4):
+            timeout.observe(20)
+        self.assertEqual(timeout.current(), 60)
+        timeout.observe(20)
+        self.assertEqual(timeout.current(), 30)
+
+    def test_clamped_to_bounds(self):
+        timeout = AdaptiveTimeout(initial=60, minimum=10, maximum=120, min_samples=1)
+        timeout.observe(1)
+        self.assertEqual(timeout.current(), 10)
+        timeout.observe(500)
+        self.assertEqual(timeout.current(), 120)
+
+    def test_timeouts_push_the_estimate_back_up(self):
+        timeout = AdaptiveTimeout(initial=120, minimum=10, maximum=600, min_samples=5)
+        for _ in range(10):
+            timeout.observe(8)
+        self.assertEqual(timeout.current(), 12)
+        seen = [timeout.current()]
+        for _ in range(3):
+            timeout.observe_timeout(timeout.current())
+            seen.append(timeout.current())
+        self.assertEqual(seen, sorted(seen))
+        self.assertGreater(seen[-1], seen[0])
+        self.assertEqual(timeout.status()['timeouts'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import tempfile
+import unittest
+
+from code_store import CodeStore, code_key, schema_fingerprint
+
+CONTEXT = {'db_path': '/data/terminal_data.db', 'table_name': 'evaluation_data', 'columns': ['Lane', 'GrossQuantity']}
+
+
+class KeyTest(unittest.TestCase):
+    def test_schema_fingerprint(self):
+        self.assertEqual(schema_fingerprint(CONTEXT), schema_fingerprint(dict(CONTEXT, total_rows=5)))
+        self.assertNotEqual(schema_fingerprint(CONTEXT), schema_fingerprint(dict(CONTEXT, columns=['Lane'])))
+        self.assertNotEqual(schema_fingerprint(CONTEXT), schema_fingerprint(dict(CONTEXT, table_name='other')))
+
+    def test_code_key(self):
+        template = code_key('template', 'sales', CONTEXT)
+        self.assertEqual(template, f"template:sales:{schema_fingerprint(CONTEXT)}")
+        llm = code_key('llm', 'sales', CONTEXT, prompt=' Sales by Region ', model='m')
+        self.assertEqual(llm, code_key('llm', 'sales', CONTEXT, prompt='sales by region', model='m'))
+        self.assertNotEqual(llm, code_key('llm', 'sales', CONTEXT, prompt='sales by region', model='other'))
+
+
+class CodeStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def test_identical_code_shares_one_file(self):
+        store = CodeStore(self.dir)
+        first = store.put('template:a', 'print(1)\n')
+        second = store.put('template:b', 'print(1)\n')
+        self.assertEqual(first, second)
+        self.assertNotEqual(store.put('template:c', 'print(2)\n'), first)
+        self.assertEqual(len([f for f in os.listdir(self.dir) if f.endswith('.py')]), 2)
+
+    def test_write_leaves_an_existing_file_alone(self):
+        store = CodeStore(self.dir)
+        path = store.write('x = 1\n')
+        mtime = os.path.getmtime(path)
+        os.utime(path, (mtime - 100, mtime - 100))
+        self.assertEqual(store.write('x = 1\n'), path)
+        self.assertEqual(os.path.getmtime(path), mtime - 100)
+
+    def test_lookup_and_read(self):
+        store = CodeStore(self.dir)
+        self.assertIsNone(store.lookup('missing'))
+        store.put('k', 'y = 2\n')
+        self.assertEqual(store.read('k'), 'y = 2\n')
+        self.assertEqual(store.stats(), {'keys': 1, 'hits': 1, 'misses': 1})
+
+    def test_deleted_file_drops_its_key(self):
+        store = CodeStore(self.dir)
+        os.remove(store.put('k', 'z = 3\n'))
+        self.assertIsNone(store.lookup('k'))
+        self.assertEqual(store.stats()['keys'], 0)
+
+    def test_only_persisted_keys_survive_a_restart(self):
+        store = CodeStore(self.dir)
+        store.put('template:a', 'a = 1\n')
+        llm_path = store.put('llm:b', 'b = 1\n', persist=True)
+        with open(store.index_path) as f:
+            self.assertEqual(json.load(f), {'llm:b': os.path.basename(llm_path)})
+
+        restarted = CodeStore(self.dir)
+        self.assertEqual(restarted.lookup('llm:b'), llm_path)
+        self.assertIsNone(restarted.lookup('template:a'))
+
+    def test_restart_skips_entries_whose_file_is_gone(self):
+        store = CodeStore(self.dir)
+        os.remove(store.put('llm:b', 'b = 1\n', persist=True))
+        self.assertEqual(CodeStore(self.dir).stats()['keys'], 0)
+
+    def test_unreadable_index_is_ignored(self):
+        with open(os.path.join(self.dir, 'code_index.json'), 'w') as f:
+            f.write('{broken')
+        self.assertEqual(CodeStore(self.dir).stats()['keys'], 0)
+
+    def test_index_keeps_the_most_recent_keys(self):
+        store = CodeStore(self.dir, max_keys=2)
+        paths = [store.put(f"k{i}", f"v = {i}\n") for i in range(2)]
+        store.lookup('k0')
+        store.put('k2', 'v = 2\n')
+        self.assertIsNone(store.lookup('k1'))
+        self.assertEqual(store.lookup('k0'), paths[0])
+        self.assertTrue(os.path.exists(paths[1]))  # the file stays, a running dashboard may use it
+
+
+if __name__ == '__main__':
+    unittest.main()
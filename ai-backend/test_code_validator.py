@@ -0,0 +1,106 @@
+import unittest
+
+from code_validator import DashboardCodeValidator
+
+CONTEXT = {'table_name': 'evaluation_data', 'columns': ['Lane', 'GrossQuantity', 'Shift']}
+
+VALID = '''
+import os
+import sqlite3
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+DB_PATH = os.getenv('DB_PATH', 'terminal_data.db')
+
+
+@st.cache_data
+def load(path):
+    with sqlite3.connect(path) as conn:
+        query = "SELECT Lane, SUM(GrossQuantity) AS Total FROM evaluation_data GROUP BY Lane"
+        return pd.read_sql(query, conn)
+
+
+df = load(DB_PATH)
+st.title("Select data from evaluation")
+st.caption("Update data from source, or start with the data from last week")
+for lane, group in df.groupby('Lane'):
+    st.write(lane, len(group))
+totals = {row['Lane']: row['Total'] for _, row in df.iterrows()}
+if (n := len(totals)) > 0:
+    st.plotly_chart(px.bar(df, x='Lane', y='Total'))
+try:
+    st.metric("Lanes", n)
+except Exception as e:
+    st.error(str(e))
+'''
+
+
+class StaticChecksTest(unittest.TestCase):
+    def setUp(self):
+        self.validator = DashboardCodeValidator(dry_run=False, dry_run_workers=1)
+
+    def errors(self, code, context=CONTEXT):
+        return self.validator.static_errors(code, context)
+
+    def test_valid_dashboard_passes(self):
+        self.assertEqual(self.errors(VALID), [])
+
+    def test_syntax_error(self):
+        self.assertEqual(self.errors('if True\n    pass'), ["SyntaxError on line 1: expected ':'"])
+
+    def test_missing_import(self):
+        errors = self.errors('import streamlit as st\nst.plotly_chart(px.bar(x=[1], y=[2]))\n')
+        self.assertEqual(errors, ["Name 'px' is not defined on line 2 - missing import?"])
+
+    def test_star_import_skips_name_check(self):
+        self.assertEqual(self.errors('from math import *\nprint(sqrt(4))\n'), [])
+
+    def test_imports_outside_the_whitelist(self):
+        self.assertEqual(self.errors('import subprocess\n'), ["Import of 'subprocess' is not allowed"])
+
+    def test_os_and_sys_are_restricted(self):
+        self.assertEqual(self.errors('import os\nos.system("ls")\n'), ["'os.system' is not allowed"])
+        self.assertEqual(self.errors('from os import remove\n'), ["'os.remove' is not allowed"])
+        self.assertEqual(self.errors('import sys\nsys.modules.clear()\n'), ["'sys.modules' is not allowed"])
+        self.assertEqual(len(self.errors('import os as o\ngetattr(o, "system")("ls")\n')), 1)
+        self.assertEqual(self.errors('import sys\nsys.path.insert(0, "/opt/runtime")\n'), [])
+
+    def test_builtins_that_bypass_imports(self):
+        self.assertEqual(self.errors('eval("1")\n'), ["Use of 'eval' is not allowed"])
+        self.assertEqual(self.errors('__import__("os")\n'), ["Use of '__import__' is not allowed"])
+
+    def test_ui_text_is_not_sql(self):
+        code = 'import streamlit as st\nst.write("Select data from evaluation")\nst.write("Delete from favourites")\n'
+        self.assertEqual(self.errors(code), [])
+
+    def test_unknown_table_in_query_call(self):
+        code = 'import sqlite3\nimport pandas as pd\nconn = sqlite3.connect("x")\ndf = pd.read_sql("select * from sales", conn)\n'
+        self.assertEqual(self.errors(code), ["Unknown table 'sales' in SQL - use 'evaluation_data'"])
+
+    def test_unknown_table_in_sql_shaped_string(self):
+        self.assertEqual(self.errors('QUERY = "SELECT * FROM shipments"\n'),
+                         ["Unknown table 'shipments' in SQL - use 'evaluation_data'"])
+
+    def test_placeholders_are_not_table_names(self):
+        code = ('import sqlite3\nimport pandas as pd\nTABLE = "evaluation_data"\nconn = sqlite3.connect("x")\n'
+                'df = pd.read_sql(f"SELECT * FROM [{TABLE}]", conn)\n')
+        self.assertEqual(self.errors(code), [])
+
+    def test_unknown_column(self):
+        code = 'import pandas as pd\ndf = pd.DataFrame()\nprint(df["Lane"], df["Revenue"])\n'
+        self.assertEqual(self.errors(code), ["Unknown column 'Revenue'"])
+
+    def test_columns_created_by_the_script(self):
+        code = ('import pandas as pd\ndf = pd.DataFrame()\ndf["Revenue"] = 1\n'
+                'summary = df.assign(Share=1)\nprint(df["Revenue"], summary["Share"])\n')
+        self.assertEqual(self.errors(code), [])
+
+    def test_validate_reports_timing(self):
+        result = self.validator.validate(VALID, CONTEXT)
+        self.assertTrue(result['valid'])
+        self.assertIn('elapsed_ms', result)
+
+
+if __name__ == '__main__':
+    unittest.main()
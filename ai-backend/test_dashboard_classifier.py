@@ -0,0 +1,60 @@
+import unittest
+
+from dashboard_classifier import DEFAULT_TYPE, DashboardClassifier
+
+
+class DashboardClassifierTest(unittest.TestCase):
+    def setUp(self):
+        self.classifier = DashboardClassifier()
+
+    def test_ranking_with_confidence(self):
+        ranking = self.classifier.classify('sales revenue by region')
+        self.assertEqual(ranking, [
+            {'type': 'sales', 'score': 4.5, 'confidence': 0.818},
+            {'type': 'financial', 'score': 1.0, 'confidence': 0.182},
+        ])
+
+    def test_no_keywords_falls_back_to_default(self):
+        self.assertEqual(self.classifier.classify('show me something nice'),
+                         [{'type': DEFAULT_TYPE, 'score': 0.0, 'confidence': 0.0}])
+        self.assertEqual(self.classifier.best_type(''), DEFAULT_TYPE)
+
+    def test_ties_follow_type_order(self):
+        # 'revenue' weighs the same for financial and sales; financial comes first in TYPE_ORDER
+        self.assertEqual([r['type'] for r in self.classifier.classify('revenue')], ['financial', 'sales'])
+
+    def test_phrases_add_to_their_words(self):
+        ranking = self.classifier.classify('supply chain overview')
+        self.assertEqual(ranking[0], {'type': 'logistics', 'score': 3.0, 'confidence': 1.0})
+        self.assertEqual(self.classifier.classify('cycle time by bay')[0]['score'], 4.0)
+
+    def test_plurals_fold_to_keywords(self):
+        self.assertEqual(self.classifier.best_type('late deliveries and shipments'), 'logistics')
+        self.assertEqual(self.classifier.classify('employees')[0]['type'], 'hr')
+
+    def test_words_inside_other_words_do_not_match(self):
+        # 'hr' must not fire for 'three', nor 'lead' for 'leaderboard'
+        self.assertEqual(self.classifier.best_type('three leaderboard'), DEFAULT_TYPE)
+
+    def test_case_and_spacing_share_a_cache_entry(self):
+        self.classifier.classify('OEE  by Lane')
+        self.classifier.classify('oee by lane')
+        info = self.classifier.cache_info()
+        self.assertEqual((info['hits'], info['misses']), (1, 1))
+
+    def test_results_are_copies(self):
+        self.classifier.classify('sales')[0]['type'] = 'changed'
+        self.assertEqual(self.classifier.best_type('sales'), 'sales')
+
+    def test_custom_keywords(self):
+        classifier = DashboardClassifier(keywords={'energy': {'solar panel': 2.0}})
+        self.assertEqual(classifier.classify('solar panel output')[0], {'type': 'energy', 'score': 2.0, 'confidence': 1.0})
+        self.assertEqual(classifier.best_type('solar output'), DEFAULT_TYPE)
+
+    def test_batch(self):
+        self.assertEqual([r[0]['type'] for r in self.classifier.classify_batch(['oee', 'profit', ''])],
+                         ['manufacturing', 'financial', DEFAULT_TYPE])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import contextlib
+import io
+import os
+import socket
+import unittest
+from unittest import mock
+
+from dashboard_reaper import DashboardReaper, open_connections, process_rss
+
+MB = 1024 * 1024
+NOW = 100_000.0
+
+
+class FakeProcess:
+    def __init__(self, pid):
+        self.pid = pid
+
+
+class DashboardReaperTest(unittest.TestCase):
+    def setUp(self):
+        self.dashboards = {}
+        self.connections = {}  # port -> open connections
+        self.rss = {}  # pid -> bytes
+        for target, fake in (('open_connections', lambda port: self.connections.get(port, 0)),
+                             ('process_rss', lambda pid: self.rss.get(pid)),
+                             ('time.time', lambda: NOW)):
+            patcher = mock.patch(f"dashboard_reaper.{target}", fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def add(self, dashboard_id, idle_for, rss_mb=100, hosted=False):
+        port = 9000 + len(self.dashboards)
+        self.rss[port] = rss_mb * MB
+        self.dashboards[dashboard_id] = {
+            'port': port, 'process': None if hosted else FakeProcess(port), 'last_access': NOW - idle_for,
+            'created_at': '2026-01-01T00:00:00', 'prompt': f"prompt {dashboard_id}", 'filepath': f"/d/{dashboard_id}.py"
+        }
+
+    def reaper(self, **limits):
+        settings = dict(max_dashboards=10, max_rss_mb=0, idle_timeout=0)
+        settings.update(limits)
+        return DashboardReaper(self.dashboards, lambda dashboard_id: self.dashboards.pop(dashboard_id, None), **settings)
+
+    def sweep(self, reaper):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return reaper.sweep()
+
+    def test_count_ceiling_evicts_least_recently_used(self):
+        for dashboard_id, idle_for in (('new', 10), ('oldest', 300), ('middle', 200), ('old', 250)):
+            self.add(dashboard_id, idle_for)
+        reaper = self.reaper(max_dashboards=2)
+        self.assertEqual(self.sweep(reaper), ['oldest', 'old'])
+        self.assertEqual(sorted(self.dashboards), ['middle', 'new'])
+        self.assertEqual(reaper.evicted_record('oldest')['reason'], 'max_dashboards')
+
+    def test_idle_timeout(self):
+        self.add('idle', 4000)
+        self.add('recent', 60)
+        self.add('watched', 4000)
+        self.connections[self.dashboards['watched']['port']] = 1
+        reaper = self.reaper(idle_timeout=1800)
+        self.assertEqual(self.sweep(reaper), ['idle'])
+        self.assertEqual(self.dashboards['watched']['last_access'], NOW)  # an open tab counts as access
+        self.assertEqual(self.dashboards['watched']['connections'], 1)
+
+    def test_memory_ceiling_evicts_oldest_until_under(self):
+        self.add('a', 300, rss_mb=500)
+        self.add('b', 200, rss_mb=500)
+        self.add('c', 100, rss_mb=500)
+        reaper = self.reaper(max_rss_mb=1100)
+        self.assertEqual(self.sweep(reaper), ['a'])
+        self.assertEqual(reaper.stats()['total_rss_mb'], 1000.0)
+        self.assertEqual(reaper.evicted_record('a')['reason'], 'memory')
+
+    def test_hosted_dashboards_are_left_alone(self):
+        self.add('hosted', 9999, hosted=True)
+        self.add('own', 10)
+        self.assertEqual(self.sweep(self.reaper(max_dashboards=0, idle_timeout=60)), ['own'])
+        self.assertIn('hosted', self.dashboards)
+
+    def test_nothing_to_do(self):
+        self.add('a', 10)
+        reaper = self.reaper(max_dashboards=5, max_rss_mb=4096, idle_timeout=1800)
+        self.assertEqual(self.sweep(reaper), [])
+        self.assertEqual(reaper.stats()['sweeps'], 1)
+
+    def test_dashboard_stopped_meanwhile_is_not_recorded(self):
+        self.add('a', 300)
+        reaper = DashboardReaper(self.dashboards, lambda dashboard_id: None, max_dashboards=0, max_rss_mb=0)
+        self.assertEqual(self.sweep(reaper), [])
+        self.assertEqual(reaper.evictions(), [])
+
+    def test_eviction_records(self):
+        for i in range(4):
+            self.add(f"d{i}", 100 - i)
+        reaper = self.reaper(max_dashboards=0, max_evicted=3)
+        self.sweep(reaper)
+        self.assertEqual([record['id'] for record in reaper.evictions()], ['d1', 'd2', 'd3'])
+        self.assertEqual(reaper.evicted_record('d3')['filepath'], '/d/d3.py')
+        self.assertEqual(reaper.stats()['evicted_by_reason'], {'max_dashboards': 3})
+        self.assertIsNotNone(reaper.forget('d3'))
+        self.assertIsNone(reaper.evicted_record('d3'))
+
+
+class ProcessProbeTest(unittest.TestCase):
+    def test_process_rss_of_this_process(self):
+        rss = process_rss(os.getpid())
+        if rss is None:
+            self.skipTest('no psutil or /proc here')
+        self.assertGreater(rss, MB)
+
+    def test_open_connections_counts_established_clients(self):
+        server = socket.socket()
+        server.bind(('127.0.0.1', 0))
+        server.listen()
+        port = server.getsockname()[1]
+        self.addCleanup(server.close)
+        if open_connections(port) is None:
+            self.skipTest('no psutil or /proc here')
+        self.assertEqual(open_connections(port), 0)
+        client = socket.create_connection(('127.0.0.1', port))
+        self.addCleanup(client.close)
+        accepted, _ = server.accept()
+        self.addCleanup(accepted.close)
+        self.assertEqual(open_connections(port), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
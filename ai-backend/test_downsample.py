@@ -0,0 +1,85 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from downsample import downsample_frame, lttb_indices, minmax_indices
+
+
+class LttbTest(unittest.TestCase):
+    def test_small_series_unchanged(self):
+        x = np.arange(10)
+        np.testing.assert_array_equal(lttb_indices(x, x, 10), np.arange(10))
+        np.testing.assert_array_equal(lttb_indices(x, x, 50), np.arange(10))
+        np.testing.assert_array_equal(lttb_indices(x, x, 2), np.arange(10))  # too few to bucket
+        self.assertEqual(len(lttb_indices([], [], 5)), 0)
+
+    def test_picks_n_out_sorted_indices_with_endpoints(self):
+        rng = np.random.default_rng(0)
+        y = rng.normal(size=10_000).cumsum()
+        idx = lttb_indices(np.arange(len(y)), y, 500)
+        self.assertEqual(len(idx), 500)
+        self.assertEqual((idx[0], idx[-1]), (0, len(y) - 1))
+        self.assertTrue(np.all(np.diff(idx) > 0))
+
+    def test_keeps_a_spike(self):
+        y = np.zeros(5_000)
+        y[3_210] = 100.0
+        self.assertIn(3_210, lttb_indices(np.arange(len(y)), y, 100))
+
+    def test_datetime_and_categorical_x(self):
+        y = np.sin(np.linspace(0, 20, 2_000))
+        dates = pd.date_range('2024-01-01', periods=len(y), freq='h').to_numpy()
+        labels = np.array([f"c{i}" for i in range(len(y))], dtype=object)
+        self.assertEqual(len(lttb_indices(dates, y, 300)), 300)
+        np.testing.assert_array_equal(lttb_indices(labels, y, 300), lttb_indices(np.arange(len(y)), y, 300))
+
+
+class MinMaxTest(unittest.TestCase):
+    def test_small_series_unchanged(self):
+        np.testing.assert_array_equal(minmax_indices(np.arange(5), 5), np.arange(5))
+        np.testing.assert_array_equal(minmax_indices(np.arange(5), 1), np.arange(5))
+        self.assertEqual(len(minmax_indices([], 4)), 0)
+
+    def test_keeps_every_bucket_extreme(self):
+        rng = np.random.default_rng(1)
+        y = rng.normal(size=10_000)
+        n_out = 400
+        idx = minmax_indices(y, n_out)
+        self.assertTrue(np.all(np.diff(idx) > 0))
+        self.assertLessEqual(len(idx), n_out + 2)  # two per bucket plus the endpoints
+        self.assertEqual((idx[0], idx[-1]), (0, len(y) - 1))
+        self.assertIn(int(np.argmax(y)), idx)
+        self.assertIn(int(np.argmin(y)), idx)
+
+    def test_single_bucket(self):
+        y = np.array([3.0, 9.0, -4.0, 1.0, 2.0])
+        np.testing.assert_array_equal(minmax_indices(y, 3), [0, 1, 2, 4])
+
+
+class DownsampleFrameTest(unittest.TestCase):
+    def frame(self, n):
+        return pd.DataFrame({'t': np.arange(n), 'v': np.sin(np.arange(n) / 50.0)})
+
+    def test_small_or_disabled_returns_frame_as_is(self):
+        df = self.frame(100)
+        self.assertIs(downsample_frame(df, 't', 'v', max_points=100), df)
+        big = self.frame(5_000)
+        self.assertIs(downsample_frame(big, 't', 'v', max_points=100, method='off'), big)
+        self.assertIs(downsample_frame(big, 't', 'v', max_points=100, method=None), big)
+
+    def test_reduces_rows(self):
+        df = self.frame(5_000)
+        self.assertEqual(len(downsample_frame(df, 't', 'v', max_points=300)), 300)
+        self.assertLessEqual(len(downsample_frame(df, 't', 'v', max_points=300, method='minmax')), 302)
+
+    def test_missing_values_are_dropped_first(self):
+        df = self.frame(5_000)
+        df.loc[::7, 'v'] = np.nan
+        out = downsample_frame(df, 't', 'v', max_points=200)
+        self.assertEqual(len(out), 200)
+        self.assertFalse(out['v'].isna().any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+
+import pandas as pd
+
+from figure_cache import FigureCache, chart_fingerprint, figure_key, normalize_selection
+
+
+def loader(statement):
+    return lambda: statement.upper()
+
+
+class FigureCacheTest(unittest.TestCase):
+    def test_get_and_put(self):
+        cache = FigureCache(max_bytes=100)
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', 'x' * 10)
+        self.assertEqual(cache.get('a'), 'x' * 10)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = FigureCache(max_bytes=30)
+        cache.put('a', 'a' * 10)
+        cache.put('b', 'b' * 10)
+        cache.put('c', 'c' * 10)
+        cache.get('a')  # a is now the most recent
+        cache.put('d', 'd' * 10)
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertEqual(cache.stats()['bytes'], 30)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_one_large_value_evicts_several(self):
+        cache = FigureCache(max_bytes=30)
+        for key in 'abc':
+            cache.put(key, key * 10)
+        cache.put('big', 'z' * 25)
+        self.assertEqual(cache.stats()['entries'], 1)
+        self.assertEqual(cache.stats()['evictions'], 3)
+
+    def test_bytes_are_utf8_bytes(self):
+        cache = FigureCache(max_bytes=10)
+        cache.put('a', 'é' * 5)  # 10 bytes
+        cache.put('b', 'x')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['bytes'], 1)
+
+    def test_value_bigger_than_the_cache_is_not_stored(self):
+        cache = FigureCache(max_bytes=10)
+        cache.put('a', 'a' * 5)
+        cache.put('huge', 'h' * 11)
+        self.assertIsNone(cache.get('huge'))
+        self.assertEqual(cache.get('a'), 'a' * 5)
+
+    def test_replacing_a_key_updates_its_size(self):
+        cache = FigureCache(max_bytes=100)
+        cache.put('a', 'a' * 40)
+        cache.put('a', 'a' * 10)
+        self.assertEqual(cache.stats(), {'entries': 1, 'bytes': 10, 'max_bytes': 100,
+                                         'hits': 0, 'misses': 0, 'evictions': 0})
+
+
+class FingerprintTest(unittest.TestCase):
+    def test_selection_order_does_not_matter(self):
+        a = {'date': None, 'values': {'Lane': ['B', 'A'], 'Shift': ['Day']}}
+        b = {'values': {'Shift': ['Day'], 'Lane': ['A', 'B']}}
+        self.assertEqual(normalize_selection(a), normalize_selection(b))
+        self.assertEqual(normalize_selection(None), '')
+        self.assertNotEqual(normalize_selection(a), normalize_selection({'values': {'Lane': ['A']}}))
+
+    def test_loaders_differ_by_closed_over_sql(self):
+        self.assertEqual(chart_fingerprint(loader("SELECT 1"), {}), chart_fingerprint(loader("SELECT 1"), {}))
+        self.assertNotEqual(chart_fingerprint(loader("SELECT 1"), {}), chart_fingerprint(loader("SELECT 2"), {}))
+
+    def test_loaders_differ_by_inline_sql(self):
+        first = chart_fingerprint(lambda: "SELECT [Lane] FROM t", {})
+        second = chart_fingerprint(lambda: "SELECT [Bay] FROM t", {})
+        self.assertNotEqual(first, second)
+
+    def test_options_are_part_of_the_key(self):
+        build = loader("SELECT 1")
+        self.assertNotEqual(chart_fingerprint(build, {'height': 400}), chart_fingerprint(build, {'height': 350}))
+        self.assertEqual(chart_fingerprint(build, {'a': 1, 'b': 2}), chart_fingerprint(build, {'b': 2, 'a': 1}))
+
+    def test_frames_hash_their_contents(self):
+        frame = pd.DataFrame({'x': [1, 2], 'y': [3, 4]})
+        self.assertEqual(chart_fingerprint(frame, {}), chart_fingerprint(frame.copy(), {}))
+        self.assertNotEqual(chart_fingerprint(frame, {}), chart_fingerprint(frame.assign(y=[3, 5]), {}))
+
+    def test_figure_key(self):
+        self.assertEqual(figure_key('bar:abc', '', ('ingest', 3)), "bar:abc||('ingest', 3)")
+
+
+if __name__ == '__main__':
+    unittest.main()
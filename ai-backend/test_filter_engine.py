@@ -0,0 +1,120 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from filter_engine import FilterCube
+
+
+def cube_frame(rows=1_003, seed=7):
+    # odd row count so the packed bitmaps end in a partial byte
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({
+        'Lane': rng.choice(['LANE1', 'LANE2', 'LANE3', 'LANE4', 'LANE5'], rows),
+        'Shift': rng.choice(['Day_Shift', 'Night_Shift'], rows),
+        'Date': rng.choice(pd.date_range('2024-03-01', periods=10).strftime('%Y-%m-%d'), rows),
+        'n': rng.integers(1, 5, rows),
+        'sum_Qty': rng.uniform(0, 100, rows),
+        'cnt_Qty': rng.integers(1, 5, rows),
+    })
+    frame.loc[::97, 'Lane'] = None  # rows with no lane never match a lane filter
+    return frame
+
+
+class FilterCubeTest(unittest.TestCase):
+    def setUp(self):
+        self.frame = cube_frame()
+        self.cube = FilterCube(self.frame, ['Lane', 'Shift', 'Date', 'Missing'], ['Qty'], date_dimension='Date')
+
+    def expected_mask(self, lanes=None, shifts=None, dates=None):
+        keep = np.ones(len(self.frame), dtype=bool)
+        if lanes is not None:
+            keep &= self.frame['Lane'].isin(lanes).to_numpy()
+        if shifts is not None:
+            keep &= self.frame['Shift'].isin(shifts).to_numpy()
+        if dates is not None:
+            day = pd.to_datetime(self.frame['Date'])
+            keep &= ((day >= pd.Timestamp(dates[0])) & (day <= pd.Timestamp(dates[1]))).to_numpy()
+        return keep
+
+    def test_options_and_date_bounds(self):
+        self.assertEqual(self.cube.dimensions, ['Lane', 'Shift', 'Date'])
+        self.assertEqual(self.cube.options('Lane'), ['LANE1', 'LANE2', 'LANE3', 'LANE4', 'LANE5'])
+        self.assertEqual(self.cube.options('Missing'), [])
+        lo, hi = self.cube.date_bounds()
+        self.assertEqual((str(lo), str(hi)), ('2024-03-01', '2024-03-10'))
+
+    def test_no_selection_keeps_everything(self):
+        self.assertTrue(self.cube.mask().all())
+        self.assertTrue(self.cube.mask({'values': {}}).all())
+        self.assertEqual(len(self.cube.mask()), len(self.frame))
+
+    def test_few_values_picked(self):
+        mask = self.cube.mask({'values': {'Lane': ['LANE2']}})
+        np.testing.assert_array_equal(mask, self.expected_mask(lanes=['LANE2']))
+
+    def test_most_values_picked(self):
+        # takes the "clear the unpicked" branch, which must still drop rows without a lane
+        lanes = ['LANE1', 'LANE2', 'LANE3', 'LANE5']
+        np.testing.assert_array_equal(self.cube.mask({'values': {'Lane': lanes}}), self.expected_mask(lanes=lanes))
+
+    def test_all_values_picked_drops_only_missing(self):
+        lanes = self.cube.options('Lane')
+        mask = self.cube.mask({'values': {'Lane': lanes}})
+        np.testing.assert_array_equal(mask, self.frame['Lane'].notna().to_numpy())
+
+    def test_empty_pick_matches_nothing(self):
+        self.assertFalse(self.cube.mask({'values': {'Lane': []}}).any())
+        self.assertFalse(self.cube.mask({'values': {'Lane': ['NOPE']}}).any())
+
+    def test_unknown_dimension_is_ignored(self):
+        self.assertTrue(self.cube.mask({'values': {'Missing': ['x']}}).all())
+
+    def test_dimensions_and_dates_combine(self):
+        selection = {
+            'date': ('Date', '2024-03-03', '2024-03-06'),
+            'values': {'Lane': ['LANE1', 'LANE4'], 'Shift': ['Night_Shift']},
+        }
+        expected = self.expected_mask(lanes=['LANE1', 'LANE4'], shifts=['Night_Shift'],
+                                      dates=('2024-03-03', '2024-03-06'))
+        np.testing.assert_array_equal(self.cube.mask(selection), expected)
+
+    def test_totals(self):
+        mask = self.cube.mask({'values': {'Shift': ['Day_Shift']}})
+        day = self.frame[mask]
+        self.assertAlmostEqual(self.cube.total('Qty', mask), day['sum_Qty'].sum())
+        self.assertAlmostEqual(self.cube.total('Qty', mask, how='mean'), day['sum_Qty'].sum() / day['cnt_Qty'].sum())
+        self.assertEqual(self.cube.row_count(mask), float(day['n'].sum()))
+        self.assertIsNone(self.cube.total('Other', mask))
+        self.assertIsNone(self.cube.total('Qty', np.zeros(len(self.frame), dtype=bool)))
+
+    def test_group_matches_pandas(self):
+        mask = self.cube.mask({'values': {'Shift': ['Night_Shift']}})
+        got = self.cube.group(['Lane', 'Shift'], 'Qty', mask).sort_values(['Lane', 'Shift']).reset_index(drop=True)
+        want = (self.frame[mask].dropna(subset=['Lane']).groupby(['Lane', 'Shift'], as_index=False)['sum_Qty'].sum()
+                .rename(columns={'sum_Qty': 'Qty'}))
+        self.assertEqual(list(got['Lane']), list(want['Lane']))
+        np.testing.assert_allclose(got['Qty'].to_numpy(float), want['Qty'].to_numpy(float))
+
+    def test_group_mean_and_dates(self):
+        got = self.cube.group('Date', 'Qty', how='mean')
+        self.assertEqual(len(got), 10)
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(got['Date']))
+        by_day = self.frame.groupby('Date')
+        np.testing.assert_allclose(got['Qty'].to_numpy(float),
+                                   (by_day['sum_Qty'].sum() / by_day['cnt_Qty'].sum()).to_numpy())
+
+    def test_group_with_unknown_names_is_empty(self):
+        self.assertTrue(self.cube.group('Missing', 'Qty').empty)
+        self.assertTrue(self.cube.group('Lane', 'Other').empty)
+
+    def test_empty_frame(self):
+        cube = FilterCube(cube_frame().iloc[:0], ['Lane', 'Date'], ['Qty'], date_dimension='Date')
+        self.assertEqual(len(cube.mask({'values': {'Lane': ['LANE1']}})), 0)
+        self.assertIsNone(cube.date_bounds())
+        self.assertIsNone(cube.total('Qty'))
+        self.assertTrue(cube.group('Lane', 'Qty').empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
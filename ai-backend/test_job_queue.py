@@ -0,0 +1,91 @@
+import threading
+import time
+import unittest
+
+from job_queue import JobQueue, QueueFullError
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError('condition not met in time')
+        time.sleep(0.01)
+
+
+class JobQueueTest(unittest.TestCase):
+    def test_priority_then_fifo_order(self):
+        ran = []
+        queue = JobQueue(lambda job: ran.append(job.payload['n']), workers=1)
+        for n, priority in enumerate(['low', 'normal', 'high', 'normal', 'high']):
+            queue.submit({'n': n}, priority)
+        queue.start()
+        wait_for(lambda: len(ran) == 5)
+        self.assertEqual(ran, [2, 4, 1, 3, 0])
+
+    def test_unknown_priority_counts_as_normal(self):
+        queue = JobQueue(lambda job: None)
+        self.assertEqual(queue.submit({}, 'urgent').priority, 'normal')
+
+    def test_full_queue_rejects(self):
+        queue = JobQueue(lambda job: None, workers=2, max_depth=2, default_duration=30.0)
+        queue.submit({})
+        queue.submit({})
+        with self.assertRaises(QueueFullError):
+            queue.submit({})
+        self.assertEqual(queue.stats()['queued'], 2)
+        self.assertEqual(queue.retry_after(), 15)
+
+    def test_retry_after_is_at_least_one_second(self):
+        queue = JobQueue(lambda job: None, workers=4, default_duration=0.1)
+        self.assertEqual(queue.retry_after(), 1)
+
+    def test_queue_position_and_eta(self):
+        queue = JobQueue(lambda job: None, workers=1, default_duration=10.0)
+        first = queue.submit({})
+        second = queue.submit({}, 'low')
+        urgent = queue.submit({}, 'high')
+        self.assertEqual(queue.status(urgent.id)['queue_position'], 1)
+        self.assertEqual(queue.status(first.id)['queue_position'], 2)
+        status = queue.status(second.id)
+        self.assertEqual(status['queue_position'], 3)
+        self.assertEqual(status['eta_seconds'], 30.0)
+
+    def test_running_job_leaves_the_queue(self):
+        release = threading.Event()
+        queue = JobQueue(lambda job: release.wait(5), workers=1)
+        job = queue.submit({})
+        queue.start()
+        wait_for(lambda: queue.get(job.id).status == 'running')
+        self.assertEqual(queue.status(job.id)['queue_position'], 0)
+        self.assertEqual(queue.stats()['running'], 1)
+        release.set()
+        wait_for(lambda: queue.get(job.id).status == 'done')
+
+    def test_result_and_failure(self):
+        def handler(job):
+            if job.payload.get('fail'):
+                raise RuntimeError('boom')
+            return {'ok': True}
+        queue = JobQueue(handler, workers=1)
+        good = queue.submit({})
+        bad = queue.submit({'fail': True})
+        queue.start()
+        wait_for(lambda: queue.get(bad.id).finished_at is not None)
+        self.assertEqual(queue.status(good.id)['status'], 'done')
+        self.assertEqual(queue.status(good.id)['result'], {'ok': True})
+        self.assertEqual(queue.status(bad.id)['status'], 'failed')
+        self.assertEqual(queue.status(bad.id)['error'], 'boom')
+
+    def test_finished_jobs_expire_after_ttl(self):
+        queue = JobQueue(lambda job: None, workers=1, job_ttl=0)
+        job = queue.submit({})
+        queue.start()
+        wait_for(lambda: queue.get(job.id).finished_at is not None)
+        time.sleep(0.01)
+        queue.submit({})  # submissions prune expired jobs
+        self.assertIsNone(queue.status(job.id))
+
+
+if __name__ == '__main__':
+    unittest.main()
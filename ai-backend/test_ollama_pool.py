@@ -0,0 +1,123 @@
+import contextlib
+import io
+import unittest
+from unittest import mock
+
+from ollama_pool import NoHealthyNodeError, OllamaPool
+
+A, B, C = 'http://a:11434', 'http://b:11434', 'http://c:11434'
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class OllamaPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = Clock()
+        patcher = mock.patch('ollama_pool.time.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fail(self, pool, node, times=1):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(times):
+                pool.acquire(exclude=[n for n in pool.nodes if n is not node])
+                pool.release(node, False, error='boom')
+
+    def test_blank_urls_are_skipped(self):
+        pool = OllamaPool([A + '/', ' ', B])
+        self.assertEqual([n.url for n in pool.nodes], [A, B])
+
+    def test_least_outstanding_first(self):
+        pool = OllamaPool([A, B])
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertIsNot(first, second)
+        pool.release(first, True, latency=1.0)
+        self.assertIs(pool.acquire(), first)
+
+    def test_slow_node_gets_less_traffic(self):
+        pool = OllamaPool([A, B])
+        a, b = pool.nodes
+        for node, latency in ((a, 1.0), (b, 5.0)):
+            pool.release(pool.acquire(exclude=[n for n in pool.nodes if n is not node]), True, latency=latency)
+        # a scores (outstanding + 1) * 1s against b's 1 * 5s, so it takes four calls before b gets one
+        self.assertEqual([pool.acquire() for _ in range(4)], [a] * 4)
+        a.outstanding += 1
+        self.assertIs(pool.acquire(), b)
+
+    def test_unhealthy_node_is_avoided(self):
+        pool = OllamaPool([A, B], eject_after=10)
+        a, b = pool.nodes
+        self.fail(pool, a, times=2)
+        self.assertLess(a.health(), b.health())
+        self.assertIs(pool.acquire(), b)
+
+    def test_ejected_after_consecutive_failures(self):
+        pool = OllamaPool([A, B], eject_after=3, eject_seconds=30)
+        a, b = pool.nodes
+        self.fail(pool, a, times=2)
+        self.assertFalse(a.ejected)
+        self.fail(pool, a)
+        self.assertTrue(a.ejected)
+        self.assertEqual(pool.status()[0]['ejected_for_seconds'], 30.0)
+        for _ in range(5):
+            self.assertIs(pool.acquire(), b)
+
+    def test_success_resets_the_failure_streak(self):
+        pool = OllamaPool([A], eject_after=3)
+        a = pool.nodes[0]
+        self.fail(pool, a, times=2)
+        pool.release(pool.acquire(), True, latency=1.0)
+        self.fail(pool, a, times=2)
+        self.assertFalse(a.ejected)
+        self.assertEqual(a.failures, 4)
+
+    def test_readmitted_after_the_window_and_reejected_on_one_failure(self):
+        pool = OllamaPool([A, B], eject_after=3, eject_seconds=30)
+        a = pool.nodes[0]
+        self.fail(pool, a, times=3)
+        self.clock.now += 31
+        self.assertFalse(a.ejected)
+        self.assertIs(pool.acquire(exclude=[pool.nodes[1]]), a)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pool.release(a, False, error='still down')
+        self.assertTrue(a.ejected)
+
+    def test_readmitted_node_that_recovers_stays_in(self):
+        pool = OllamaPool([A], eject_after=2, eject_seconds=10)
+        a = pool.nodes[0]
+        self.fail(pool, a, times=2)
+        self.clock.now += 11
+        pool.release(pool.acquire(), True, latency=0.5)
+        self.fail(pool, a)
+        self.assertFalse(a.ejected)
+
+    def test_all_ejected_raises(self):
+        pool = OllamaPool([A, B], eject_after=1)
+        for node in pool.nodes:
+            self.fail(pool, node)
+        with self.assertRaises(NoHealthyNodeError):
+            pool.acquire()
+
+    def test_exclude_every_node_raises(self):
+        pool = OllamaPool([A, B, C])
+        with self.assertRaises(NoHealthyNodeError):
+            pool.acquire(exclude=pool.nodes)
+
+    def test_status(self):
+        pool = OllamaPool([A])
+        node = pool.acquire()
+        pool.release(node, True, latency=2.0)
+        status = pool.status()[0]
+        self.assertEqual((status['requests'], status['outstanding'], status['latency_p50']), (1, 0, 2.0))
+        self.assertIsNone(status['last_error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+from port_allocator import PortAllocator, PortExhaustedError, port_is_bindable
+
+
+def free_range(size):
+    """First port of `size` consecutive ports that are free right now"""
+    for first in range(20000, 60000, size):
+        if all(port_is_bindable(p) for p in range(first, first + size)):
+            return first
+    raise unittest.SkipTest('no free port range')
+
+
+def listen(port):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', port))
+    sock.listen()
+    return sock
+
+
+class PortAllocatorTest(unittest.TestCase):
+    def setUp(self):
+        self.first = free_range(8)
+        self.last = self.first + 7
+        self.lease_path = os.path.join(tempfile.mkdtemp(), 'port_leases.json')
+        self.sockets = []
+
+    def tearDown(self):
+        for sock in self.sockets:
+            sock.close()
+
+    def hold(self, port):
+        self.sockets.append(listen(port))
+
+    def test_rejects_empty_range(self):
+        with self.assertRaises(ValueError):
+            PortAllocator(10, 9)
+
+    def test_round_robin_and_release(self):
+        ports = PortAllocator(self.first, self.last)
+        a, b = ports.allocate('a'), ports.allocate('b')
+        self.assertEqual((a, b), (self.first, self.first + 1))
+        self.assertEqual(ports.owner(a), 'a')
+        self.assertTrue(ports.release(a))
+        self.assertFalse(ports.release(a))
+        self.assertIsNone(ports.owner(a))
+        # a released port goes to the back of the line
+        self.assertEqual(ports.allocate('c'), self.first + 2)
+
+    def test_skips_ports_in_use_elsewhere(self):
+        self.hold(self.first)
+        ports = PortAllocator(self.first, self.last)
+        self.assertEqual(ports.allocate('a'), self.first + 1)
+        self.assertEqual(ports.stats()['skipped_busy'], 1)
+
+    def test_exhaustion(self):
+        ports = PortAllocator(self.first, self.first + 1)
+        ports.allocate('a')
+        ports.allocate('b')
+        with self.assertRaises(PortExhaustedError):
+            ports.allocate('c')
+        self.assertEqual(ports.stats()['free'], 0)
+
+    def test_concurrent_allocations_are_unique(self):
+        ports = PortAllocator(self.first, self.last)
+        got, lock = [], threading.Lock()
+
+        def take(i):
+            port = ports.allocate(f"d{i}")
+            with lock:
+                got.append(port)
+        threads = [threading.Thread(target=take, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(got), list(range(self.first, self.last + 1)))
+
+    def test_leases_persist(self):
+        ports = PortAllocator(self.first, self.last, lease_path=self.lease_path)
+        port = ports.allocate('dash-1')
+        with open(self.lease_path) as f:
+            self.assertEqual(json.load(f)[str(port)]['owner'], 'dash-1')
+        ports.release(port)
+        with open(self.lease_path) as f:
+            self.assertEqual(json.load(f), {})
+
+    def test_restart_keeps_only_leases_still_listening(self):
+        ports = PortAllocator(self.first, self.last, lease_path=self.lease_path)
+        orphan, stale = ports.allocate('orphan'), ports.allocate('stale')
+        self.hold(orphan)  # an orphaned server from before the restart still serves here
+
+        restarted = PortAllocator(self.first, self.last, lease_path=self.lease_path)
+        self.assertEqual(restarted.owner(orphan), 'orphan')
+        self.assertIsNone(restarted.owner(stale))
+        with open(self.lease_path) as f:
+            self.assertEqual(list(json.load(f)), [str(orphan)])
+        self.assertNotEqual(restarted.allocate('new'), orphan)
+
+    def test_leases_outside_the_range_are_dropped(self):
+        self.hold(self.last + 1)
+        with open(self.lease_path, 'w') as f:
+            json.dump({str(self.last + 1): {'owner': 'old', 'leased_at': 0}}, f)
+        ports = PortAllocator(self.first, self.last, lease_path=self.lease_path)
+        self.assertEqual(ports.stats()['leased'], 0)
+
+    def test_unreadable_lease_file_is_ignored(self):
+        with open(self.lease_path, 'w') as f:
+            f.write('{not json')
+        ports = PortAllocator(self.first, self.last, lease_path=self.lease_path)
+        self.assertEqual(ports.allocate('a'), self.first)
+
+
+if __name__ == '__main__':
+    unittest.main()
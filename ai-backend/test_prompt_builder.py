@@ -0,0 +1,88 @@
+import json
+import unittest
+
+from prompt_builder import PromptBuilder, count_tokens
+
+COLUMNS = [f"Metric_{i:02d}" for i in range(16)] + ['GrossQuantity', 'BayCode', 'ExitTime', 'TemperatureReading']
+REQUIREMENTS = '\n'.join(f"- Requirement number {i} with enough words to cost some tokens" for i in range(6))
+
+
+def context(rows=5):
+    return {
+        'db_path': '/data/terminal_data.db',
+        'table_name': 'evaluation_data',
+        'total_rows': 1000,
+        'columns': COLUMNS,
+        'sample_data': [{col: f"value {i} of {col}" for col in COLUMNS} for i in range(rows)],
+    }
+
+
+class PromptBuilderTest(unittest.TestCase):
+    def setUp(self):
+        self.builder = PromptBuilder(token_budget=10**6, max_columns=20, max_value_chars=40, sample_rows=5)
+
+    def tokens_for(self, n_cols, n_rows, n_req):
+        """Token count of the prompt with exactly this much context"""
+        columns = self.builder.rank_columns(COLUMNS, 'gross quantity')
+        requirements = REQUIREMENTS.splitlines()
+        return count_tokens(self.builder._sections('gross quantity', 'logistics', context(), requirements,
+                                                   columns, n_cols, n_rows, n_req))
+
+    def build(self, budget):
+        self.builder.token_budget = budget
+        return self.builder.build('gross quantity', 'logistics', context(), REQUIREMENTS)
+
+    def test_everything_fits(self):
+        prompt, stats = self.build(10**6)
+        self.assertEqual((stats['columns_shown'], stats['sample_rows'], stats['requirement_lines']), (20, 5, 6))
+        self.assertEqual(stats['tokens'], count_tokens(prompt))
+        self.assertIn('Table (use EXACTLY this name, not the Excel filename): evaluation_data', prompt)
+
+    def test_sheds_sample_rows_first(self):
+        _, stats = self.build(self.tokens_for(20, 2, 6))
+        self.assertEqual((stats['columns_shown'], stats['sample_rows'], stats['requirement_lines']), (20, 2, 6))
+
+    def test_then_requirements_down_to_two(self):
+        _, stats = self.build(self.tokens_for(20, 1, 3))
+        self.assertEqual((stats['columns_shown'], stats['sample_rows'], stats['requirement_lines']), (20, 1, 3))
+
+    def test_then_columns_down_to_eight(self):
+        _, stats = self.build(self.tokens_for(12, 1, 2))
+        self.assertEqual((stats['columns_shown'], stats['sample_rows'], stats['requirement_lines']), (12, 1, 2))
+
+    def test_then_the_last_row_and_requirements(self):
+        _, stats = self.build(self.tokens_for(8, 0, 2))
+        self.assertEqual((stats['columns_shown'], stats['sample_rows'], stats['requirement_lines']), (8, 0, 2))
+        _, stats = self.build(self.tokens_for(8, 0, 0))
+        self.assertEqual((stats['columns_shown'], stats['sample_rows'], stats['requirement_lines']), (8, 0, 0))
+
+    def test_impossible_budget_keeps_the_core_prompt(self):
+        prompt, stats = self.build(10)
+        self.assertEqual((stats['columns_shown'], stats['sample_rows'], stats['requirement_lines']), (8, 0, 0))
+        self.assertGreater(stats['tokens'], 10)
+        self.assertIn('USER REQUEST: "gross quantity"', prompt)
+        self.assertIn('(+12 more)', prompt)
+
+    def test_prompt_matches_rank_before_key_schema(self):
+        ranked = self.builder.rank_columns(COLUMNS, 'show temperature readings')
+        self.assertEqual(ranked[0], 'TemperatureReading')
+        self.assertEqual(ranked[1:4], ['GrossQuantity', 'BayCode', 'ExitTime'])
+        self.assertEqual(ranked[4], 'Metric_00')  # the rest keep their order
+
+    def test_compact_rows_truncate_values(self):
+        rows = [{'a': 'x' * 100, 'b': 1.23456, 'c': float('nan'), 'd': True}]
+        lines = self.builder.compact_rows(rows, ['a', 'b', 'c', 'd'], 5).splitlines()
+        self.assertEqual(json.loads(lines[0]), ['a', 'b', 'c', 'd'])
+        self.assertEqual(json.loads(lines[1]), ['x' * 37 + '...', 1.235, None, True])
+
+    def test_duplicate_requirements_are_dropped(self):
+        _, stats = self.builder.build('x', 'logistics', context(), '- same\n- same\n\n- other')
+        self.assertEqual(stats['requirement_lines'], 2)
+
+    def test_count_tokens(self):
+        self.assertEqual(count_tokens(''), 0)
+        self.assertEqual(count_tokens('abcdefgh, x!'), 5)  # 2 + 1 + 1 + 1
+
+
+if __name__ == '__main__':
+    unittest.main()
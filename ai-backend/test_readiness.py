@@ -0,0 +1,101 @@
+import http.server
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+from readiness import HEALTH_PATH, BootFailedError, BootHistogram, log_tail, probe, wait_until_ready
+
+
+class Health(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200 if self.path == HEALTH_PATH else 404)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class RunningProcess:
+    def poll(self):
+        return None
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class WaitUntilReadyTest(unittest.TestCase):
+    def serve(self):
+        server = http.server.HTTPServer(('127.0.0.1', 0), Health)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server.server_address[1]
+
+    def test_probe(self):
+        self.assertTrue(probe(self.serve()))
+        self.assertFalse(probe(free_port()))
+
+    def test_returns_once_healthy(self):
+        seconds = wait_until_ready(RunningProcess(), self.serve(), deadline=5)
+        self.assertLess(seconds, 1)
+
+    def test_exits_early_when_the_process_dies(self):
+        log = tempfile.NamedTemporaryFile('w', suffix='.log', delete=False)
+        log.write('ModuleNotFoundError: No module named streamlit\n')
+        log.close()
+        self.addCleanup(os.remove, log.name)
+        process = subprocess.Popen([sys.executable, '-c', 'import sys; sys.exit(3)'])
+        self.addCleanup(process.wait)
+        start = time.time()
+        with self.assertRaises(BootFailedError) as caught:
+            wait_until_ready(process, free_port(), deadline=30, log_path=log.name)
+        self.assertLess(time.time() - start, 5)  # nowhere near the deadline
+        self.assertIn('exited with code 3', str(caught.exception))
+        self.assertIn('No module named streamlit', str(caught.exception))
+
+    def test_deadline(self):
+        start = time.time()
+        with self.assertRaises(BootFailedError) as caught:
+            wait_until_ready(RunningProcess(), free_port(), deadline=0.3)
+        self.assertLess(time.time() - start, 2)
+        self.assertIn('not ready after', str(caught.exception))
+
+    def test_log_tail(self):
+        self.assertEqual(log_tail(None), '')
+        self.assertEqual(log_tail('/nonexistent/streamlit.log'), '')
+        with tempfile.NamedTemporaryFile('w', suffix='.log', delete=False) as log:
+            log.write('a' * 100 + 'END\n')
+        self.addCleanup(os.remove, log.name)
+        self.assertEqual(log_tail(log.name, max_bytes=10), 'a' * 6 + 'END')
+
+
+class BootHistogramTest(unittest.TestCase):
+    def test_empty(self):
+        snapshot = BootHistogram().snapshot()
+        self.assertEqual((snapshot['count'], snapshot['mean_seconds'], snapshot['p95_seconds']), (0, None, None))
+
+    def test_buckets_and_percentiles(self):
+        boots = BootHistogram()
+        for seconds in (0.1, 0.4, 1.5, 1.5, 40):
+            boots.observe(seconds)
+        boots.failure()
+        snapshot = boots.snapshot()
+        self.assertEqual((snapshot['count'], snapshot['failures']), (5, 1))
+        self.assertEqual(snapshot['mean_seconds'], 8.7)
+        self.assertEqual(snapshot['p50_seconds'], 1.5)
+        self.assertEqual(snapshot['p95_seconds'], 40)
+        self.assertEqual(snapshot['buckets']['le_0.25'], 1)
+        self.assertEqual(snapshot['buckets']['le_2'], 2)
+        self.assertEqual(snapshot['buckets']['inf'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import pandas as pd
+
+from benchmark_sample_data import row_loop_manufacturing
+from sample_data import BAY_CODES, LANES, manufacturing_frame, operational_frame, shipment_frame
+
+# columns of the per-row generators the dashboards were written against
+OPERATIONAL_COLUMNS = ['Date', 'Operational_Efficiency', 'Uptime_Percentage', 'Fuel_Volume_Liters',
+                       'Daily_Throughput', 'Cost_Per_Unit', 'Energy_Consumption', 'Department', 'Shift']
+SHIPMENT_COLUMNS = ['Date', 'GrossQuantity', 'FlowRate', 'BayCode', 'BaseProductCode',
+                    'ShipmentID', 'ExitTime', 'CreatedTime']
+
+
+class ManufacturingFrameTest(unittest.TestCase):
+    def test_schema_matches_row_loop(self):
+        self.assertEqual(list(manufacturing_frame(days=1)), list(row_loop_manufacturing(1)))
+
+    def test_column_kinds_match_row_loop(self):
+        vectorized, loop = manufacturing_frame(days=1), row_loop_manufacturing(1)
+        for column in loop:
+            if pd.api.types.is_numeric_dtype(loop[column]):
+                self.assertTrue(pd.api.types.is_numeric_dtype(vectorized[column]), column)
+
+    def test_one_row_per_hour_lane_and_bay(self):
+        df = manufacturing_frame(days=2, freq='h')
+        self.assertEqual(len(df), 48 * 12)
+        self.assertEqual(sorted(df['Lane'].unique()), LANES)
+        self.assertEqual(df.groupby('Timestamp', observed=True).size().unique().tolist(), [12])
+
+    def test_value_ranges(self):
+        df = manufacturing_frame(days=7)
+        self.assertTrue(df['Availability'].between(70, 99).all())
+        self.assertTrue(df['OEE_Percentage'].between(0, 100).all())
+        self.assertTrue((df['Actual_Production'] >= 0).all())
+        self.assertTrue(df['Operator'].str.fullmatch(r'OP_\d{3}').all())
+        self.assertTrue(((df['Shift'] == 'Day_Shift') == df['Hour'].between(6, 17)).all())
+
+    def test_seeded(self):
+        end = pd.Timestamp('2024-03-01')
+        pd.testing.assert_frame_equal(manufacturing_frame(seed=3, end=end), manufacturing_frame(seed=3, end=end))
+
+
+class OtherFramesTest(unittest.TestCase):
+    def test_operational_schema(self):
+        df = operational_frame(days=31)
+        self.assertEqual(list(df), OPERATIONAL_COLUMNS)
+        self.assertEqual(len(df), 31)
+
+    def test_shipment_schema_and_rows_per_day(self):
+        df = shipment_frame('2024-01-01', '2024-01-31', (5, 25))
+        self.assertEqual(list(df), SHIPMENT_COLUMNS)
+        per_day = df.groupby('Date').size()
+        self.assertEqual(len(per_day), 31)
+        self.assertTrue(per_day.between(5, 25).all())
+        self.assertTrue(set(df['BayCode'].astype(str)) <= set(BAY_CODES))
+        self.assertTrue(df['ExitTime'].str.fullmatch(r'([6-9]|1\d|2[0-2]):[0-5]\d').all())
+
+    def test_fixed_rows_per_day(self):
+        self.assertEqual(len(shipment_frame('2024-01-01', '2024-01-10', 7)), 70)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from port_allocator import PortAllocator, port_is_bindable
+from streamlit_pool import StreamlitPool, StreamlitWorker
+
+# stands in for streamlit_worker.py: answers the health check on the port it is given
+HEALTH_SERVER = '''
+import http.server, sys
+class Health(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200 if self.path == '/_stcore/health' else 404)
+        self.end_headers()
+    def log_message(self, *args):
+        pass
+http.server.HTTPServer(('127.0.0.1', int(sys.argv[1])), Health).serve_forever()
+'''
+
+
+class FakeProcess:
+    def __init__(self, code=None):
+        self.code = code
+        self.terminated = False
+
+    def poll(self):
+        return self.code
+
+    def terminate(self):
+        self.terminated = True
+        self.code = -15
+
+
+def free_range(size):
+    for first in range(30000, 60000, size):
+        if all(port_is_bindable(p) for p in range(first, first + size)):
+            return first
+    raise unittest.SkipTest('no free port range')
+
+
+class StreamlitPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        first = free_range(4)
+        self.ports = PortAllocator(first, first + 3)
+        self.processes = []
+
+    def tearDown(self):
+        for process in self.processes:
+            process.kill()
+            process.wait()
+
+    def pool(self, start_worker=None, size=2):
+        return StreamlitPool(start_worker or (lambda *args: None), self.ports, size=size,
+                             assignment_dir=self.dir, boot_timeout=10)
+
+    def idle_worker(self, pool, process):
+        """Put a worker in the idle list as if it had booted"""
+        port = self.ports.allocate('pool-worker')
+        path = os.path.join(self.dir, f"worker_{port}.json")
+        with open(path, 'w') as f:
+            f.write('{}')
+        worker = StreamlitWorker(port, process, path, None)
+        pool._idle.append(worker)
+        return worker
+
+    def start_health_server(self, port, assignment_path, log_path):
+        process = subprocess.Popen([sys.executable, '-c', HEALTH_SERVER, str(port)])
+        self.processes.append(process)
+        return process
+
+    def test_acquire_and_release(self):
+        pool = self.pool()
+        worker = self.idle_worker(pool, FakeProcess())
+        self.assertIs(pool.acquire('dash-1', '/tmp/dash-1.py'), worker)
+        self.assertEqual(worker.dashboard_id, 'dash-1')
+        with open(worker.assignment_path) as f:
+            self.assertIn('dash-1.py', f.read())
+
+        self.assertTrue(pool.release(worker.port))
+        self.assertTrue(worker.process.terminated)
+        self.assertFalse(os.path.exists(worker.assignment_path))
+        self.assertIsNone(self.ports.owner(worker.port))
+        self.assertFalse(pool.release(worker.port))
+        self.assertEqual((pool.stats()['hits'], pool.stats()['assigned']), (1, 0))
+
+    def test_acquire_with_nothing_idle_is_a_miss(self):
+        pool = self.pool()
+        self.assertIsNone(pool.acquire('dash-1', '/tmp/dash-1.py'))
+        self.assertEqual(pool.stats()['misses'], 1)
+
+    def test_acquire_discards_dead_workers(self):
+        pool = self.pool()
+        dead = self.idle_worker(pool, FakeProcess(code=1))
+        alive = self.idle_worker(pool, FakeProcess())
+        self.assertIs(pool.acquire('dash-1', '/tmp/dash-1.py'), alive)
+        self.assertIsNone(self.ports.owner(dead.port))
+        self.assertFalse(os.path.exists(dead.assignment_path))
+
+    def test_acquire_with_only_dead_workers_frees_their_ports(self):
+        pool = self.pool()
+        dead = [self.idle_worker(pool, FakeProcess(code=1)) for _ in range(2)]
+        self.assertIsNone(pool.acquire('dash-1', '/tmp/dash-1.py'))
+        self.assertEqual(self.ports.stats()['leased'], 0)
+        self.assertFalse(any(os.path.exists(w.assignment_path) for w in dead))
+
+    def test_refill_drops_workers_that_die_while_idle(self):
+        pool = self.pool()
+        dead = self.idle_worker(pool, FakeProcess(code=1))
+        alive = self.idle_worker(pool, FakeProcess())
+        with pool._cond:
+            pool._drop_dead_idle()
+        self.assertEqual(pool._idle, [alive])
+        self.assertIsNone(self.ports.owner(dead.port))
+        self.assertFalse(os.path.exists(dead.assignment_path))
+
+    def test_refill_boots_workers_to_target_size(self):
+        pool = self.pool(self.start_health_server, size=2)
+        pool.start()
+        deadline = time.time() + 10
+        while pool.stats()['idle'] < 2 and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(pool.stats()['idle'], 2)
+        self.assertEqual(pool.stats()['boot']['count'], 2)
+        pool.shutdown()
+        self.assertEqual(self.ports.stats()['leased'], 0)
+
+    def test_failed_boot_gives_the_port_back(self):
+        started = []
+
+        def start_worker(port, assignment_path, log_path):
+            started.append(port)
+            return FakeProcess(code=1)
+        pool = self.pool(start_worker, size=1)
+        pool.start()
+        deadline = time.time() + 5
+        while pool.stats()['boot']['failures'] < 1 and time.time() < deadline:
+            time.sleep(0.05)
+        pool.shutdown()
+        self.assertGreaterEqual(pool.stats()['boot']['failures'], 1)
+        self.assertEqual(self.ports.stats()['leased'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -61,7 +61,14 @@ const AIDashboardGenerator = ({ data, fileName }) => {
             });
             clearTimeout(timeoutId);
 
-            const result = await response.json();
+            let result = await response.json();
+
+            // generation runs as a background job - poll until it finishes
+            if (response.status === 202 && result.job_id) {
+                result = await waitForJob(result.status_url);
+            } else if (response.status === 429) {
+                result = { success: false, error: `${result.error}. Please retry shortly.` };
+            }
 
             if (result.success) {
                 setDashboardUrl(result.embed_url);
@@ -86,6 +93,23 @@ const AIDashboardGenerator = ({ data, fileName }) => {
         }
     };
 
+    const waitForJob = async (statusUrl) => {
+        const deadline = Date.now() + 300000;  // 5 min including queue time
+        while (Date.now() < deadline) {
+            await new Promise((resolve) => setTimeout(resolve, 1500));
+            const statusResponse = await fetch(`http://localhost:5247${statusUrl}`);
+            const job = await statusResponse.json();
+            // speculative jobs publish the template dashboard before the LLM finishes
+            if (job.status === 'done' || (job.result && job.result.embed_url)) {
+                return { success: true, ...job.result };
+            }
+            if (job.status === 'failed' || !statusResponse.ok) {
+                return { success: false, error: job.error || 'Failed to generate dashboard' };
+            }
+        }
+        return { success: false, error: 'Dashboard generation is taking longer than expected. Please try again.' };
+    };
+
     const handleCloseDashboard = () => {
         setDashboardUrl('');
         setPrompt('');
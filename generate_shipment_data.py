@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Generate large shipment datasets for ingest testing
+Same columns as create_sample_data.py, built in vectorized chunks and streamed to
+XLSX (openpyxl write-only), CSV or Parquet (pyarrow), so memory stays flat at any row count.
+Ingest only picks up .xlsx/.xls files in excel-data/, so only the XLSX default lands there
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+BAY_CODES = ['LANE01', 'LANE02', 'LANE03', 'LANE04', 'LANE05', 'BAY_A', 'BAY_B', 'BAY_C']
+PRODUCT_CODES = ['210403', '210404', '210405', '310201', '310202', '410501', '410502']
+COLUMNS = ['GrossQuantity', 'FlowRate', 'ShipmentCompartmentID', 'BaseProductID', 'BaseProductCode',
+           'ShipmentID', 'ShipmentCode', 'ExitTime', 'BayCode', 'ScheduledDate', 'CreatedTime']
+XLSX_MAX_ROWS = 1048575  # per sheet, plus the header
+INGEST_FORMATS = ('xlsx',)  # what find_excel_files loads from excel-data/
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# every second of the day as "hh:mm:ss AM", built once; rows index into it instead of formatting
+CLOCK = np.array([f"{(s // 3600) % 12 or 12:02d}:{s // 60 % 60:02d}:{s % 60:02d} {'AM' if s < 43200 else 'PM'}"
+                  for s in range(86400)], dtype=object)
+PRODUCT_IDS = np.array([f"PROD-{code}-{n}" for code in PRODUCT_CODES for n in range(100, 1000)], dtype=object)
+SHIPMENT_IDS = np.array([f"SHIP-{n}" for n in range(10000, 100000)], dtype=object)
+
+
+def bay_weights(hot_bays, hot_share):
+    """Probability per bay code: hot_share of all shipments spread over the hot bays"""
+    hot = np.isin(BAY_CODES, hot_bays)
+    if not hot.any() or hot.all():
+        return np.full(len(BAY_CODES), 1 / len(BAY_CODES))
+    return np.where(hot, hot_share / hot.sum(), (1 - hot_share) / (~hot).sum())
+
+
+def shipment_chunk(rng, first_row, size, args, day_labels, weights):
+    """Rows first_row .. first_row + size - 1; dates advance with the row number so files stay sorted"""
+    rows = np.arange(first_row, first_row + size)
+    product = rng.integers(0, len(PRODUCT_CODES), size)
+    quantity = rng.integers(1, 20, size) * 50
+    quantity[rng.random(size) < args.zero_share] = 0
+    exit_second = rng.integers(6 * 3600, 23 * 3600, size)
+    created_second = (exit_second - rng.integers(1, 9, size) * 3600) % 86400
+    compartment = np.char.add(np.char.add('COMP-', np.char.zfill((rows + 1).astype(str), 4)),
+                              np.char.add('-', rng.integers(1000, 10000, size).astype(str)))
+    return pd.DataFrame({
+        'GrossQuantity': quantity,
+        'FlowRate': np.round(rng.uniform(5, 50, size), 1),
+        'ShipmentCompartmentID': compartment.astype(object),
+        'BaseProductID': PRODUCT_IDS[product * 900 + rng.integers(0, 900, size)],
+        'BaseProductCode': np.asarray(PRODUCT_CODES, dtype=object)[product],
+        'ShipmentID': SHIPMENT_IDS[rng.integers(0, len(SHIPMENT_IDS), size)],
+        'ShipmentCode': rng.integers(100000000, 1000000000, size).astype(str).astype(object),
+        'ExitTime': CLOCK[exit_second],
+        'BayCode': np.asarray(BAY_CODES, dtype=object)[rng.choice(len(BAY_CODES), size, p=weights)],
+        'ScheduledDate': day_labels[rows * len(day_labels) // args.rows],
+        'CreatedTime': CLOCK[created_second],
+    }, columns=COLUMNS)
+
+
+def chunks(args):
+    rng = np.random.default_rng(args.seed)
+    days = pd.date_range(args.start, periods=args.days, freq='D')
+    day_labels = np.asarray(days.strftime(args.date_format), dtype=object)
+    weights = bay_weights(args.hot_bays, args.hot_share)
+    for first_row in range(0, args.rows, args.chunk_size):
+        yield shipment_chunk(rng, first_row, min(args.chunk_size, args.rows - first_row), args, day_labels, weights)
+
+
+def write_csv(path, frames):
+    with open(path, 'w', newline='') as f:
+        for i, frame in enumerate(frames):
+            frame.to_csv(f, header=(i == 0), index=False)
+            yield len(frame)
+
+
+def write_parquet(path, frames):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("Parquet output needs pyarrow (pip install pyarrow)")
+    writer = None
+    try:
+        for frame in frames:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression='snappy')
+            writer.write_table(table)  # one row group per chunk
+            yield len(frame)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_xlsx(path, frames):
+    try:
+        from openpyxl import Workbook
+    except ImportError:
+        sys.exit("XLSX output needs openpyxl (pip install openpyxl)")
+    # write-only mode streams rows to disk; ingest reads the first sheet, extra rows spill to more sheets
+    workbook = Workbook(write_only=True)
+    sheet, sheet_rows = None, XLSX_MAX_ROWS
+    for frame in frames:
+        for row in frame.itertuples(index=False, name=None):
+            if sheet_rows == XLSX_MAX_ROWS:
+                sheet = workbook.create_sheet(f"Shipments_{len(workbook.worksheets) + 1}")
+                sheet.append(COLUMNS)
+                sheet_rows = 0
+            sheet.append(row)
+            sheet_rows += 1
+        yield len(frame)
+    workbook.save(path)
+
+
+WRITERS = {'csv': write_csv, 'parquet': write_parquet, 'xlsx': write_xlsx}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate shipment data for ingest testing')
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--format', choices=sorted(WRITERS), default=None,
+                        help='defaults to the output file extension, else xlsx')
+    parser.add_argument('--output', default=None,
+                        help='output file (default excel-data/shipments_<rows>.xlsx for ingest, '
+                             'data/shipments_<rows>.<format> for csv and parquet)')
+    parser.add_argument('--chunk-size', type=int, default=250_000, help='rows generated and written at a time')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--start', default='2024-01-01', help='first ScheduledDate')
+    parser.add_argument('--days', type=int, default=365, help='ScheduledDate span, rows spread evenly over it')
+    parser.add_argument('--date-format', default='%m-%d-%y',
+                        help='ScheduledDate format; ingest parses %%m-%%d-%%y, %%d-%%m-%%y and %%Y-%%m-%%d')
+    parser.add_argument('--zero-share', type=float, default=0.14, help='fraction of shipments with GrossQuantity 0')
+    parser.add_argument('--hot-bays', type=lambda s: [b.strip() for b in s.split(',') if b.strip()],
+                        default=['LANE02'], help='comma separated bay codes that get --hot-share of the traffic')
+    parser.add_argument('--hot-share', type=float, default=0.35)
+    args = parser.parse_args()
+
+    if args.rows < 1 or args.chunk_size < 1 or args.days < 1:
+        parser.error('--rows, --chunk-size and --days must be positive')
+    if not 0 <= args.zero_share <= 1 or not 0 <= args.hot_share <= 1:
+        parser.error('--zero-share and --hot-share are fractions between 0 and 1')
+    unknown = [b for b in args.hot_bays if b not in BAY_CODES]
+    if unknown:
+        parser.error(f"unknown bay codes {unknown}, expected some of {BAY_CODES}")
+
+    fmt = args.format
+    if fmt is None:
+        ext = os.path.splitext(args.output or '')[1].lstrip('.').lower()
+        fmt = ext if ext in WRITERS else 'xlsx'
+    folder = 'excel-data' if fmt in INGEST_FORMATS else 'data'
+    output = args.output or os.path.join(ROOT, folder, f"shipments_{args.rows}.{fmt}")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    if fmt not in INGEST_FORMATS:
+        print(f"NOTE: ingest only loads .xlsx/.xls files from excel-data/; {fmt} output is for other tools")
+
+    print(f"Writing {args.rows:,} shipments to {output} ({fmt}, {args.chunk_size:,} rows per chunk)")
+    start = time.time()
+    written = 0
+    for count in WRITERS[fmt](output, chunks(args)):
+        written += count
+        elapsed = time.time() - start
+        print(f"  {written:>14,} rows  {written / max(elapsed, 1e-9):>12,.0f} rows/s", end='\r', flush=True)
+    elapsed = time.time() - start
+    size_mb = os.path.getsize(output) / 1e6
+    print(f"\nSUCCESS: {written:,} rows, {size_mb:,.1f} MB in {elapsed:.1f}s")
+
+
+if __name__ == '__main__':
+    main()